@@ -1,40 +1,394 @@
-from fastapi import FastAPI, Request, Form, Query
+import asyncio
+import base64
+import binascii
+import html
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Literal, Optional, Tuple
+
+from fastapi import Body, FastAPI, HTTPException, Request, Form, Query
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from temporalio.client import Client
+from pydantic import BaseModel, Field, ValidationError
+from temporalio.client import Client, WorkflowExecution, WorkflowQueryFailedError, WorkflowUpdateFailedError
+from temporalio.service import RPCError, RPCStatusCode
 import os
-app = FastAPI()
+
+from core.embedded_engine import EmbeddedEngine, EmbeddedTaskError
+from core.starter import eagerly_started, start_dsl_workflow
+from core.workflow.approval_search_attributes import PENDING_APPROVALS, APPROVER_GROUPS, APPROVAL_DEADLINE
+
+TEMPORAL_HOST = os.getenv("TEMPORAL_HOST", "localhost:7233")
+TEMPORAL_NAMESPACE = os.getenv("TEMPORAL_NAMESPACE", "default")
+BULK_SIGNAL_CONCURRENCY = int(os.getenv("BULK_SIGNAL_CONCURRENCY", "50"))
+APPROVALS_CACHE_TTL_SEC = float(os.getenv("APPROVALS_CACHE_TTL_SEC", "5"))
+EMBEDDED_TIMEOUT_SEC = float(os.getenv("EMBEDDED_TIMEOUT_SEC", "5"))
+# Run a DSL worker inside the API process on the shared client so /workflows starts are eager
+COLOCATED_WORKER = os.getenv("APP_COLOCATED_WORKER", "false").strip().lower() in ("1", "true", "yes", "on")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open one Temporal client and one embedded engine for the app lifetime and share them across requests.
+
+    With ``APP_COLOCATED_WORKER`` a DSL worker (configured through the usual TEMPORAL_* settings)
+    also runs here on the same client, which is what eager workflow start needs. That worker
+    serves its own health/metrics server on ``TEMPORAL_HEALTH_PORT`` (default 8080) next to the API.
+    """
+    worker_config = None
+    if COLOCATED_WORKER:
+        from core.worker import WorkerConfig
+
+        worker_config = WorkerConfig()
+    app.state.temporal_client = await Client.connect(
+        TEMPORAL_HOST,
+        namespace=TEMPORAL_NAMESPACE,
+        # The worker reuses this client, so it must carry the worker's metrics runtime
+        runtime=worker_config.runtime() if worker_config else None,
+    )
+    app.state.embedded_engine = EmbeddedEngine()
+    app.state.worker = None
+    if worker_config:
+        from worker import build_worker
+
+        app.state.worker = build_worker(worker_config, client=app.state.temporal_client, handle_signals=False)
+        worker_task = asyncio.create_task(app.state.worker.start())
+        # Fail app startup, rather than serve without a worker, if the worker can't start
+        await app.state.worker.wait_until_ready(worker_task)
+    yield
+    if app.state.worker:
+        await app.state.worker.shutdown()
+        await worker_task
+    await app.state.embedded_engine.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 templates = Jinja2Templates(directory="templates")
 
 
+def get_client(request: Request) -> Client:
+    """Return the shared Temporal client created in the lifespan."""
+    return request.app.state.temporal_client
+
+
+class TTLCache:
+    """Tiny in-process cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, ttl_sec: float, max_entries: int = 256) -> None:
+        self._ttl_sec = ttl_sec
+        self._max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        if len(self._entries) >= self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self._ttl_sec, value)
+
+    def clear(self) -> None:
+        """Drop all entries, e.g. after a decision changes the pending set."""
+        self._entries.clear()
+
+
+approvals_cache = TTLCache(APPROVALS_CACHE_TTL_SEC)
+
+
+class PendingApproval(BaseModel):
+    """A running workflow with at least one APPROVAL task waiting for a decision."""
+
+    workflow_id: str
+    run_id: Optional[str] = None
+    start_time: Optional[datetime] = None
+    pending_task_refs: List[str] = Field(default_factory=list)
+    approver_groups: List[str] = Field(default_factory=list)
+    deadline: Optional[datetime] = None
+
+    @classmethod
+    def from_execution(cls, execution: WorkflowExecution) -> "PendingApproval":
+        """Build from a visibility record using the approval search attributes."""
+        attrs = execution.typed_search_attributes
+        return cls(
+            workflow_id=execution.id,
+            run_id=execution.run_id,
+            start_time=execution.start_time,
+            pending_task_refs=attrs.get(PENDING_APPROVALS) or [],
+            approver_groups=attrs.get(APPROVER_GROUPS) or [],
+            deadline=attrs.get(APPROVAL_DEADLINE),
+        )
+
+
+class ApprovalsPage(BaseModel):
+    """One page of pending approvals plus an opaque token for the next page."""
+
+    items: List[PendingApproval]
+    next_page_token: Optional[str] = None
+
+
+async def fetch_approvals(
+        client: Client, approver_group: Optional[str], page_size: int, page_token: Optional[str]
+) -> ApprovalsPage:
+    """
+    Run an indexed visibility query for pending approvals, served from a short-TTL cache.
+
+    Args:
+        approver_group (str): Only return approvals for this group, if given.
+        page_size (int): Maximum number of workflows to return.
+        page_token (str): Token from a previous page, if any.
+
+    :return: The requested page of pending approvals.
+    """
+    try:
+        next_page_token = base64.urlsafe_b64decode(page_token) if page_token else None
+    except (binascii.Error, ValueError):
+        # Checked before the cache so malformed tokens never become cache keys
+        raise HTTPException(status_code=400, detail="invalid page_token")
+    cache_key = (approver_group, page_size, page_token)
+    cached = approvals_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    query = (
+        "WorkflowType = 'DSLWorkflow' AND ExecutionStatus = 'Running'"
+        f" AND {PENDING_APPROVALS.name} IS NOT NULL"
+    )
+    if approver_group:
+        query += f" AND {APPROVER_GROUPS.name} = '{approver_group}'"
+
+    executions = client.list_workflows(
+        query,
+        page_size=page_size,
+        next_page_token=next_page_token,
+    )
+    await executions.fetch_next_page()
+    next_token = executions.next_page_token
+    page = ApprovalsPage(
+        items=[PendingApproval.from_execution(e) for e in executions.current_page or []],
+        next_page_token=base64.urlsafe_b64encode(next_token).decode() if next_token else None,
+    )
+    approvals_cache.set(cache_key, page)
+    return page
+
+
+class BulkDecisionRequest(BaseModel):
+    """Body for signalling the same decision to many workflows."""
+
+    workflow_ids: List[str] = Field(..., min_length=1, description="Workflow IDs to signal.")
+    decision: Literal["APPROVED", "REJECTED"] = Field(..., description="Decision to send.")
+    task_ref_name: Optional[str] = Field(
+        None, description="Approval task to decide; defaults to each workflow's oldest pending one."
+    )
+
+
+class BulkDecisionResult(BaseModel):
+    """Outcome of signalling a single workflow in a bulk request."""
+
+    workflow_id: str
+    status: Literal["SIGNALED", "FAILED"]
+    error: Optional[str] = None
+
+
 @app.get("/",response_class=HTMLResponse)
-async def root(request: Request):
+async def root(request: Request, approver_group: Optional[str] = Query(None, pattern=r"^[\w.@ -]+$")):
 
     """
-    Render HTML form with workflowId and radio buttons for decision.
+    Render HTML form with workflowId and radio buttons for decision,
+    pre-populated with the first page of pending approvals.
     """
+    error = None
+    try:
+        page = await fetch_approvals(get_client(request), approver_group, 50, None)
+    except RPCError as e:
+        page, error = ApprovalsPage(items=[]), e.message
     return templates.TemplateResponse(
         "decision.html",
-        {"request": request}
+        {"request": request, "approvals": page.items, "approver_group": approver_group, "error": error}
     )
 
-TEMPORAL_HOST = os.getenv("TEMPORAL_HOST", "localhost:7233")
+
+@app.get("/approvals", response_model=ApprovalsPage)
+async def approvals_endpoint(
+        request: Request,
+        approver_group: Optional[str] = Query(None, pattern=r"^[\w.@ -]+$"),
+        page_size: int = Query(50, ge=1, le=1000),
+        page_token: Optional[str] = Query(None),
+):
+    """
+    List pending approvals using the search attributes upserted by APPROVAL tasks.
+
+    Args:
+        approver_group (str): Optional approver group filter.
+        page_size (int): Page size, 1-1000.
+        page_token (str): ``next_page_token`` from the previous response.
+
+    :return: A page of pending approvals.
+    """
+    return await fetch_approvals(get_client(request), approver_group, page_size, page_token)
+
+
+@app.get("/status/{workflow_id}")
+async def status_endpoint(request: Request, workflow_id: str):
+    """
+    Return a workflow's progress via its ``progress`` query, without fetching history.
+
+    Args:
+        workflow_id (str): The workflow ID to inspect.
+
+    :return: Current task, completed tasks with timing, capped outputs and pending approvals.
+    """
+    handle = get_client(request).get_workflow_handle(workflow_id)
+    try:
+        return await handle.query("progress")
+    except WorkflowQueryFailedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except RPCError as e:
+        if e.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPException(status_code=404, detail=e.message)
+        raise
+
 
 @app.post("/decision", response_class=HTMLResponse)
 async def decision_endpoint(
-        workflow_id: str = Form(...), decision: str = Form(...)
+        request: Request,
+        workflow_id: str = Form(...),
+        decision: str = Form(...),
+        task_ref_name: Optional[str] = Form(None),
 ):
     """
-    Signal a workflow with approval or rejection.
+    Apply an approval or rejection to a workflow and wait for confirmation.
+
+    Uses the workflow's ``human_in_loop_update`` so the decision is validated and
+    acknowledged in a single round trip.
 
     Args:
-        workflowId (str): The workflow ID to signal.
+        workflowId (str): The workflow ID to update.
         decision (str): Decision value must be either 'APPROVED' or 'REJECTED'.
+        task_ref_name (str): Optional approval task to decide; defaults to the oldest pending one.
+
+    :return: HTML confirmation naming the approval task that received the decision.
+    """
+    handle = get_client(request).get_workflow_handle(workflow_id)
+    # Form values (and errors quoting them) are reflected back, so escape everything
+    shown_id = html.escape(workflow_id)
+    try:
+        result = await handle.execute_update(
+            "human_in_loop_update", args=[decision, task_ref_name or None]
+        )
+    except WorkflowUpdateFailedError as e:
+        reason = e.cause.message if e.cause else str(e)
+        return HTMLResponse(f"<h3>❌ Workflow {shown_id}: {html.escape(reason)}</h3>", status_code=409)
+    except RPCError as e:
+        # Missing or already closed workflows
+        if e.status == RPCStatusCode.NOT_FOUND:
+            return HTMLResponse(f"<h3>❌ Workflow {shown_id}: {html.escape(e.message)}</h3>", status_code=404)
+        if e.status == RPCStatusCode.FAILED_PRECONDITION:
+            return HTMLResponse(f"<h3>❌ Workflow {shown_id}: {html.escape(e.message)}</h3>", status_code=409)
+        raise
+    approvals_cache.clear()
+
+    return (
+        f"<h3>✅ Workflow {shown_id} task {html.escape(str(result['task_ref_name']))}"
+        f" has been {html.escape(str(result['decision']))}</h3>"
+    )
+
+
+@app.post("/decisions/bulk", response_model=List[BulkDecisionResult])
+async def bulk_decision_endpoint(request: Request, body: BulkDecisionRequest):
+    """
+    Signal many workflows with the same decision concurrently.
 
-    :return: JSON response with status and decision.
+    At most ``BULK_SIGNAL_CONCURRENCY`` signals are in flight at once. A failure
+    for one workflow never aborts the others; each ID gets its own result.
+
+    Args:
+        body (BulkDecisionRequest): Workflow IDs and the decision to send.
+
+    :return: One result per workflow ID, in request order.
+    """
+    client = get_client(request)
+    semaphore = asyncio.Semaphore(BULK_SIGNAL_CONCURRENCY)
+
+    async def _signal(workflow_id: str) -> BulkDecisionResult:
+        async with semaphore:
+            try:
+                handle = client.get_workflow_handle(workflow_id)
+                await handle.signal("human_in_loop_signal", args=[body.decision, body.task_ref_name])
+                return BulkDecisionResult(workflow_id=workflow_id, status="SIGNALED")
+            except Exception as e:
+                return BulkDecisionResult(workflow_id=workflow_id, status="FAILED", error=str(e))
+
+    results = await asyncio.gather(*(_signal(wf_id) for wf_id in body.workflow_ids))
+    approvals_cache.clear()
+    return results
+
+
+@app.post("/dsl/evaluate")
+async def evaluate_endpoint(
+        request: Request,
+        dsl: Dict[str, Any] = Body(...),
+        timeout_sec: float = Query(EMBEDDED_TIMEOUT_SEC, gt=0),
+):
+    """
+    Run a short DSL synchronously in this process, without Temporal (see core.embedded_engine).
+
+    Meant for request/response pipelines; there are no retries or history, and APPROVAL
+    tasks are rejected.
+
+    Args:
+        dsl (dict): The DSL, including ``inputValues``.
+        timeout_sec (float): Upper bound for the whole run.
+
+    :return: Status, per-task timings and the full output of every executed task.
+    """
+    try:
+        return await request.app.state.embedded_engine.run(dsl, timeout_sec=timeout_sec)
+    except (ValidationError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except EmbeddedTaskError as e:
+        raise HTTPException(status_code=422, detail={"task_ref_name": e.task_ref_name, "error": str(e)})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"DSL did not finish within {timeout_sec}s")
+
+
+class StartWorkflowRequest(BaseModel):
+    """A DSL to run on Temporal."""
+
+    dsl: Dict[str, Any]
+    workflow_id: Optional[str] = None
+    task_queue: Optional[str] = None
+    eager: Optional[bool] = Field(None, description="Defaults to true when a worker runs in this process")
+    priority: Optional[Literal["high", "normal", "low"]] = Field(None, description="Overrides the DSL's priority lane")
+
+
+@app.post("/workflows")
+async def start_workflow_endpoint(request: Request, body: StartWorkflowRequest):
     """
-    client = await Client.connect(TEMPORAL_HOST)
-    handle = client.get_workflow_handle(workflow_id)
-    await handle.signal("human_in_loop_signal", decision)
+    Start a DSLWorkflow run.
+
+    With a co-located worker (``APP_COLOCATED_WORKER``) the start is eager: the server returns
+    the first workflow task in the start response and this process runs it immediately.
 
-    return f"<h3>✅ Workflow {workflow_id} has been {decision}</h3>"
+    Args:
+        body (StartWorkflowRequest): The DSL plus optional ID, task queue, eager flag and priority lane.
+
+    :return: Workflow and run IDs, and whether the start was actually eager.
+    """
+    eager = body.eager if body.eager is not None else request.app.state.worker is not None
+    try:
+        handle = await start_dsl_workflow(
+            get_client(request), body.dsl, body.workflow_id, body.task_queue, eager=eager, priority=body.priority
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"workflow_id": handle.id, "run_id": handle.result_run_id, "eagerly_started": eagerly_started(handle)}
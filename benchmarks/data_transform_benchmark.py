@@ -0,0 +1,148 @@
+"""
+Benchmark the columnar DATA_TRANSFORM pipeline against a row-by-row equivalent.
+
+The row-by-row baseline mirrors what DSLs did before DATA_TRANSFORM existed:
+evaluate the DECISION predicate per record, then build projections and
+aggregates in plain Python dicts. Both paths must produce the same records.
+
+Usage:
+    python benchmarks/data_transform_benchmark.py [--sizes 10000 100000 1000000] [--repeat 3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.dsl.tasks.data_transform.data_transform_task import DataTransformTaskInput, run_pipeline  # noqa: E402
+from core.dsl.tasks.decision.expression import compile_expression  # noqa: E402
+
+PIPELINE = [
+    {"op": "filter", "field": "qty", "condition": "> 2 AND <= 40"},
+    {"op": "filter", "field": "status", "condition": "NOT 'CANCELLED'"},
+    {"op": "group_by", "keys": ["sku"], "aggregations": {
+        "total_qty": {"func": "sum", "field": "qty"},
+        "lines": {"func": "count"},
+        "min_price": {"func": "min", "field": "price"},
+        "max_price": {"func": "max", "field": "price"},
+    }},
+    {"op": "sort", "by": ["total_qty"], "descending": True},
+]
+
+
+def make_records(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    statuses = ["NEW", "PAID", "SHIPPED", "CANCELLED"]
+    return [
+        {
+            "order_id": i,
+            "sku": f"SKU-{rng.randint(0, 499):03d}",
+            "qty": rng.randint(1, 50),
+            "price": round(rng.uniform(1, 500), 2),
+            "status": rng.choice(statuses),
+        }
+        for i in range(n)
+    ]
+
+
+def row_by_row(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Plain-Python equivalent of PIPELINE, one record at a time."""
+    qty_ok = compile_expression("> 2 AND <= 40")
+    status_ok = compile_expression("NOT 'CANCELLED'")
+    groups: Dict[Any, Dict[str, Any]] = {}
+    for record in records:
+        if not (qty_ok(record["qty"]) and status_ok(record["status"])):
+            continue
+        group = groups.get(record["sku"])
+        if group is None:
+            group = groups[record["sku"]] = {
+                "sku": record["sku"], "total_qty": 0, "lines": 0,
+                "min_price": record["price"], "max_price": record["price"],
+            }
+        group["total_qty"] += record["qty"]
+        group["lines"] += 1
+        group["min_price"] = min(group["min_price"], record["price"])
+        group["max_price"] = max(group["max_price"], record["price"])
+    return sorted(groups.values(), key=lambda g: g["total_qty"], reverse=True)
+
+
+EDGE_PIPELINE = [
+    {"op": "group_by", "keys": ["k"], "aggregations": {
+        "total": {"func": "sum", "field": "v"},
+        "low": {"func": "min", "field": "v"},
+        "high": {"func": "max", "field": "v"},
+    }},
+]
+
+# Integers past 2**53, nulls in int columns and all-null groups must match row_by_row_edge
+EDGE_RECORDS = [
+    [{"k": "a", "v": 2**53 + 1}],
+    [{"k": "a", "v": 2**53 + 1}, {"k": "a", "v": None}, {"k": "b", "v": 3}],
+    [{"k": "a", "v": 2**62}, {"k": "a", "v": 2**62}, {"k": "b", "v": -5}],
+    [{"k": "a", "v": None}, {"k": "b", "v": 2}, {"k": "b", "v": None}],
+    [{"k": "a", "v": 1.5}, {"k": "b", "v": None}],
+]
+
+
+def row_by_row_edge(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Plain-Python equivalent of EDGE_PIPELINE; sums, mins and maxes skip nulls."""
+    groups: Dict[Any, List[Any]] = {}
+    for record in records:
+        groups.setdefault(record["k"], []).append(record["v"])
+    out = []
+    for key, values in groups.items():
+        present = [v for v in values if v is not None]
+        out.append({
+            "k": key,
+            "total": sum(present) if present else None,
+            "low": min(present, default=None),
+            "high": max(present, default=None),
+        })
+    return out
+
+
+def check_edge_cases() -> None:
+    pipeline = DataTransformTaskInput(task_ref_name="edge", records=[], pipeline=EDGE_PIPELINE).pipeline
+    for records in EDGE_RECORDS:
+        expected = row_by_row_edge(records)
+        actual = run_pipeline(records, pipeline)
+        if actual != expected or [list(map(type, r.values())) for r in actual] != [
+            list(map(type, r.values())) for r in expected
+        ]:
+            raise SystemExit(f"Result mismatch for {records}: {actual} != {expected}")
+
+
+def _best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    check_edge_cases()
+    pipeline = DataTransformTaskInput(task_ref_name="bench", records=[], pipeline=PIPELINE).pipeline
+    print(f"{'records':>10} {'row-by-row (s)':>15} {'columnar (s)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        records = make_records(size)
+        expected = row_by_row(records)
+        actual = run_pipeline(records, pipeline)
+        if [r["sku"] for r in actual] != [r["sku"] for r in expected] or actual != expected:
+            raise SystemExit(f"Result mismatch at {size} records")
+        row_time = _best_of(lambda: row_by_row(records), args.repeat)
+        col_time = _best_of(lambda: run_pipeline(records, pipeline), args.repeat)
+        print(f"{size:>10} {row_time:>15.4f} {col_time:>13.4f} {row_time / col_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
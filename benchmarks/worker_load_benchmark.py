@@ -0,0 +1,185 @@
+"""
+Load benchmark for the DSL worker.
+
+Starts an in-process worker with a given WorkerConfig on a throwaway task queue,
+runs a batch of synthetic DSL workflows (a chain of SET_VARIABLE tasks and a
+DECISION) against a running Temporal server and reports throughput, latency
+percentiles and the CPU time the worker process used.
+
+The starter shares the event loop with the worker, so absolute numbers are a
+lower bound; use it to compare settings, not to size production. Because starter
+and worker share a client, ``--eager-start`` gets real eager workflow starts;
+``--compare-eager`` runs once with eager start + eager activities off and once on.
+
+Usage:
+    python benchmarks/worker_load_benchmark.py [--workflows 500] [--chain 5] [--config worker.yaml]
+    python benchmarks/worker_load_benchmark.py --compare-eager --start-concurrency 1 --workflows 200
+"""
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temporalio.client import Client  # noqa: E402
+from temporalio.worker import Worker  # noqa: E402
+
+from core.dsl import task_registry  # noqa: E402
+from core.starter import eagerly_started  # noqa: E402
+from core.worker import WorkerConfig  # noqa: E402
+from core.workflow.make_activity import make_activity  # noqa: E402
+from workflow import DSLWorkflow  # noqa: E402
+
+
+def make_dsl(chain: int) -> Dict[str, Any]:
+    """A DSL with ``chain`` SET_VARIABLE tasks followed by a DECISION and a final task."""
+    tasks: List[Dict[str, Any]] = [
+        {
+            "taskReferenceName": f"step{i}",
+            "type": "SET_VARIABLE",
+            "input": {"variables": {"step": i, "at": "$NOW"}},
+        }
+        for i in range(chain)
+    ]
+    tasks.append({
+        "taskReferenceName": "route",
+        "type": "DECISION",
+        "input": {
+            "param_value": "${inputParameters.amount}",
+            "decision_cases": {"<200": ["finish"], ">=200": ["finish"]},
+        },
+    })
+    tasks.append({
+        "taskReferenceName": "finish",
+        "type": "SET_VARIABLE",
+        "input": {"variables": {"done": True}},
+    })
+    return {
+        "name": "worker_load_benchmark",
+        "inputParameters": ["amount"],
+        "inputValues": {"amount": 100},
+        "tasks": tasks,
+    }
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run_load(
+    config: WorkerConfig,
+    workflows: int = 500,
+    chain: int = 5,
+    start_concurrency: int = 50,
+    client: Optional[Client] = None,
+    eager_start: bool = False,
+) -> Dict[str, Any]:
+    """Runs one load round with ``config`` and returns its measurements.
+
+    Eager activities follow ``config.eager_activities``; ``eager_start`` requests eager
+    workflow starts, which the in-process worker can take since it shares ``client``.
+    """
+    client = client or await Client.connect(config.server_url, namespace=config.namespace)
+    task_queue = f"bench-{uuid.uuid4().hex[:8]}"
+    handlers = [cls() for cls in task_registry.task_registry.values()]
+    activities = [
+        make_activity(task_type, handler)
+        for task_type, handler in zip(task_registry.task_registry, handlers)
+    ]
+    await asyncio.gather(*(handler.startup() for handler in handlers))
+
+    dsl = make_dsl(chain)
+    semaphore = asyncio.Semaphore(start_concurrency)
+    latencies: List[float] = []
+    eager_starts = 0
+
+    async def one(i: int) -> None:
+        nonlocal eager_starts
+        async with semaphore:
+            started = time.perf_counter()
+            handle = await client.start_workflow(
+                DSLWorkflow.run, dsl, id=f"{task_queue}-{i}", task_queue=task_queue,
+                request_eager_start=eager_start,
+            )
+            eager_starts += eagerly_started(handle)
+        await handle.result()
+        latencies.append(time.perf_counter() - started)
+
+    executor = ThreadPoolExecutor(max_workers=config.activity_threads)
+    try:
+        async with Worker(
+            client,
+            task_queue=task_queue,
+            workflows=[DSLWorkflow],
+            activities=activities,
+            activity_executor=executor,
+            **config.worker_options(),
+        ):
+            cpu_start, wall_start = _cpu_seconds(), time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(workflows)))
+            wall = time.perf_counter() - wall_start
+            cpu = _cpu_seconds() - cpu_start
+    finally:
+        executor.shutdown(wait=False)
+        await asyncio.gather(*(handler.shutdown() for handler in handlers), return_exceptions=True)
+
+    latencies.sort()
+    return {
+        "workflows": workflows,
+        "wall_sec": round(wall, 3),
+        "workflows_per_sec": round(workflows / wall, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1),
+        "cpu_utilization": round(cpu / wall, 2),
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "eager_activities": config.eager_activities,
+        "eager_starts": eager_starts,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workflows", type=int, default=500)
+    parser.add_argument("--chain", type=int, default=5, help="SET_VARIABLE tasks per workflow")
+    parser.add_argument("--start-concurrency", type=int, default=50)
+    parser.add_argument("--config", help="worker YAML (defaults to TEMPORAL_WORKER_CONFIG / env)")
+    parser.add_argument("--eager-start", action="store_true", help="request eager workflow start")
+    parser.add_argument(
+        "--compare-eager", action="store_true", help="run with eager start/activities off, then on, side by side"
+    )
+    args = parser.parse_args()
+
+    if not args.compare_eager:
+        config = WorkerConfig(path=args.config)
+        result = asyncio.run(
+            run_load(config, args.workflows, args.chain, args.start_concurrency, eager_start=args.eager_start)
+        )
+        for key, value in result.items():
+            print(f"{key:>18}: {value}")
+        return
+
+    async def compare() -> List[Dict[str, Any]]:
+        results = []
+        for eager in (False, True):
+            config = WorkerConfig(path=args.config, overrides={"eager_activities": eager})
+            results.append(
+                await run_load(config, args.workflows, args.chain, args.start_concurrency, eager_start=eager)
+            )
+        return results
+
+    off, on = asyncio.run(compare())
+    print(f"{'':>18}  {'eager off':>10}  {'eager on':>10}")
+    for key in off:
+        print(f"{key:>18}  {off[key]!s:>10}  {on[key]!s:>10}")
+
+
+if __name__ == "__main__":
+    main()
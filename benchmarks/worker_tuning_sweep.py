@@ -0,0 +1,114 @@
+"""
+Sweep worker settings with the load benchmark and recommend a configuration.
+
+Every combination of the given values is run through
+``worker_load_benchmark.run_load`` against the same Temporal server. The
+recommendation is the fastest setting; settings within ``--tolerance`` of the
+best throughput are tie-broken by p95 latency, then by fewer slots.
+
+Usage:
+    python benchmarks/worker_tuning_sweep.py \\
+        --max-activities 50 100 200 --max-workflow-tasks 50 200 \\
+        --pollers 5 10 --tuner fixed resource_based --output worker.yaml
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+from typing import Any, Dict, List
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from temporalio.client import Client  # noqa: E402
+
+from benchmarks.worker_load_benchmark import run_load  # noqa: E402
+from core.worker import WorkerConfig  # noqa: E402
+
+
+def build_grid(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Expands the CLI value lists into override dicts; tuner runs ignore fixed slot counts."""
+    grid: List[Dict[str, Any]] = []
+    for tuner in args.tuner:
+        if tuner == "resource_based":
+            for pollers in args.pollers:
+                grid.append({
+                    "tuner_mode": tuner,
+                    "target_cpu": args.target_cpu,
+                    "target_memory": args.target_memory,
+                    "max_concurrent_workflow_task_polls": pollers,
+                    "max_concurrent_activity_task_polls": pollers,
+                })
+            continue
+        for activities, workflow_tasks, pollers in itertools.product(
+            args.max_activities, args.max_workflow_tasks, args.pollers
+        ):
+            grid.append({
+                "tuner_mode": tuner,
+                "max_concurrent_activities": activities,
+                "max_concurrent_workflow_tasks": workflow_tasks,
+                "max_concurrent_workflow_task_polls": pollers,
+                "max_concurrent_activity_task_polls": pollers,
+            })
+    return grid
+
+
+def recommend(results: List[Dict[str, Any]], tolerance: float) -> Dict[str, Any]:
+    """Picks the best run: within ``tolerance`` of top throughput, lowest p95, fewest slots."""
+    best = max(r["workflows_per_sec"] for r in results)
+    contenders = [r for r in results if r["workflows_per_sec"] >= best * (1 - tolerance)]
+    return min(
+        contenders,
+        key=lambda r: (
+            r["p95_ms"],
+            r["settings"].get("max_concurrent_activities", 0)
+            + (r["settings"].get("max_concurrent_workflow_tasks") or 0),
+        ),
+    )
+
+
+async def sweep(args: argparse.Namespace) -> None:
+    base = WorkerConfig(path=args.config)
+    client = await Client.connect(base.server_url, namespace=base.namespace)
+    results: List[Dict[str, Any]] = []
+    for settings in build_grid(args):
+        config = WorkerConfig(path=args.config, overrides=settings)
+        result = await run_load(config, args.workflows, args.chain, args.start_concurrency, client=client)
+        result["settings"] = settings
+        results.append(result)
+        print(
+            f"{result['workflows_per_sec']:>8.1f} wf/s  p95 {result['p95_ms']:>8.1f} ms  "
+            f"cpu {result['cpu_utilization']:>5.2f}  {settings}"
+        )
+
+    chosen = recommend(results, args.tolerance)
+    print(f"\nRecommended ({chosen['workflows_per_sec']} wf/s, p95 {chosen['p95_ms']} ms):")
+    recommendation = {"worker": chosen["settings"]}
+    print(yaml.safe_dump(recommendation, sort_keys=False))
+    if args.output:
+        with open(args.output, "w") as f:
+            yaml.safe_dump(recommendation, f, sort_keys=False)
+        print(f"Written to {args.output}; use it with TEMPORAL_WORKER_CONFIG={args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-activities", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--max-workflow-tasks", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--pollers", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--tuner", nargs="+", choices=WorkerConfig.TUNER_MODES, default=["fixed"])
+    parser.add_argument("--target-cpu", type=float, default=0.8)
+    parser.add_argument("--target-memory", type=float, default=0.8)
+    parser.add_argument("--workflows", type=int, default=300)
+    parser.add_argument("--chain", type=int, default=5)
+    parser.add_argument("--start-concurrency", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=0.05, help="throughput band treated as a tie")
+    parser.add_argument("--config", help="base worker YAML the sweep overrides")
+    parser.add_argument("--output", help="write the recommended settings as worker YAML")
+    asyncio.run(sweep(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,41 @@
+import argparse
 import asyncio
-import random
 import json
-import sys
+import os
+
 from temporalio.client import Client
 
+from core.starter import DEFAULT_TASK_QUEUE, start_dsl_workflow
+from core.workflow.priority_lanes import LANES
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Start a DSLWorkflow from a DSL JSON file.")
+    parser.add_argument("dsl_file")
+    parser.add_argument("overrides", nargs="*", metavar="key=value", help="overrides for inputValues")
+    parser.add_argument("--id", help="workflow ID (default: random)")
+    parser.add_argument("--task-queue", default=DEFAULT_TASK_QUEUE)
+    parser.add_argument("--priority", choices=LANES, help="priority lane; overrides the DSL's priority")
+    parser.add_argument(
+        "--eager",
+        action="store_true",
+        help="request eager start; only takes effect with a worker in this process (see --colocated-worker)",
+    )
+    parser.add_argument(
+        "--colocated-worker",
+        action="store_true",
+        help="run a worker in this process on the same client, start eagerly and wait for the result",
+    )
+    return parser.parse_args()
 
-async def main():
-    """
-    Load DSL from a JSON file provided as a command-line argument,
-    override inputValues with CLI arguments, and start the Temporal workflow.
-    """
-    if len(sys.argv) < 2:
-        print("Usage: python run_dsl.py <dsl_file.json> key1=value1 key2=value2 ...")
-        sys.exit(1)
 
-    dsl_file = sys.argv[1]
+def parse_overrides(pairs):
     overrides = {}
 
     # Parse key=value pairs from command-line args
-    for arg in sys.argv[2:]:
+    for arg in pairs:
         if "=" not in arg:
-            print(f"Invalid argument format: {arg}. Expected key=value.")
-            sys.exit(1)
+            raise SystemExit(f"Invalid argument format: {arg}. Expected key=value.")
         key, value = arg.split("=", 1)
         # Try to parse numbers properly
         if value.isdigit():
@@ -32,28 +46,58 @@ async def main():
             except ValueError:
                 pass
         overrides[key] = value
+    return overrides
+
+
+async def main():
+    """
+    Load DSL from a JSON file provided as a command-line argument,
+    override inputValues with CLI arguments, and start the Temporal workflow.
+    """
+    args = parse_args()
 
     # Load DSL definition from the provided JSON file
-    with open(dsl_file, "r") as f:
+    with open(args.dsl_file, "r") as f:
         dsl = json.load(f)
 
     # Override inputValues
     if "inputValues" not in dsl:
         dsl["inputValues"] = {}
-    dsl["inputValues"].update(overrides)
+    dsl["inputValues"].update(parse_overrides(args.overrides))
+
+    # Eager start needs the worker on this very Client; the worker is built for this task queue
+    worker_config = None
+    if args.colocated_worker:
+        from core.worker import WorkerConfig
 
-    # Connect to Temporal
-    client = await Client.connect("localhost:7233")
+        worker_config = WorkerConfig(overrides={"task_queue": args.task_queue})
 
-    # Start a workflow with DSL
-    result = await client.start_workflow(
-        "DSLWorkflow",
-        dsl,
-        id=f"workflow-{random.randint(1000, 9999)}",
-        task_queue="dsl-task-queue",
+    # Connect to Temporal (on the worker's metrics runtime when it shares this client)
+    client = await Client.connect(
+        os.getenv("TEMPORAL_HOST", "localhost:7233"),
+        runtime=worker_config.runtime() if worker_config else None,
     )
 
-    print(f"Result: {result}")
+    if not worker_config:
+        handle = await start_dsl_workflow(
+            client, dsl, args.id, args.task_queue, eager=args.eager, priority=args.priority
+        )
+        print(f"Started: {handle.id}")
+        return
+
+    from worker import build_worker
+
+    worker = build_worker(worker_config, client=client, handle_signals=False)
+    running = asyncio.create_task(worker.start())
+    try:
+        await worker.wait_until_ready(running)
+        handle = await start_dsl_workflow(
+            client, dsl, args.id, args.task_queue, eager=True, priority=args.priority
+        )
+        print(f"Result: {await handle.result()}")
+    finally:
+        await worker.shutdown()
+        await running
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +15,9 @@ class DSLModel(BaseModel):
         tasks: List of tasks in the workflow.
         inputParameters: List of input parameter names.
         outputParameters: Output parameters mapping.
+        taskQueues: Task queue per task type for this workflow's activities.
+        priority: Priority lane (high, normal, low); a priority given at start time wins.
+        indexApprovals: Upsert the approval search attributes while APPROVAL tasks wait.
     """
     name: str = Field(..., description="Name of the workflow.")
     description: Optional[str] = Field(
@@ -35,5 +38,12 @@ class DSLModel(BaseModel):
     inputValues: Optional[Dict[str, Any]] = Field(
         None, description="Input values for the workflow execution."
     )
-
-
+    taskQueues: Optional[Dict[str, str]] = Field(
+        None, description="Task queue per task type (e.g. {'HTTP': 'dsl-http'}), overriding the worker mapping."
+    )
+    priority: Optional[Literal["high", "normal", "low"]] = Field(
+        None, description="Priority lane: routes to the lane's task queue and sets Temporal task priority."
+    )
+    indexApprovals: bool = Field(
+        True, description="Publish pending approvals as search attributes (they must be registered on the namespace)."
+    )
@@ -14,6 +14,10 @@ class TaskModel(BaseModel):
         description: Description of the task.
         optional: Whether the task is optional.
         startDelay: Delay before starting the task, in seconds.
+        taskQueue: Task queue to run this task's activity on.
+        timeoutSec: Limit for one attempt of the task's activity, in seconds.
+        heartbeatTimeoutSec: Fail an attempt whose worker stops heartbeating for this long;
+            the activity then heartbeats automatically every third of it.
     """
     taskReferenceName: str = Field(..., description="Unique reference name for the task.")
     type: str = Field(..., description="Type of the task (e.g., SIMPLE, SUB_WORKFLOW).")
@@ -32,3 +36,12 @@ class TaskModel(BaseModel):
     next_task_ref_name: Optional[str] = Field(
         None, description="Next Task to execute."
     )
+    taskQueue: Optional[str] = Field(
+        None, description="Task queue for this task's activity; overrides type-level routing."
+    )
+    timeoutSec: Optional[float] = Field(
+        None, gt=0, description="Start-to-close timeout of one activity attempt; defaults to the worker's 30s."
+    )
+    heartbeatTimeoutSec: Optional[float] = Field(
+        None, gt=0, description="Heartbeat timeout; enables automatic heartbeats every third of it."
+    )
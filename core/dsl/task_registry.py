@@ -1,9 +1,112 @@
-from .tasks import (HttpTaskHandler, SetVariableTaskHandler, DecisionTaskHandler,
-                        SendEmailTaskHandler,ApprovalTaskHandler)
-task_registry = {
-    "http": HttpTaskHandler,
-    "set_variable": SetVariableTaskHandler,
-    "decision": DecisionTaskHandler,
-    "send_mail": SendEmailTaskHandler,
-    "approval": ApprovalTaskHandler,
-}
\ No newline at end of file
+"""
+task_registry.py
+
+Task type -> handler class, resolved lazily:
+- Built-in handlers are registered by import path ("module:Class") and imported on first
+  lookup, so a worker only pays for the handlers (and their dependencies, e.g. sendgrid,
+  requests, numpy) of the task types it serves
+- Plugins register through the ``dsl_workflow.task_handlers`` entry-point group, which
+  overrides built-ins, and ``TEMPORAL_TASK_HANDLERS`` ("type=module:Class,type=module:Class"),
+  which overrides both
+- ``register()`` accepts an import path or a handler class and always wins
+
+``task_registry`` keeps the dict interface (``task_registry["http"]``, ``in``, ``keys()``);
+iterating over ``items()`` / ``values()`` imports every handler.
+"""
+
+import importlib
+import logging
+import os
+import time
+from collections.abc import Mapping
+from importlib.metadata import entry_points
+from typing import Dict, Iterator, Optional, Type, Union
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "dsl_workflow.task_handlers"
+
+BUILTIN_HANDLERS: Dict[str, str] = {
+    "http": "core.dsl.tasks.http.http_task_handler:HttpTaskHandler",
+    "set_variable": "core.dsl.tasks.set_variable.set_variable_task:SetVariableTaskHandler",
+    "decision": "core.dsl.tasks.decision.decision_task_handler:DecisionTaskHandler",
+    "send_mail": "core.dsl.tasks.send_mail.send_mail_task:SendEmailTaskHandler",
+    "approval": "core.dsl.tasks.approval.approval_task:ApprovalTaskHandler",
+    "data_transform": "core.dsl.tasks.data_transform.data_transform_task:DataTransformTaskHandler",
+}
+
+
+def _import_path(path: str) -> type:
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Handler path {path!r} must look like 'package.module:ClassName'")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _env_handlers(value: Optional[str]) -> Dict[str, str]:
+    handlers = {}
+    for item in (value or "").split(","):
+        if item.strip():
+            task_type, sep, path = item.partition("=")
+            if not sep:
+                raise ValueError(f"TEMPORAL_TASK_HANDLERS entry {item!r} must look like 'type=module:Class'")
+            handlers[task_type.strip()] = path.strip()
+    return handlers
+
+
+class TaskRegistry(Mapping):
+    """Read-mostly mapping of task type to handler class that imports handlers on first use."""
+
+    def __init__(self, paths: Optional[Dict[str, str]] = None, overrides: Optional[Dict[str, str]] = None) -> None:
+        self._targets: Dict[str, Union[str, type]] = {**(paths or {}), **(overrides or {})}
+        self._overrides: Dict[str, Union[str, type]] = dict(overrides or {})
+        self._loaded: Dict[str, type] = {}
+        self._entry_points = None
+        self.load_seconds: Dict[str, float] = {}
+
+    def register(self, task_type: str, target: Union[str, Type]) -> None:
+        """Registers (or replaces) a handler by import path or class."""
+        self._targets[task_type] = self._overrides[task_type] = target
+        self._loaded.pop(task_type, None)
+
+    def _discover(self) -> None:
+        """Adds entry-point plugins once; only their metadata is read, not their modules."""
+        if self._entry_points is not None:
+            return
+        self._entry_points = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+        for name, ep in self._entry_points.items():
+            if name not in self._overrides:
+                self._targets[name] = ep.value
+                self._loaded.pop(name, None)
+
+    def __getitem__(self, task_type: str) -> type:
+        handler = self._loaded.get(task_type)
+        if handler is not None:
+            return handler
+        self._discover()
+        target = self._targets[task_type]
+        started = time.perf_counter()
+        handler = _import_path(target) if isinstance(target, str) else target
+        self.load_seconds[task_type] = time.perf_counter() - started
+        logger.debug("Loaded %s handler %s in %.1f ms", task_type, target, self.load_seconds[task_type] * 1000)
+        self._loaded[task_type] = handler
+        return handler
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._targets)
+
+    def __contains__(self, task_type: object) -> bool:
+        self._discover()
+        return task_type in self._targets
+
+    def loaded(self) -> Dict[str, type]:
+        """Handlers imported so far."""
+        return dict(self._loaded)
+
+
+task_registry = TaskRegistry(BUILTIN_HANDLERS, _env_handlers(os.getenv("TEMPORAL_TASK_HANDLERS")))
@@ -1,6 +1,20 @@
-from .base_task_handler import BaseTaskHandler
-from .http import HttpTaskHandler
-from .set_variable import SetVariableTaskHandler
-from .decision import DecisionTaskHandler
-from .send_mail import SendEmailTaskHandler
-from .approval import ApprovalTaskHandler
\ No newline at end of file
+from .base_task_handler import BaseTaskHandler, SyncTaskHandler
+
+# Handler classes are imported on first attribute access so that importing
+# ``base_task_handler`` (e.g. from make_activity) doesn't pull in every handler's dependencies.
+_HANDLERS = {
+    "HttpTaskHandler": ".http",
+    "SetVariableTaskHandler": ".set_variable",
+    "DecisionTaskHandler": ".decision",
+    "SendEmailTaskHandler": ".send_mail",
+    "ApprovalTaskHandler": ".approval",
+    "DataTransformTaskHandler": ".data_transform",
+}
+
+
+def __getattr__(name):
+    if name in _HANDLERS:
+        import importlib
+
+        return getattr(importlib.import_module(_HANDLERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
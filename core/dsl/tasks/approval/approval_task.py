@@ -12,6 +12,9 @@ class ApprovalTaskInput(TaskInput):
     timeout: Optional[int] = Field(
         default=3600, description="How long to wait (in seconds) before timing out."
     )
+    approver_group: Optional[str] = Field(
+        default=None, description="Group allowed to decide; indexed for the approvals inbox."
+    )
 
 
 class ApprovalTaskHandler(BaseTaskHandler):
@@ -28,5 +31,6 @@ class ApprovalTaskHandler(BaseTaskHandler):
             output={
                 "message": data.message,
                 "timeout": data.timeout,
+                "approver_group": data.approver_group,
             },
         )
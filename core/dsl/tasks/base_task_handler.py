@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import ClassVar, Dict, Any
 from ..schema import TaskInput, TaskResult, DSLModel
+from ...workflow import heartbeat
 
 
 class BaseTaskHandler(ABC):
@@ -8,8 +10,42 @@ class BaseTaskHandler(ABC):
     Abstract base class for task handlers.
 
     Defines the interface for validating input data and executing tasks.
+
+    A worker creates one instance per task type and shares it across all
+    activity executions, so handlers may hold long-lived resources (clients,
+    connection pools, caches) but must not keep per-task state on ``self``.
+    Such resources are created in :meth:`startup` and released in
+    :meth:`shutdown`, which the worker calls once each.
+
+    Long-running handlers can record progress with :meth:`checkpoint` and pick
+    it up on a retry with :meth:`last_checkpoint` instead of starting over.
     """
 
+    #: True for handlers whose work is blocking; see :class:`SyncTaskHandler`.
+    is_sync: ClassVar[bool] = False
+
+    async def startup(self) -> None:
+        """Acquire long-lived resources before the worker starts polling."""
+        return None
+
+    async def shutdown(self) -> None:
+        """Release resources acquired in :meth:`startup` after the worker stops."""
+        return None
+
+    @staticmethod
+    def checkpoint(state: Any) -> None:
+        """Record progress of the current execution as its heartbeat details.
+
+        ``state`` should be small and JSON-serializable, e.g. ``{"offset": 500}``.
+        Outside an activity this does nothing.
+        """
+        heartbeat.checkpoint(state)
+
+    @staticmethod
+    def last_checkpoint(default: Any = None) -> Any:
+        """The state checkpointed by the previous attempt of this task, else ``default``."""
+        return heartbeat.last_checkpoint(default)
+
     @abstractmethod
     def validate(self, data: Dict[str, Any]) -> TaskInput:
         """
@@ -40,3 +76,32 @@ class BaseTaskHandler(ABC):
             :param data:
         """
         ...
+
+
+class SyncTaskHandler(BaseTaskHandler):
+    """
+    Base class for handlers that do blocking work (sync SDKs, blocking I/O).
+
+    Implement :meth:`execute_sync`. Inside a worker, the activity for such a
+    handler is registered as a sync activity and runs on the worker's
+    ``activity_executor`` thread pool instead of the event loop.
+    """
+
+    is_sync: ClassVar[bool] = True
+
+    @abstractmethod
+    def execute_sync(self, data: TaskInput) -> TaskResult:
+        """
+        Execute the task synchronously; called from a worker thread.
+
+        Args:
+            data (TaskInput): The validated task input.
+
+        Returns:
+            TaskResult: The result of the task execution.
+        """
+        ...
+
+    async def execute(self, data: TaskInput) -> TaskResult:
+        """Run :meth:`execute_sync` in a thread when called from async code."""
+        return await asyncio.to_thread(self.execute_sync, data)
@@ -0,0 +1 @@
+from .data_transform_task import DataTransformTaskHandler
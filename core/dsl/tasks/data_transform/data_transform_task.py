@@ -0,0 +1,386 @@
+# Description: Columnar DATA_TRANSFORM task for filtering and aggregating record lists
+import json
+from operator import itemgetter, methodcaller
+from typing import Any, Dict, List, Literal, Optional, Set, Union
+
+import numpy as np
+from pydantic import BaseModel, Field, field_validator
+
+from ...schema import TaskInput, TaskResult
+from ..base_task_handler import BaseTaskHandler
+from ..decision.expression import OPERATORS, And, Comparison, Node, Not, Or, compile_expression, parse_expression
+
+Columns = Dict[str, np.ndarray]
+
+
+# =====================
+# Input Schema
+# =====================
+class FilterStep(BaseModel):
+    """Keep records whose ``field`` satisfies a DECISION-style ``condition`` (e.g. ``"> 5 AND < 10"``)."""
+    op: Literal["filter"]
+    field: str
+    condition: str
+
+    @field_validator("condition")
+    @classmethod
+    def _compiles(cls, value: str) -> str:
+        compile_expression(value)
+        return value
+
+
+class ProjectStep(BaseModel):
+    """Keep only ``fields``, optionally renaming them via ``rename``."""
+    op: Literal["project"]
+    fields: List[str]
+    rename: Dict[str, str] = Field(default_factory=dict)
+
+
+class Aggregation(BaseModel):
+    """One aggregate column; ``field`` is optional for ``count``."""
+    func: Literal["sum", "count", "min", "max", "avg"]
+    field: Optional[str] = None
+
+
+class GroupByStep(BaseModel):
+    """Group by ``keys`` (none = a single group) and compute named ``aggregations``."""
+    op: Literal["group_by"]
+    keys: List[str] = Field(default_factory=list)
+    aggregations: Dict[str, Aggregation]
+
+
+class SortStep(BaseModel):
+    """Stable sort by ``by`` (first field is the primary key)."""
+    op: Literal["sort"]
+    by: List[str]
+    descending: bool = False
+
+
+PipelineStep = Union[FilterStep, ProjectStep, GroupByStep, SortStep]
+
+
+class DataTransformTaskInput(TaskInput):
+    """Input model for a DATA_TRANSFORM task.
+
+    Attributes:
+        records: List of records, or a JSON string (e.g. an HTTP task's ``response``).
+        records_path: Optional dot-path to the list inside the parsed records, e.g. ``data.items``.
+        pipeline: Steps applied in order.
+    """
+    records: Union[List[Dict[str, Any]], str, Dict[str, Any]] = Field(
+        ..., description="Records to transform, or a JSON string containing them."
+    )
+    records_path: Optional[str] = Field(
+        default=None, description="Dot-path to the record list inside 'records'."
+    )
+    pipeline: List[PipelineStep] = Field(
+        ..., description="Declarative steps: filter, project, group_by, sort."
+    )
+
+
+# =====================
+# Columnar helpers
+# =====================
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_column(values: List[Any]) -> np.ndarray:
+    """Build an int/float column for numeric data (None -> NaN), else an object column.
+
+    Integers mixed with None stay Python ints in an object column, so values beyond
+    2**53 are not rounded through float64.
+    """
+    types = set(map(type, values))
+    if types <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif types <= {int, float}:
+        return np.array(values, dtype=np.float64)
+    elif types <= {int, float, type(None)} and types & {float}:
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return _object_column(values)
+
+
+def _object_column(values: List[Any]) -> np.ndarray:
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _extract(records: List[Dict[str, Any]], name: str) -> List[Any]:
+    try:
+        return list(map(itemgetter(name), records))
+    except KeyError:
+        return list(map(methodcaller("get", name), records))
+
+
+def to_columns(records: List[Dict[str, Any]], fields: Optional[Set[str]] = None) -> Columns:
+    """Convert row records into named columns, restricted to ``fields`` if given."""
+    names: Dict[str, None] = dict.fromkeys(records[0]) if records else {}
+    if set().union(*records) - names.keys():
+        for record in records:
+            names.update(dict.fromkeys(record))
+    if fields is not None:
+        names = {name: None for name in names if name in fields}
+    return {name: _to_column(_extract(records, name)) for name in names}
+
+
+def _required_fields(pipeline: List["PipelineStep"]) -> Optional[Set[str]]:
+    """Input fields the pipeline can observe, or None if every field reaches the output."""
+    needed: Set[str] = set()
+    for step in pipeline:
+        if step.op == "filter":
+            needed.add(step.field)
+        elif step.op == "sort":
+            needed.update(step.by)
+        elif step.op == "project":
+            return needed | set(step.fields)
+        else:
+            return needed | set(step.keys) | {a.field for a in step.aggregations.values() if a.field}
+    return None
+
+
+def to_records(columns: Columns) -> List[Dict[str, Any]]:
+    """Convert named columns back into JSON-friendly row records (NaN -> None)."""
+    names = list(columns)
+    lists = []
+    for name in names:
+        column = columns[name]
+        values = column.tolist()
+        if column.dtype.kind == "f" and np.isnan(column).any():
+            values = [None if v != v else v for v in values]
+        lists.append(values)
+    return [dict(zip(names, row)) for row in zip(*lists)]
+
+
+def _length(columns: Columns) -> int:
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def _column(columns: Columns, name: str) -> np.ndarray:
+    if name in columns:
+        return columns[name]
+    return np.full(_length(columns), None, dtype=object)
+
+
+def _mask(node: Node, column: np.ndarray) -> np.ndarray:
+    """Vectorized evaluation of a compiled DECISION expression over a column.
+
+    Numeric and all-text columns use NumPy comparisons; mixed-type object columns
+    fall back to the scalar predicate so they keep exactly the DECISION semantics.
+    """
+    if isinstance(node, Not):
+        return ~_mask(node.operand, column)
+    if isinstance(node, (And, Or)):
+        combine = np.logical_and if isinstance(node, And) else np.logical_or
+        result = _mask(node.operands[0], column)
+        for child in node.operands[1:]:
+            result = combine(result, _mask(child, column))
+        return result
+    if column.dtype.kind in "if":
+        if not _is_number(node.literal) or node.quoted:
+            if node.op == "!=":
+                return np.ones(len(column), dtype=bool)
+            if node.op is None and node.quoted:
+                return column.astype(str) == node.raw
+            return np.zeros(len(column), dtype=bool)
+        op_func = OPERATORS["==" if node.op is None else node.op]
+        return op_func(column, node.literal)
+    if set(map(type, column)) == {str}:
+        if node.op is None:
+            return column == node.raw
+        if _is_number(node.literal) and not node.quoted:
+            return np.full(len(column), node.op == "!=")
+        return OPERATORS[node.op](column, node.literal)
+    predicate = compile_expression(_unparse(node))
+    return np.fromiter((predicate(v) for v in column), dtype=bool, count=len(column))
+
+
+def _unparse(node: Comparison) -> str:
+    literal = f"'{node.raw}'" if node.quoted else node.raw
+    return f"{node.op or ''} {literal}".strip()
+
+
+def _factorize(column: np.ndarray):
+    """Return (codes, uniques) for a column, in order of first appearance."""
+    if column.dtype.kind in "if":
+        uniques, first, codes = np.unique(column, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+        return remap[codes.ravel()], uniques[order]
+    index: Dict[Any, int] = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in column), dtype=np.int64, count=len(column))
+    uniques = np.empty(len(index), dtype=object)
+    uniques[:] = list(index)
+    return codes, uniques
+
+
+def _is_null(column: np.ndarray) -> np.ndarray:
+    """Mask of None/NaN entries."""
+    if column.dtype.kind == "f":
+        return np.isnan(column)
+    if column.dtype.kind == "i":
+        return np.zeros(len(column), dtype=bool)
+    return np.fromiter((v is None for v in column), dtype=bool, count=len(column))
+
+
+def _sort_ranks(column: np.ndarray) -> np.ndarray:
+    """Dense rank of each value; None/NaN rank last."""
+    if column.dtype.kind in "if":
+        return np.unique(column, return_inverse=True)[1].ravel()
+    present = [v for v in column if v is not None]
+    ranking = {v: i for i, v in enumerate(sorted(set(present)))}
+    missing = len(ranking)
+    return np.fromiter((ranking.get(v, missing) if v is not None else missing for v in column),
+                       dtype=np.int64, count=len(column))
+
+
+# =====================
+# Steps
+# =====================
+def _filter(columns: Columns, step: FilterStep) -> Columns:
+    mask = _mask(parse_expression(step.condition), _column(columns, step.field))
+    return {name: column[mask] for name, column in columns.items()}
+
+
+def _project(columns: Columns, step: ProjectStep) -> Columns:
+    return {step.rename.get(name, name): _column(columns, name) for name in step.fields}
+
+
+def _group_by(columns: Columns, step: GroupByStep) -> Columns:
+    size = _length(columns)
+    if step.keys:
+        # Rows of per-key codes identify a group; np.unique on rows cannot overflow like a packed key
+        codes = np.stack([_factorize(_column(columns, key))[0] for key in step.keys], axis=1)
+        group_codes = _factorize(np.unique(codes, axis=0, return_inverse=True)[1].ravel())[0]
+        first = np.unique(group_codes, return_index=True)[1]
+        n_groups = len(first)
+        result: Columns = {key: _column(columns, key)[first] for key in step.keys}
+    else:
+        group_codes = np.zeros(size, dtype=np.int64)
+        n_groups = 1
+        result = {}
+
+    counts = np.bincount(group_codes, minlength=n_groups)
+    if n_groups and size:
+        order = np.argsort(group_codes, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    for name, agg in step.aggregations.items():
+        if agg.func == "count":
+            if agg.field is None:
+                result[name] = counts
+            else:
+                present = _column(columns, agg.field)
+                valid = ~np.isnan(present) if present.dtype.kind == "f" else present != None  # noqa: E711
+                result[name] = np.bincount(group_codes, weights=valid, minlength=n_groups).astype(np.int64)
+            continue
+        values = _column(columns, agg.field)
+        if values.dtype.kind not in "if" and not all(v is None or _is_number(v) for v in values):
+            raise ValueError(f"Aggregation '{agg.func}' needs a numeric field, got '{agg.field}'")
+        if not size:
+            result[name] = np.full(n_groups, np.nan)
+            continue
+        valid = ~_is_null(values)
+        n_valid = np.bincount(group_codes, weights=valid, minlength=n_groups)
+        if agg.func in ("sum", "avg"):
+            sums = _group_sums(values[order], valid[order], starts)
+            if agg.func == "avg":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result[name] = sums.astype(np.float64) / n_valid
+            else:
+                # A group with no values sums to null, like min/max and the row-by-row path
+                result[name] = sums if n_valid.all() else _with_nulls(sums, n_valid == 0)
+        elif values.dtype.kind in "if":
+            ufunc = np.fmin if agg.func == "min" else np.fmax
+            result[name] = ufunc.reduceat(values[order], starts)
+        else:
+            pick = min if agg.func == "min" else max
+            groups = np.split(values[order], starts[1:])
+            result[name] = _object_column([pick((v for v in g if v is not None), default=None) for g in groups])
+    return result
+
+
+def _group_sums(values: np.ndarray, valid: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Per-group sums of group-sorted ``values``; integers are summed exactly."""
+    if values.dtype.kind == "f":
+        return np.add.reduceat(np.where(valid, values, 0.0), starts)
+    if values.dtype.kind == "i":
+        bound = max(-int(values.min()), int(values.max())) * len(values)
+        return np.add.reduceat(values if bound < 2**63 else values.astype(object), starts)
+    return np.add.reduceat(np.where(valid, values, 0), starts)
+
+
+def _with_nulls(column: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    """Copy of ``column`` with null (NaN, or None for object columns) where ``missing``."""
+    if column.dtype.kind == "f":
+        return np.where(missing, np.nan, column)
+    column = column.astype(object)
+    column[missing] = None
+    return column
+
+
+def _sort(columns: Columns, step: SortStep) -> Columns:
+    if not _length(columns):
+        return columns
+    keys = []
+    for name in step.by:
+        column = _column(columns, name)
+        ranks = _sort_ranks(column)
+        # The null flag outranks the value, so None/NaN stay last in both directions
+        keys += [_is_null(column), -ranks if step.descending else ranks]
+    order = np.lexsort(keys[::-1])
+    return {name: column[order] for name, column in columns.items()}
+
+
+_STEPS = {"filter": _filter, "project": _project, "group_by": _group_by, "sort": _sort}
+
+
+def run_pipeline(records: List[Dict[str, Any]], pipeline: List[PipelineStep]) -> List[Dict[str, Any]]:
+    """Run a pipeline over records as one columnar batch and return the resulting records."""
+    if not records:
+        return []
+    columns = to_columns(records, _required_fields(pipeline))
+    for step in pipeline:
+        columns = _STEPS[step.op](columns, step)
+    return to_records(columns)
+
+
+# =====================
+# Task Handler
+# =====================
+class DataTransformTaskHandler(BaseTaskHandler):
+    """Handler that filters, projects, groups, aggregates and sorts record lists in a single activity."""
+
+    def validate(self, data: Dict[str, Any]) -> DataTransformTaskInput:
+        return DataTransformTaskInput(**data)
+
+    @staticmethod
+    def _extract_records(data: DataTransformTaskInput) -> List[Dict[str, Any]]:
+        """Parse JSON input if needed and follow ``records_path`` to the record list."""
+        records: Any = json.loads(data.records) if isinstance(data.records, str) else data.records
+        for part in (data.records_path or "").split("."):
+            if part:
+                records = records[int(part)] if isinstance(records, list) else records[part]
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            raise ValueError("records must resolve to a list of objects")
+        return records
+
+    async def execute(self, data: DataTransformTaskInput) -> TaskResult:
+        """Run the pipeline over the input records."""
+        try:
+            records = run_pipeline(self._extract_records(data), data.pipeline)
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            return TaskResult(
+                task_ref_name=data.task_ref_name,
+                status="FAILED",
+                output={"error": str(e)},
+            )
+        return TaskResult(
+            task_ref_name=data.task_ref_name,
+            status="COMPLETED",
+            output={"records": records, "count": len(records)},
+        )
@@ -0,0 +1,160 @@
+# Description: Indexed decision tables for DECISION tasks with many cases
+"""
+A decision table indexes the cases of a DECISION task so that lookup does not
+have to test every case in order:
+
+* pure numeric interval cases (``"> 50 AND < 100"``, ``">= 1000"``) go into a
+  sorted segment index searched with ``bisect``;
+* exact-match cases (``"EXPRESS"``, ``"== 42"``) go into hash maps;
+* ``OR`` of indexable parts is indexed part by part;
+* anything else stays on a linear path.
+
+Each index stores the lowest case position that covers a value, and linear cases
+are only tried when they come before the best indexed hit. That keeps the
+documented first-match semantics: the earliest matching case in the mapping wins.
+"""
+import math
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .expression import And, Comparison, Node, Or, Predicate, compile_expression, parse_expression
+
+TABLE_CACHE_SIZE = 256
+
+_LOWER_OPS = {">": False, ">=": True}
+_UPPER_OPS = {"<": False, "<=": True}
+_EQUAL_OPS = {"==", "="}
+
+# (lo, lo_inclusive, hi, hi_inclusive)
+Interval = Tuple[float, bool, float, bool]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _interval(node: Node) -> Optional[Interval]:
+    """Returns the numeric interval a comparison or AND of comparisons accepts, if it is one."""
+    comparisons = node.operands if isinstance(node, And) else (node,)
+    lo, lo_incl, hi, hi_incl = -math.inf, False, math.inf, False
+    for comp in comparisons:
+        if not isinstance(comp, Comparison) or comp.quoted or not _is_number(comp.literal):
+            return None
+        value = comp.literal
+        if comp.op in _LOWER_OPS:
+            if value > lo or (value == lo and not _LOWER_OPS[comp.op]):
+                lo, lo_incl = value, _LOWER_OPS[comp.op]
+        elif comp.op in _UPPER_OPS:
+            if value < hi or (value == hi and not _UPPER_OPS[comp.op]):
+                hi, hi_incl = value, _UPPER_OPS[comp.op]
+        else:
+            return None
+    return lo, lo_incl, hi, hi_incl
+
+
+def _index_entries(node: Node) -> Optional[List[Tuple[str, Any]]]:
+    """Breaks a case into ('number'|'string'|'interval', key) entries, or None if not indexable."""
+    if isinstance(node, Or):
+        entries: List[Tuple[str, Any]] = []
+        for child in node.operands:
+            child_entries = _index_entries(child)
+            if child_entries is None:
+                return None
+            entries.extend(child_entries)
+        return entries
+    if isinstance(node, Comparison) and (node.op is None or node.op in _EQUAL_OPS):
+        if node.op is None and (node.quoted or not _is_number(node.literal)):
+            return [("string", node.raw)]
+        if not node.quoted and _is_number(node.literal):
+            if node.op is None:
+                # Bare numbers also match on their exact text, e.g. "05".
+                return [("number", node.literal), ("string", node.raw)]
+            return [("number", node.literal)]
+        return None
+    interval = _interval(node)
+    return [("interval", interval)] if interval else None
+
+
+class DecisionTable:
+    """Index over an ordered tuple of case expressions; ``lookup`` returns the first matching position."""
+
+    def __init__(self, case_exprs: Tuple[str, ...]) -> None:
+        self.size = len(case_exprs)
+        self._numbers: Dict[Any, int] = {}
+        self._strings: Dict[str, int] = {}
+        self._linear: List[Tuple[int, Predicate]] = []
+        intervals: List[Tuple[int, Interval]] = []
+
+        for position, expr in enumerate(case_exprs):
+            entries = _index_entries(parse_expression(expr))
+            if entries is None:
+                self._linear.append((position, compile_expression(expr)))
+                continue
+            for kind, key in entries:
+                if kind == "number":
+                    if not math.isnan(key):
+                        self._numbers.setdefault(key, position)
+                elif kind == "string":
+                    self._strings.setdefault(key, position)
+                else:
+                    intervals.append((position, key))
+
+        self._build_segments(intervals)
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of cases served by the indexes rather than the linear path."""
+        return self.size - len(self._linear)
+
+    def _build_segments(self, intervals: List[Tuple[int, Interval]]) -> None:
+        """Builds sorted boundary points and the first covering case for every elementary segment.
+
+        With boundary points ``p0 < p1 < ... < pm-1``, segment ``2j`` is the open gap
+        below ``pj`` and segment ``2j+1`` is the point ``pj`` itself; segment ``2m``
+        is everything above the last point.
+        """
+        points = sorted({b for _, (lo, _, hi, _) in intervals for b in (lo, hi) if math.isfinite(b)})
+        self._points = points
+        self._segments: List[Optional[int]] = [None] * (2 * len(points) + 1)
+        for position, (lo, lo_incl, hi, hi_incl) in intervals:
+            if math.isinf(lo):
+                start = 0
+            else:
+                j = bisect_left(points, lo)
+                start = 2 * j + 1 if lo_incl else 2 * j + 2
+            if math.isinf(hi):
+                end = 2 * len(points)
+            else:
+                j = bisect_left(points, hi)
+                end = 2 * j + 1 if hi_incl else 2 * j
+            for seg in range(start, end + 1):
+                if self._segments[seg] is None:
+                    self._segments[seg] = position
+
+    def _segment_hit(self, value: float) -> Optional[int]:
+        j = bisect_left(self._points, value)
+        if j < len(self._points) and self._points[j] == value:
+            return self._segments[2 * j + 1]
+        return self._segments[2 * j]
+
+    def lookup(self, value: Any) -> Optional[int]:
+        """Returns the position of the first case matching the (coerced) value, or None."""
+        hits = [self._strings.get(str(value))]
+        if _is_number(value) and not math.isnan(value):
+            hits.append(self._numbers.get(value))
+            hits.append(self._segment_hit(value))
+        best = min((h for h in hits if h is not None), default=None)
+
+        for position, predicate in self._linear:
+            if best is not None and position > best:
+                break
+            if predicate(value):
+                return position
+        return best
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def compile_decision_table(case_exprs: Tuple[str, ...]) -> DecisionTable:
+    """Build (or fetch from cache) the decision table for an ordered tuple of case strings."""
+    return DecisionTable(case_exprs)
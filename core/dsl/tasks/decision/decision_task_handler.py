@@ -1,11 +1,21 @@
 # Description: Decision task handler with operator support for workflow engine
 from ...schema import TaskInput
 from pydantic import Field, model_validator
-from typing import Dict, List, Optional, Any
-import re
-import operator
+from typing import Dict, List, Literal, Optional, Any
+import logging
+import time
 from ..base_task_handler import BaseTaskHandler
 from ...schema import TaskResult
+from .expression import OPERATORS, LOGICAL_KEYWORDS, coerce_value, compile_expression
+from .decision_table import compile_decision_table
+from ....metrics import dsl_metrics
+
+logger = logging.getLogger(__name__)
+
+# In "auto" mode, tables with at least this many cases use the indexed lookup.
+DECISION_TABLE_MIN_CASES = 8
+
+
 class DecisionTaskInput(TaskInput):
     """Strict input model for a decision task with operator + logical support."""
 
@@ -16,11 +26,10 @@ class DecisionTaskInput(TaskInput):
     default_case: Optional[List[str]] = Field(
         default_factory=list, description="Actions to take if no case matches."
     )
-
-    # Updated regex: allow operators, words, numbers, dots, dashes, and logical keywords
-    _op_pattern = re.compile(
-        r"^([<>=!]=?|==)?\s*[\w\d\.\-]+(\s+(AND|OR|NOT)\s+([<>=!]=?|==)?\s*[\w\d\.\-]+)*$",
-        re.IGNORECASE,
+    mode: Literal["auto", "linear", "table"] = Field(
+        default="auto",
+        description="'table' indexes numeric interval and exact-match cases for O(log n) lookup; "
+                    "'linear' tests cases in order; 'auto' picks 'table' for large case sets.",
     )
 
     @model_validator(mode="after")
@@ -29,10 +38,12 @@ class DecisionTaskInput(TaskInput):
         decision_cases = self.decision_cases or {}
         default_case = self.default_case or []
 
-        # Validate keys
+        # Validate keys by compiling them (also warms the compiled-predicate cache)
         for key in decision_cases.keys():
-            if not self._op_pattern.match(str(key)):
-                raise ValueError(f"Invalid decision case key: '{key}'")
+            try:
+                compile_expression(str(key))
+            except ValueError as e:
+                raise ValueError(f"Invalid decision case key: '{key}': {e}") from e
 
         if not decision_cases and not default_case:
             raise ValueError(
@@ -44,114 +55,73 @@ class DecisionTaskInput(TaskInput):
 
 
 class DecisionTaskHandler(BaseTaskHandler):
-    """Handler for decision tasks in the workflow with extended logical operator support."""
+    """Handler for decision tasks in the workflow with extended logical operator support.
+
+    Case strings are compiled once (see ``expression.py``) and cached per string,
+    so evaluation is a call into pre-built predicates.
+    """
 
-    OPERATORS = {
-        "<=": operator.le,
-        ">=": operator.ge,
-        "==": operator.eq,
-        "=": operator.eq,
-        "<": operator.lt,
-        ">": operator.gt,
-    }
+    OPERATORS = OPERATORS
 
-    LOGICAL_KEYWORDS = {"AND", "OR", "NOT"}
+    LOGICAL_KEYWORDS = LOGICAL_KEYWORDS
 
     def validate(self, data: Dict[str, object]) -> DecisionTaskInput:
         return DecisionTaskInput(**data)
 
     def _try_number(self, value: Any) -> Any:
         """Try to convert a value to int/float, else return original string."""
-        try:
-            if "." in str(value):
-                return float(value)
-            return int(value)
-        except (ValueError, TypeError):
-            return str(value)
+        return coerce_value(value)
 
     def _evaluate_expression(self, param_value: Any, expr: str) -> bool:
         """
         Evaluate a single logical/relational expression.
-        Supports AND, OR, NOT combined with numeric or string comparisons.
+        Supports AND, OR, NOT and parentheses combined with numeric or string comparisons.
         """
-        print(f"[DEBUG] Evaluating expr={expr!r} against param_value={param_value!r}")
-
-        def _try_number(value: Any) -> Any:
-            """Convert to int/float if possible, else return original string."""
-            if value is None:
-                return None
-            try:
-                if isinstance(value, str) and "." in value:
-                    return float(value)
-                return int(value)
-            except (ValueError, TypeError):
-                return str(value).strip()
-
-        param_value = _try_number(param_value)
-
-        # Tokenize by logical operators
-        tokens = re.split(r"\s+(AND|OR|NOT)\s+", expr.strip(), flags=re.IGNORECASE)
-
-        def eval_token(token: str) -> bool:
-            token = token.strip()
-            if not token:
-                return False
-
-            # Handle NOT explicitly
-            if token.upper().startswith("NOT "):
-                return not eval_token(token[4:].strip())
-
-            # Operator-based check
-            for op_symbol, op_func in sorted(self.OPERATORS.items(), key=lambda x: -len(x[0])):
-                if token.startswith(op_symbol):
-                    threshold_str = token[len(op_symbol):].strip()
-                    threshold = _try_number(threshold_str)
-                    print(f"[DEBUG] Comparing {param_value} {op_symbol} {threshold}")
-                    try:
-                        return op_func(param_value, threshold)
-                    except Exception:
-                        return False
-
-            # Equality fallback
-            return str(param_value) == token or param_value == _try_number(token)
-
-        # Sequential evaluation with short-circuiting
-        result = eval_token(tokens[0])
-        i = 1
-        while i < len(tokens):
-            logical = tokens[i].upper()
-            next_val = eval_token(tokens[i + 1])
-
-            if logical == "AND":
-                result = result and next_val
-            elif logical == "OR":
-                # short-circuit: if already True, stay True
-                result = result or next_val
-
-            i += 2
-
+        result = compile_expression(expr)(coerce_value(param_value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Evaluated expr=%r against param_value=%r -> %s", expr, param_value, result)
         return result
 
+    @staticmethod
+    def _use_table(data: DecisionTaskInput) -> bool:
+        """Whether to resolve the case through an indexed decision table."""
+        if data.mode == "auto":
+            return len(data.decision_cases) >= DECISION_TABLE_MIN_CASES
+        return data.mode == "table"
+
     async def execute(self, data: DecisionTaskInput) -> TaskResult:
         """Execute the decision task logic with operator + logical support."""
-        param_value = self._try_number(data.param_value)
-        chosen: List[str] = data.default_case
-        print(f"[DEBUG] Raw param_value={param_value!r}, type={type(param_value)}")
-        if param_value is None:
+        if data.param_value is None:
             return TaskResult(
                 task_ref_name=data.task_ref_name,
                 status="FAILED",
                 output={"error": "Missing inputParameter"}
             )
-
-        for case_expr, actions in data.decision_cases.items():
-            if self._evaluate_expression(param_value, case_expr):
-                chosen = actions
-                break
-
+        param_value = self._try_number(data.param_value)
+        chosen: List[str] = data.default_case
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw param_value=%r, type=%s", param_value, type(param_value).__name__)
+
+        started = time.perf_counter()
+        use_table = self._use_table(data)
+        if use_table:
+            table = compile_decision_table(tuple(data.decision_cases))
+            position = table.lookup(param_value)
+            if position is not None:
+                chosen = list(data.decision_cases.values())[position]
+        else:
+            for case_expr, actions in data.decision_cases.items():
+                if self._evaluate_expression(param_value, case_expr):
+                    chosen = actions
+                    break
+
+        metrics = dsl_metrics()
+        if metrics is not None:
+            metrics.decision_evaluation.record(
+                time.perf_counter() - started, {"mode": "table" if use_table else "linear"}
+            )
         return TaskResult(
             task_ref_name=data.task_ref_name,
             status="COMPLETED",
             output={"next_task": chosen},
         )
-
@@ -0,0 +1,224 @@
+# Description: Compiler for DECISION case expressions into cached predicates
+"""
+Decision case expressions are parsed once into a small AST and compiled into
+plain Python closures. Compiled predicates are cached per case string, so the
+cost of parsing is paid once per worker process rather than per evaluation.
+
+Grammar (keywords are case-insensitive)::
+
+    expr       := or_expr
+    or_expr    := and_expr ("OR" and_expr)*
+    and_expr   := not_expr (["AND"] "NOT" not_expr | "AND" not_expr)*
+    not_expr   := "NOT" not_expr | primary
+    primary    := "(" expr ")" | comparison
+    comparison := [operator] literal
+    operator   := "<=" | ">=" | "==" | "!=" | "=" | "<" | ">"
+    literal    := number | word | 'quoted' | "quoted"
+
+NOT binds tighter than AND, which binds tighter than OR. A comparison without
+an operator is an equality check. A binary ``A NOT B`` is read as ``A AND NOT B``.
+"""
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+COMPILED_CACHE_SIZE = 1024
+
+OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+LOGICAL_KEYWORDS = {"AND", "OR", "NOT"}
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<op><=|>=|==|!=|=|<|>)|(?P<paren>[()])|(?P<quoted>'[^']*'|\"[^\"]*\")|(?P<word>[\w.\-]+))"
+)
+
+Predicate = Callable[[Any], bool]
+
+
+def coerce_value(value: Any) -> Any:
+    """Convert to int/float if possible, else return the value as a stripped string."""
+    if value is None:
+        return None
+    try:
+        if "." in str(value):
+            return float(value)
+        return int(value)
+    except (ValueError, TypeError):
+        return str(value).strip()
+
+
+# =====================
+# AST
+# =====================
+@dataclass(frozen=True)
+class Comparison:
+    """``param <op> literal``; ``op`` is None for a bare equality literal."""
+    op: Optional[str]
+    literal: Any
+    raw: str
+    quoted: bool = False
+
+
+@dataclass(frozen=True)
+class Not:
+    operand: "Node"
+
+
+@dataclass(frozen=True)
+class And:
+    operands: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    operands: Tuple["Node", ...]
+
+
+Node = Union[Comparison, Not, And, Or]
+
+
+# =====================
+# Parser
+# =====================
+def _tokenize(expr: str) -> List[Tuple[str, str]]:
+    """Split an expression into (kind, text) tokens."""
+    tokens: List[Tuple[str, str]] = []
+    pos = 0
+    expr = expr.rstrip()
+    while pos < len(expr):
+        match = _TOKEN_PATTERN.match(expr, pos)
+        if not match:
+            raise ValueError(f"Unexpected character {expr[pos:].strip()[:1]!r} in expression '{expr}'")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "word" and text.upper() in LOGICAL_KEYWORDS:
+            kind, text = "keyword", text.upper()
+        tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing the AST for one expression."""
+
+    def __init__(self, expr: str) -> None:
+        self._expr = expr
+        self._tokens = _tokenize(expr)
+        self._pos = 0
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return None, None
+
+    def _next(self) -> Tuple[Optional[str], Optional[str]]:
+        token = self._peek()
+        self._pos += 1
+        return token
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"{message} in expression '{self._expr}'")
+
+    def parse(self) -> Node:
+        if not self._tokens:
+            raise self._error("Empty condition")
+        node = self._or()
+        if self._pos != len(self._tokens):
+            raise self._error(f"Unexpected token '{self._peek()[1]}'")
+        return node
+
+    def _or(self) -> Node:
+        operands = [self._and()]
+        while self._peek() == ("keyword", "OR"):
+            self._next()
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(tuple(operands))
+
+    def _and(self) -> Node:
+        operands = [self._not()]
+        while self._peek() in (("keyword", "AND"), ("keyword", "NOT")):
+            if self._peek() == ("keyword", "AND"):
+                self._next()
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(tuple(operands))
+
+    def _not(self) -> Node:
+        if self._peek() == ("keyword", "NOT"):
+            self._next()
+            return Not(self._not())
+        return self._primary()
+
+    def _primary(self) -> Node:
+        kind, text = self._next()
+        if kind == "paren" and text == "(":
+            node = self._or()
+            if self._next() != ("paren", ")"):
+                raise self._error("Missing ')'")
+            return node
+        op = None
+        if kind == "op":
+            op = text
+            kind, text = self._next()
+        if kind == "word":
+            return Comparison(op=op, literal=coerce_value(text), raw=text)
+        if kind == "quoted":
+            return Comparison(op=op, literal=text[1:-1], raw=text[1:-1], quoted=True)
+        raise self._error(f"Expected a value but found '{text}'" if text else "Expected a value")
+
+
+def parse_expression(expr: str) -> Node:
+    """Parse a decision case string into its AST.
+
+    Raises:
+        ValueError: If the expression is not valid.
+    """
+    return _Parser(str(expr)).parse()
+
+
+# =====================
+# Compiler
+# =====================
+def _compile_node(node: Node) -> Predicate:
+    if isinstance(node, Comparison):
+        literal, raw = node.literal, node.raw
+        if node.op is None:
+            if node.quoted:
+                return lambda value: str(value) == raw
+            return lambda value: str(value) == raw or value == literal
+        op_func = OPERATORS[node.op]
+
+        def compare(value: Any) -> bool:
+            try:
+                return bool(op_func(value, literal))
+            except TypeError:
+                return False
+        return compare
+    if isinstance(node, Not):
+        operand = _compile_node(node.operand)
+        return lambda value: not operand(value)
+    operands = tuple(_compile_node(child) for child in node.operands)
+    if isinstance(node, And):
+        return lambda value: all(pred(value) for pred in operands)
+    return lambda value: any(pred(value) for pred in operands)
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compile_expression(expr: str) -> Predicate:
+    """Compile a decision case string into a predicate over the (coerced) param value.
+
+    Results are cached per expression string for the lifetime of the process.
+
+    Raises:
+        ValueError: If the expression is not valid.
+    """
+    return _compile_node(parse_expression(expr))
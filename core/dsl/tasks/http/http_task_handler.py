@@ -1,8 +1,10 @@
+import os
 from typing import Optional, Dict, Any, Literal
-from ..base_task_handler import BaseTaskHandler
+from ..base_task_handler import SyncTaskHandler
 from ...schema import TaskInput, TaskResult,DSLModel
 from pydantic import HttpUrl, Field
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class HttpTaskInput(TaskInput):
@@ -26,8 +28,31 @@ class HttpTaskInput(TaskInput):
     )
 
 
-class HttpTaskHandler(BaseTaskHandler):
-    """Handler for executing HTTP tasks."""
+class HttpTaskHandler(SyncTaskHandler):
+    """Handler for executing HTTP tasks.
+
+    ``requests`` is blocking, so this is a sync handler: it runs on the worker's
+    activity thread pool and reuses one pooled ``requests.Session`` for keep-alive
+    connections across tasks.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[requests.Session] = None
+
+    async def startup(self) -> None:
+        """Open the shared HTTP session with a connection pool sized to the thread pool."""
+        pool_size = int(os.getenv("HTTP_POOL_SIZE", "32"))
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._session = session
+
+    async def shutdown(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def validate(self, data: Dict[str, Any]) -> HttpTaskInput:
         """Validate and parse raw input into a HttpTaskInput.
@@ -40,7 +65,7 @@ class HttpTaskHandler(BaseTaskHandler):
         """
         return HttpTaskInput(**data)
 
-    async def execute(self, data: HttpTaskInput) -> TaskResult:
+    def execute_sync(self, data: HttpTaskInput) -> TaskResult:
         """Execute the HTTP task using the requests library.
 
         Args:
@@ -49,7 +74,7 @@ class HttpTaskHandler(BaseTaskHandler):
         Returns:
             TaskResult: The result of the HTTP request execution.
         """
-        response = requests.request(
+        response = (self._session or requests).request(
             method=data.method,
             url=str(data.url),
             headers=data.headers or {},
@@ -1,12 +1,23 @@
-from typing import List, Optional, Union, Protocol, Dict, Any
-from pydantic import Field
+from typing import List, Optional, Union, Protocol, Dict, Any, Set
+from pydantic import Field, model_validator
 from ...schema import TaskInput, TaskResult, DSLModel
 from ..base_task_handler import BaseTaskHandler
+from ....workflow.task_log import TaskEventLog, preview
 
+import asyncio
 import os
 import re
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 from sendgrid import SendGridAPIClient, Cc, Bcc, To
-from sendgrid.helpers.mail import Mail
+from sendgrid.helpers.mail import Mail, Personalization
+
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
 def render_template(template: str, context: Dict[str, Any]) -> str:
     """Render a template string with ${...} placeholders using dot-paths into context dict.
@@ -33,8 +44,6 @@ def render_template(template: str, context: Dict[str, Any]) -> str:
                 return f"<missing:{path}>"
         return value
 
-    pattern = re.compile(r"\$\{([^}]+)\}")
-
     def replacer(match):
         """
 
@@ -44,23 +53,68 @@ def render_template(template: str, context: Dict[str, Any]) -> str:
         path = match.group(1).strip()
         return str(get_value(path, context))
 
-    return pattern.sub(replacer, template)
+    return PLACEHOLDER_PATTERN.sub(replacer, template)
+
+
+@lru_cache(maxsize=1)
+def get_template_environment() -> Environment:
+    """Jinja2 environment over the email template library (``EMAIL_TEMPLATE_DIR``).
+
+    Built once per worker. Compiled templates are kept in Jinja's LRU cache
+    (``EMAIL_TEMPLATE_CACHE_SIZE`` entries) and recompiled when the file changes.
+    """
+    return Environment(
+        loader=FileSystemLoader(os.getenv("EMAIL_TEMPLATE_DIR", "templates/email")),
+        autoescape=select_autoescape(["html", "htm", "xml"]),
+        cache_size=int(os.getenv("EMAIL_TEMPLATE_CACHE_SIZE", "256")),
+        auto_reload=True,
+    )
+
+
+def render_named_template(name: str, context: Dict[str, Any]) -> str:
+    """Render a template from the library by name with the given context."""
+    return get_template_environment().get_template(name).render(**context)
 # =====================
 # Input Schema
 # =====================
 class SendEmailTaskInput(TaskInput):
-    """Strict input model for a send email task."""
+    """Strict input model for a send email task.
+
+    Provide either an inline ``body`` or a ``template`` name from the template
+    library plus its ``context``; only the context travels in the payload.
+    """
 
     to: Union[str, List[str]] = Field(..., description="Recipient(s) of the email.")
     subject: str = Field(..., description="Subject line of the email.")
-    body: str = Field(..., description="Email body (plain text or HTML).")
+    body: Optional[str] = Field(default=None, description="Email body (plain text or HTML).")
+    template: Optional[str] = Field(
+        default=None, description="Template name resolved from EMAIL_TEMPLATE_DIR, e.g. 'order_status.html'."
+    )
+    context: Dict[str, Any] = Field(default_factory=dict, description="Variables for the template.")
     cc: Optional[Union[str, List[str]]] = Field(default_factory=list, description="CC recipients.")
     bcc: Optional[Union[str, List[str]]] = Field(default_factory=list, description="BCC recipients.")
 
+    @model_validator(mode="after")
+    def validate_body_source(self) -> "SendEmailTaskInput":
+        """Exactly one of body or template must be given."""
+        if (self.body is None) == (self.template is None):
+            raise ValueError("Provide exactly one of 'body' or 'template'.")
+        return self
+
 
 # =====================
 # Provider Interface
 # =====================
+@dataclass
+class EmailRequest:
+    """One email to send, as handed to a provider's bulk API."""
+    to: List[str]
+    subject: str
+    body: str
+    cc: List[str] = field(default_factory=list)
+    bcc: List[str] = field(default_factory=list)
+
+
 class EmailProvider(Protocol):
     """Protocol for pluggable email providers."""
 
@@ -74,16 +128,29 @@ class EmailProvider(Protocol):
     ) -> dict:
         ...
 
+    async def send_bulk(self, requests: List[EmailRequest]) -> List[dict]:
+        """Send many emails in as few provider calls as possible; one result per request."""
+        ...
+
+    async def close(self) -> None:
+        """Release pooled connections/threads held by the provider."""
+        ...
+
 
 # =====================
 # SendGrid Provider
 # =====================
 class SendGridProvider:
-    """SendGrid email provider implementation."""
+    """SendGrid email provider implementation.
 
-    def __init__(self, api_key: str, from_email: str):
+    The SendGrid SDK is blocking, so sends run on a bounded thread pool owned by
+    the provider instead of stalling the worker's event loop.
+    """
+
+    def __init__(self, api_key: str, from_email: str, max_workers: int = 8):
         self.client = SendGridAPIClient(api_key)
         self.from_email = from_email
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sendgrid")
 
     async def send_email(
         self,
@@ -114,14 +181,242 @@ class SendGridProvider:
         if bcc:
             message.bcc = [Bcc(email) for email in bcc]
 
-        response = self.client.send(message)
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(self._executor, self.client.send, message)
         return {"status_code": response.status_code, "body": response.body}
 
+    async def send_bulk(self, requests: List[EmailRequest]) -> List[dict]:
+        """Send requests sharing a body as one Mail with a personalization per request."""
+        by_body: Dict[str, List[int]] = {}
+        for i, request in enumerate(requests):
+            by_body.setdefault(request.body, []).append(i)
+
+        results: List[dict] = [{} for _ in requests]
+        loop = asyncio.get_running_loop()
+        for body, indexes in by_body.items():
+            for start in range(0, len(indexes), SENDGRID_MAX_PERSONALIZATIONS):
+                chunk = indexes[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+                message = Mail(from_email=self.from_email, html_content=body)
+                for position, i in enumerate(chunk):
+                    request = requests[i]
+                    personalization = Personalization()
+                    for email in request.to:
+                        personalization.add_to(To(email))
+                    for email in request.cc:
+                        personalization.add_cc(Cc(email))
+                    for email in request.bcc:
+                        personalization.add_bcc(Bcc(email))
+                    personalization.subject = request.subject
+                    message.add_personalization(personalization, index=position)
+                response = await loop.run_in_executor(self._executor, self.client.send, message)
+                for i in chunk:
+                    results[i] = {"status_code": response.status_code, "body": response.body, "batch_size": len(chunk)}
+        return results
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+# =====================
+# SMTP Provider
+# =====================
+class SMTPProvider:
+    """SMTP email provider keeping a pool of persistent, authenticated connections.
+
+    ``smtplib`` is blocking, so each send checks a connection out of the pool and
+    runs on a thread pool of the same size. Connections are opened lazily and
+    re-opened once if the server dropped them between sends.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        from_email: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        use_ssl: bool = False,
+        pool_size: int = 4,
+        timeout: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.from_email = from_email
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="smtp")
+        self._pool: "asyncio.LifoQueue[Optional[smtplib.SMTP]]" = asyncio.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put_nowait(None)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection (runs on the thread pool)."""
+        if self.use_ssl:
+            conn = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls and not self.use_ssl:
+                conn.starttls()
+            if self.username:
+                conn.login(self.username, self.password or "")
+        except BaseException:
+            # A failed handshake must not leak the socket we just opened
+            conn.close()
+            raise
+        return conn
+
+    def _send_blocking(self, conn: Optional[smtplib.SMTP], message: EmailMessage) -> smtplib.SMTP:
+        """Send on the given connection, (re)connecting if needed; returns the live connection."""
+        if conn is None:
+            conn = self._connect()
+        try:
+            conn.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            conn = self._connect()
+            conn.send_message(message)
+        return conn
+
+    def _build_message(self, request: EmailRequest) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.from_email
+        message["To"] = ", ".join(request.to)
+        if request.cc:
+            message["Cc"] = ", ".join(request.cc)
+        if request.bcc:
+            message["Bcc"] = ", ".join(request.bcc)
+        message["Subject"] = request.subject
+        message.set_content(request.body, subtype="html")
+        return message
+
+    @staticmethod
+    def _not_sent(conn: Optional[smtplib.SMTP], count: int, error: Exception) -> List[dict]:
+        """Closes the lost connection and returns a retryable result for each unsent message."""
+        if conn is not None:
+            conn.close()
+        return [
+            {"status_code": 421, "body": f"Not sent, connection lost: {error}", "retryable": True} for _ in range(count)
+        ]
+
+    @staticmethod
+    def _not_connected(conn: Optional[smtplib.SMTP], count: int, error: smtplib.SMTPException) -> List[dict]:
+        """Closes any open connection and fails each unsent message with the server's handshake error."""
+        if conn is not None:
+            conn.close()
+        status_code = getattr(error, "smtp_code", 554)
+        return [{"status_code": status_code, "body": f"Not sent, SMTP handshake failed: {error}"} for _ in range(count)]
+
+    def _send_many_blocking(self, conn: Optional[smtplib.SMTP], messages: List[EmailMessage]):
+        """Send messages back to back on one connection; returns (connection, per-message results).
+
+        If the connection is lost and reconnecting fails, the messages already accepted keep
+        their results and the rest get a retryable 421, so a retry does not resend accepted mail.
+        A rejected connect, greeting or login stops the batch as well, since every following
+        message would fail the same handshake.
+        """
+        results = []
+        for index, message in enumerate(messages):
+            try:
+                conn = self._send_blocking(conn, message)
+                results.append({"status_code": 250, "body": "Accepted by SMTP server"})
+            except (
+                smtplib.SMTPAuthenticationError,
+                smtplib.SMTPConnectError,
+                smtplib.SMTPHeloError,
+            ) as e:
+                return None, results + self._not_connected(conn, len(messages) - index, e)
+            except smtplib.SMTPServerDisconnected as e:
+                return None, results + self._not_sent(conn, len(messages) - index, e)
+            except smtplib.SMTPException as e:
+                results.append({"status_code": 550, "body": str(e)})
+            except OSError as e:
+                # Reconnect failed at the socket level (refused, timed out)
+                return None, results + self._not_sent(conn, len(messages) - index, e)
+        return conn, results
+
+    async def send_email(
+        self,
+        to: List[str],
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+    ) -> dict:
+        request = EmailRequest(to=to, subject=subject, body=body, cc=cc or [], bcc=bcc or [])
+        return (await self.send_bulk([request]))[0]
+
+    async def send_bulk(self, requests: List[EmailRequest]) -> List[dict]:
+        """Send all requests over a single pooled connection."""
+        messages = [self._build_message(r) for r in requests]
+        conn = await self._pool.get()
+        try:
+            sending = asyncio.get_running_loop().run_in_executor(
+                self._executor, self._send_many_blocking, conn, messages
+            )
+        except BaseException:
+            self._pool.put_nowait(conn)
+            raise
+        try:
+            # Shielded: cancelling the activity must not release a connection a thread still uses
+            conn, results = await asyncio.shield(sending)
+        except asyncio.CancelledError:
+            sending.add_done_callback(lambda done: self._release(done, conn))
+            raise
+        except Exception:
+            if conn is not None:
+                conn.close()
+            self._pool.put_nowait(None)
+            raise
+        self._pool.put_nowait(conn)
+        return results
+
+    def _release(self, sending: "asyncio.Future", conn: Optional[smtplib.SMTP]) -> None:
+        """Returns the pool slot of a cancelled send once its thread has finished with the connection."""
+        if not sending.cancelled() and sending.exception() is None:
+            self._pool.put_nowait(sending.result()[0])
+            return
+        if conn is not None:
+            conn.close()
+        self._pool.put_nowait(None)
+
+    @staticmethod
+    def _quit_blocking(conn: smtplib.SMTP) -> None:
+        """Say QUIT and close the socket, even if the server already dropped it."""
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            conn.close()
+
+    async def close(self) -> None:
+        conns = []
+        while not self._pool.empty():
+            conn = self._pool.get_nowait()
+            if conn is not None:
+                conns.append(conn)
+        try:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, self._quit_blocking, conn) for conn in conns),
+                return_exceptions=True,
+            )
+        finally:
+            for conn in conns:
+                conn.close()
+            self._executor.shutdown(wait=False)
+
 # =====================
 # Console Provider (Fallback)
 # =====================
 class ConsoleEmailProvider:
-    """Fallback email provider that prints email details to the console."""
+    """Fallback email provider that logs each email (body capped, see core.workflow.task_log)."""
+
+    def __init__(self) -> None:
+        self._events = TaskEventLog(sample_rate=1.0)
 
     async def send_email(
         self,
@@ -131,47 +426,162 @@ class ConsoleEmailProvider:
         cc: Optional[List[str]] = None,
         bcc: Optional[List[str]] = None,
     ) -> dict:
-        print("\n[EmailProvider] Console Fallback")
-        print("===================================")
-        print(f"To: {', '.join(to)}")
-        if cc:
-            print(f"CC: {', '.join(cc)}")
-        if bcc:
-            print(f"BCC: {', '.join(bcc)}")
-        print(f"Subject: {subject}")
-        print("------------ Body ---------------")
-        print(body)
-        print("===================================\n")
+        self._events.event(
+            "console_email",
+            to=",".join(to),
+            cc=",".join(cc) if cc else None,
+            bcc=len(bcc) if bcc else None,
+            subject=repr(subject),
+            body_bytes=len(body.encode()),
+            body=preview(body),
+        )
 
         return {"status_code": 200, "body": "Rendered to console"}
 
+    async def send_bulk(self, requests: List[EmailRequest]) -> List[dict]:
+        return [await self.send_email(r.to, r.subject, r.body, r.cc, r.bcc) for r in requests]
+
+    async def close(self) -> None:
+        return None
+
 
 
 # =====================
 # Provider Factory
 # =====================
+@lru_cache(maxsize=1)
 def get_email_provider() -> EmailProvider:
-    """Factory to select the email provider via env/config."""
+    """Factory to select the email provider via env/config.
+
+    The provider is built once per worker process and reused, so its client,
+    connection pool and threads are shared by every send_mail activity.
+    """
     provider = os.getenv("EMAIL_PROVIDER", "sendgrid").lower()
 
     if provider == "sendgrid":
         return SendGridProvider(
             api_key=os.getenv("SENDGRID_API_KEY"),
             from_email=os.getenv("SENDGRID_FROM_EMAIL", "no-reply@example.com"),
+            max_workers=int(os.getenv("EMAIL_SEND_THREADS", "8")),
         )
     # elif provider == "ses":
     #     return SESProvider(...)
-    # elif provider == "smtp":
-    #     return SMTPProvider(...)
+    elif provider == "smtp":
+        return SMTPProvider(
+            host=os.getenv("SMTP_HOST", "localhost"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            from_email=os.getenv("SMTP_FROM_EMAIL", "no-reply@example.com"),
+            username=os.getenv("SMTP_USERNAME"),
+            password=os.getenv("SMTP_PASSWORD"),
+            use_tls=os.getenv("SMTP_USE_TLS", "true").lower() == "true",
+            use_ssl=os.getenv("SMTP_USE_SSL", "false").lower() == "true",
+            pool_size=int(os.getenv("SMTP_POOL_SIZE", "4")),
+        )
     else:
         return ConsoleEmailProvider()
 
 
+# =====================
+# Micro-batching
+# =====================
+class EmailBatcher:
+    """Coalesces send_mail activities on one worker into provider bulk requests.
+
+    Requests with the same body are collected for at most ``max_wait_sec`` or
+    until ``max_size`` of them are waiting, then sent through the provider's
+    ``send_bulk``. Each submitting activity gets back its own result (or the
+    batch's exception), so workflow semantics are unchanged.
+
+    Batches are keyed by the rendered body, so only identical bodies coalesce.
+    Templates rendered with per-recipient context never share a batch and
+    just wait out ``max_wait_sec``.
+    """
+
+    def __init__(self, provider: EmailProvider, max_size: int = 100, max_wait_sec: float = 0.2):
+        self._provider = provider
+        self._max_size = max_size
+        self._max_wait_sec = max_wait_sec
+        self._pending: Dict[str, List[tuple]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        # The loop only keeps weak references to tasks; hold in-flight sends until they finish
+        self._sending: Set[asyncio.Task] = set()
+
+    async def submit(self, request: EmailRequest) -> dict:
+        """Queue a request and wait for the result of the batch it lands in."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = request.body
+        batch = self._pending.setdefault(key, [])
+        batch.append((request, future))
+        if len(batch) >= self._max_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self._max_wait_sec, self._flush, key)
+        return await future
+
+    def _flush(self, key: str) -> None:
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[tuple]) -> None:
+        try:
+            results = await self._provider.send_bulk([request for request, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+@lru_cache(maxsize=1)
+def get_email_batcher() -> Optional[EmailBatcher]:
+    """Per-worker batcher when ``EMAIL_BATCH_ENABLED`` is true, else None."""
+    if os.getenv("EMAIL_BATCH_ENABLED", "false").lower() != "true":
+        return None
+    return EmailBatcher(
+        get_email_provider(),
+        max_size=int(os.getenv("EMAIL_BATCH_MAX_SIZE", "100")),
+        max_wait_sec=int(os.getenv("EMAIL_BATCH_MAX_WAIT_MS", "200")) / 1000,
+    )
+
+
 # =====================
 # Task Handler
 # =====================
 class SendEmailTaskHandler(BaseTaskHandler):
-    """Handler for sending emails in the workflow with pluggable providers."""
+    """Handler for sending emails in the workflow with pluggable providers.
+
+    The provider (and batcher, if enabled) is acquired in ``startup`` and closed
+    in ``shutdown``, so one client/connection pool serves every send on the worker.
+    """
+
+    def __init__(self) -> None:
+        self._provider: Optional[EmailProvider] = None
+        self._batcher: Optional[EmailBatcher] = None
+
+    async def startup(self) -> None:
+        """Create the worker's email provider, batcher and template environment."""
+        self._provider = get_email_provider()
+        self._batcher = get_email_batcher()
+        get_template_environment()
+
+    async def shutdown(self) -> None:
+        """Close the provider and drop the cached instances."""
+        if self._provider is not None:
+            await self._provider.close()
+        self._provider = None
+        self._batcher = None
+        get_email_batcher.cache_clear()
+        get_email_provider.cache_clear()
 
     def validate(self, data: dict) -> SendEmailTaskInput:
         return SendEmailTaskInput(**data)
@@ -181,10 +591,16 @@ class SendEmailTaskHandler(BaseTaskHandler):
         to = data.to if isinstance(data.to, list) else [data.to]
         cc = data.cc if isinstance(data.cc, list) else ([data.cc] if data.cc else [])
         bcc = data.bcc if isinstance(data.bcc, list) else ([data.bcc] if data.bcc else [])
-        provider = get_email_provider()
+        provider = self._provider or get_email_provider()
+        batcher = self._batcher if self._provider else get_email_batcher()
 
         try:
-            result = await provider.send_email(to,data.subject,data.body, cc, bcc)
+            body = render_named_template(data.template, data.context) if data.template else data.body
+            if batcher:
+                request = EmailRequest(to=to, subject=data.subject, body=body, cc=cc, bcc=bcc)
+                result = await batcher.submit(request)
+            else:
+                result = await provider.send_email(to,data.subject,body, cc, bcc)
             status = "COMPLETED" if 200 <= result.get("status_code", 500) < 300 else "FAILED"
 
             return TaskResult(
@@ -193,6 +609,7 @@ class SendEmailTaskHandler(BaseTaskHandler):
                 output={
                     "to": to,
                     "subject": data.subject,
+                    "template": data.template,
                     "provider": provider.__class__.__name__,
                     "status_code": result.get("status_code"),
                 },
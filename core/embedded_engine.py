@@ -0,0 +1,149 @@
+"""
+embedded_engine.py
+
+Runs a DSL in-process, without a Temporal server:
+- The same DSLParser + WorkflowOrchestrator + ExecutorRegistry as DSLWorkflow
+- InProcessTaskExecutor (a TaskExecutor) calls the registered handlers directly: async
+  handlers on the running loop, sync handlers on a thread pool
+- Handlers are created and started on first use and shared across runs
+
+Meant for short request/response DSLs (set variables, decide, call one endpoint) and as a
+fast local test harness. There is no durability, no retries and no history: a failing task
+fails the run. APPROVAL tasks need a human and are rejected up front.
+
+    async with EmbeddedEngine() as engine:
+        result = await engine.run(dsl)
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core.dsl import task_registry
+from core.dsl.dsl_parser import DSLParser
+from core.dsl.schema import DSLModel, TaskModel
+from core.dsl.tasks.base_task_handler import BaseTaskHandler
+from core.workflow.executor_registry import ExecutorRegistry
+from core.workflow.payload_builder import PayloadBuilder
+from core.workflow.progress_tracker import ProgressTracker
+from core.workflow.workflow_orchestrator import WorkflowOrchestrator
+
+logger = logging.getLogger(__name__)
+
+# Task types that wait on signals/updates and therefore only make sense on Temporal
+UNSUPPORTED_TYPES = {"APPROVAL"}
+
+
+class EmbeddedTaskError(RuntimeError):
+    """A task's handler raised; the embedded run stops at that task."""
+
+    def __init__(self, task_ref_name: str, task_type: str, cause: BaseException) -> None:
+        super().__init__(f"Task '{task_ref_name}' ({task_type}) failed: {cause}")
+        self.task_ref_name = task_ref_name
+        self.task_type = task_type
+
+
+class InProcessTaskExecutor:
+    """TaskExecutor that validates and executes a task with its registered handler in this process."""
+
+    def __init__(self, threads: int = 8, registry: Optional[Any] = None) -> None:
+        self._registry = registry if registry is not None else task_registry.task_registry
+        self._handlers: Dict[str, BaseTaskHandler] = {}
+        self._lock = asyncio.Lock()
+        self._threads = threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _handler(self, task_type: str) -> BaseTaskHandler:
+        handler = self._handlers.get(task_type)
+        if handler is not None:
+            return handler
+        async with self._lock:
+            if task_type not in self._handlers:
+                handler = self._registry[task_type]()
+                await handler.startup()
+                self._handlers[task_type] = handler
+                logger.info("Started embedded %s handler", task_type)
+        return self._handlers[task_type]
+
+    async def execute(self, task: TaskModel, dsl: DSLModel) -> Dict[str, Any]:
+        """Runs the handler and returns the result as Temporal would deliver it (JSON-shaped dict)."""
+        task_type = (task.type or "").lower()
+        try:
+            handler = await self._handler(task_type)
+            validated = handler.validate(PayloadBuilder.build(task))
+            if handler.is_sync:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._threads, thread_name_prefix="embedded")
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, handler.execute_sync, validated)
+            else:
+                result = await handler.execute(validated)
+        except Exception as e:
+            raise EmbeddedTaskError(task.taskReferenceName, task.type or "", e) from e
+        return result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+
+    async def shutdown(self) -> None:
+        """Runs the shutdown hook of every handler started so far; failures are logged."""
+        handlers, self._handlers = self._handlers, {}
+        results = await asyncio.gather(*(h.shutdown() for h in handlers.values()), return_exceptions=True)
+        for task_type, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                logger.error("Embedded %s handler failed to shut down: %s", task_type, result)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class EmbeddedEngine:
+    """Evaluates DSLs on the current event loop with in-process handlers."""
+
+    def __init__(self, threads: int = 8, registry: Optional[Any] = None) -> None:
+        self._executor = InProcessTaskExecutor(threads=threads, registry=registry)
+        self._registry = ExecutorRegistry(default_executor=self._executor)
+
+    def register(self, task_type_upper: str, executor: Any) -> None:
+        """Overrides the executor for one task type, e.g. a stub in tests."""
+        self._registry.register(task_type_upper, executor)
+
+    async def run(self, data: Dict[str, Any], timeout_sec: Optional[float] = None) -> Dict[str, Any]:
+        """Runs one DSL to completion and returns status, per-task timings and full outputs.
+
+        Raises ValueError for APPROVAL tasks, pydantic's ValidationError for an invalid DSL,
+        EmbeddedTaskError when a handler fails and asyncio.TimeoutError after ``timeout_sec``.
+        """
+        started = time.perf_counter()
+        parser = DSLParser(data)
+        tasks: List[TaskModel] = parser.get_tasks()
+        unsupported = sorted({t.taskReferenceName for t in tasks if (t.type or "").upper() in UNSUPPORTED_TYPES})
+        if unsupported:
+            raise ValueError(f"Tasks {unsupported} need human input and can only run on Temporal")
+
+        progress = ProgressTracker()
+        orchestrator = WorkflowOrchestrator(registry=self._registry, progress=progress)
+        await asyncio.wait_for(orchestrator.run(tasks=tasks, dsl=parser.dsl), timeout_sec)
+        return {
+            "name": parser.dsl.name,
+            "status": progress.status,
+            "completed": list(progress.completed),
+            "outputs": {t.taskReferenceName: t.output.output for t in tasks if t.output is not None},
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    async def shutdown(self) -> None:
+        await self._executor.shutdown()
+
+    async def __aenter__(self) -> "EmbeddedEngine":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.shutdown()
+
+
+async def run_dsl(data: Dict[str, Any], timeout_sec: Optional[float] = None) -> Dict[str, Any]:
+    """One-shot convenience wrapper; keep an EmbeddedEngine around to reuse handlers across runs."""
+    async with EmbeddedEngine() as engine:
+        return await engine.run(data, timeout_sec=timeout_sec)
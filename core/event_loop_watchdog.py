@@ -0,0 +1,149 @@
+"""
+event_loop_watchdog.py
+
+Detects a blocked worker event loop:
+- A coroutine on the loop ticks every ``interval_sec`` and records how late each tick was
+  (event-loop lag)
+- A watchdog thread notices when the tick is overdue by more than ``threshold_sec``. It then
+  captures the loop thread's stack and the activity whose code is on it (found through the
+  make_activity wrapper frame)
+- When the loop comes back, the stall's duration is logged, counted in metrics and kept in a
+  short history for /debug/event-loop
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.metrics import dsl_metrics
+
+logger = logging.getLogger(__name__)
+
+# Name of the async activity wrapper built by core.workflow.make_activity
+_ACTIVITY_FRAMES = ("_activity",)
+
+
+@dataclass
+class Stall:
+    started_at: float
+    activity_type: Optional[str]
+    task_ref_name: Optional[str]
+    stack: List[str]
+    duration_sec: Optional[float] = None
+
+
+def _blocking_activity(frame) -> Tuple[Optional[str], Optional[str]]:
+    """Finds the make_activity wrapper on the loop stack and returns (activity type, task ref)."""
+    while frame is not None:
+        code = frame.f_code
+        if code.co_name in _ACTIVITY_FRAMES and code.co_filename.endswith("make_activity.py"):
+            try:
+                local_vars = frame.f_locals
+                payload = local_vars.get("payload")
+                task_ref = payload.get("task_ref_name") if isinstance(payload, dict) else None
+                return local_vars.get("metric_type"), task_ref
+            except Exception:  # pragma: no cover - frame torn down underneath us
+                return None, None
+        frame = frame.f_back
+    return None, None
+
+
+class EventLoopWatchdog:
+    """Measures loop lag and reports callbacks that block the loop longer than a threshold."""
+
+    def __init__(self, threshold_sec: float = 0.25, interval_sec: float = 0.05, history: int = 20) -> None:
+        self.threshold_sec = threshold_sec
+        self.interval_sec = interval_sec
+        self.stalls: Deque[Stall] = deque(maxlen=history)
+        self.stall_count = 0
+        self.max_lag_sec = 0.0
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._tick_task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def _tick(self) -> None:
+        while True:
+            scheduled = time.monotonic()
+            await asyncio.sleep(self.interval_sec)
+            now = time.monotonic()
+            lag = max(0.0, now - scheduled - self.interval_sec)
+            self._last_tick = now
+            self.max_lag_sec = max(self.max_lag_sec, lag)
+            metrics = dsl_metrics()
+            if metrics is not None:
+                metrics.loop_lag.record(lag)
+
+    def _watch(self) -> None:
+        current: Optional[Stall] = None
+        stalled_tick = 0.0
+        while not self._stop.wait(self.interval_sec):
+            last_tick = self._last_tick
+            overdue = time.monotonic() - last_tick - self.interval_sec
+            if current is None and overdue > self.threshold_sec:
+                current, stalled_tick = self._capture(overdue), last_tick
+            elif current is not None and last_tick != stalled_tick:
+                self._finish(current, last_tick - stalled_tick - self.interval_sec)
+                current = None
+
+    def _capture(self, overdue: float) -> Stall:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        activity_type, task_ref = _blocking_activity(frame)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        stall = Stall(time.time() - overdue, activity_type, task_ref, stack)
+        logger.warning(
+            "Event loop blocked for >%.0f ms (activity=%s, task_ref=%s); loop thread stack:\n%s",
+            overdue * 1000, activity_type, task_ref, "".join(stack),
+        )
+        return stall
+
+    def _finish(self, stall: Stall, duration: float) -> None:
+        stall.duration_sec = duration
+        self.stall_count += 1
+        self.stalls.append(stall)
+        logger.warning("Event loop stall ended after %.0f ms (activity=%s)", duration * 1000, stall.activity_type)
+        metrics = dsl_metrics()
+        if metrics is not None:
+            attributes = {"activity_type": stall.activity_type or "unknown"}
+            metrics.loop_stalls.add(1, attributes)
+            metrics.loop_stall_duration.record(duration, attributes)
+
+    def start(self) -> None:
+        """Starts ticking on the running loop and the watchdog thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._tick_task = asyncio.get_running_loop().create_task(self._tick())
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info("Event-loop watchdog started (threshold=%.0f ms)", self.threshold_sec * 1000)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._tick_task:
+            self._tick_task.cancel()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters and the most recent stalls, newest first."""
+        return {
+            "threshold_ms": self.threshold_sec * 1000,
+            "stall_count": self.stall_count,
+            "max_lag_ms": round(self.max_lag_sec * 1000, 3),
+            "recent_stalls": [
+                {
+                    "started_at": s.started_at,
+                    "duration_ms": round(s.duration_sec * 1000, 1) if s.duration_sec is not None else None,
+                    "activity_type": s.activity_type,
+                    "task_ref_name": s.task_ref_name,
+                    "stack": s.stack,
+                }
+                for s in reversed(self.stalls)
+            ],
+        }
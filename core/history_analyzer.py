@@ -0,0 +1,346 @@
+"""
+history_analyzer.py
+
+Offline analysis of exported DSLWorkflow histories (``temporal workflow show -o json``
+or ``WorkflowHandle.fetch_history().to_json()``):
+- Maps activity events back to DSL ``taskReferenceName``s via the activity input
+- Breaks every task into queue wait (schedule-to-start), retry time and execution
+- Walks the critical path from workflow close back to start, attributing gaps between
+  tasks to workflow tasks, timers or waits for signals/updates (approvals)
+- Aggregates a directory of histories per task type and says whether queue wait
+  (worker capacity) or execution (downstream latency) dominates
+
+Usage:
+    python -m core.history_analyzer history.json
+    python -m core.history_analyzer histories/ [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import WorkflowHistory
+from temporalio.converter import DataConverter
+
+_CLOSED_ACTIVITY = {
+    EventType.EVENT_TYPE_ACTIVITY_TASK_COMPLETED: ("COMPLETED", "activity_task_completed_event_attributes"),
+    EventType.EVENT_TYPE_ACTIVITY_TASK_FAILED: ("FAILED", "activity_task_failed_event_attributes"),
+    EventType.EVENT_TYPE_ACTIVITY_TASK_TIMED_OUT: ("TIMED_OUT", "activity_task_timed_out_event_attributes"),
+    EventType.EVENT_TYPE_ACTIVITY_TASK_CANCELED: ("CANCELED", "activity_task_canceled_event_attributes"),
+}
+_CLOSED_WORKFLOW = {
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED: "COMPLETED",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED: "FAILED",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TIMED_OUT: "TIMED_OUT",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED: "TERMINATED",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CANCELED: "CANCELED",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW: "CONTINUED_AS_NEW",
+}
+_HUMAN_INPUT = {
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_SIGNALED,
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_UPDATE_ACCEPTED,
+}
+
+
+@dataclass
+class TaskTiming:
+    """One DSL task's activity, in seconds relative to workflow start."""
+    task_ref_name: str
+    activity_type: str
+    scheduled: float
+    started: Optional[float] = None
+    closed: Optional[float] = None
+    attempt: int = 1
+    status: str = "RUNNING"
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Schedule-to-start; only known for first attempts (history keeps the last start only)."""
+        if self.started is None or self.attempt > 1:
+            return None
+        return self.started - self.scheduled
+
+    @property
+    def retry_time(self) -> float:
+        """Failed attempts, backoff and the final attempt's queue wait."""
+        if self.started is None or self.attempt == 1:
+            return 0.0
+        return self.started - self.scheduled
+
+    @property
+    def execution(self) -> Optional[float]:
+        if self.started is None or self.closed is None:
+            return None
+        return self.closed - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "queue_wait": self.queue_wait,
+            "retry_time": self.retry_time,
+            "execution": self.execution,
+        }
+
+
+@dataclass
+class Segment:
+    """One piece of the critical path."""
+    kind: str  # queue_wait | retry | execution | workflow_task | timer | human_wait | idle
+    seconds: float
+    task_ref_name: Optional[str] = None
+
+
+@dataclass
+class RunAnalysis:
+    workflow_id: str
+    dsl_name: Optional[str]
+    status: str
+    duration: float
+    tasks: List[TaskTiming] = field(default_factory=list)
+    critical_path: List[Segment] = field(default_factory=list)
+
+    def path_totals(self) -> Dict[str, float]:
+        totals: Dict[str, float] = defaultdict(float)
+        for segment in self.critical_path:
+            totals[segment.kind] += segment.seconds
+        return dict(totals)
+
+
+def _nanos(event) -> int:
+    return event.event_time.ToNanoseconds()
+
+
+def _task_ref(converter: DataConverter, payloads) -> Optional[str]:
+    try:
+        values = converter.payload_converter.from_payloads(list(payloads.payloads))
+    except Exception:
+        return None
+    if values and isinstance(values[0], dict):
+        return values[0].get("task_ref_name")
+    return None
+
+
+def analyze_history(workflow_id: str, history: Any) -> RunAnalysis:
+    """Analyzes one exported history (JSON string or dict)."""
+    converter = DataConverter.default
+    events = list(WorkflowHistory.from_json(workflow_id, history).events)
+    if not events:
+        raise ValueError(f"History for {workflow_id} has no events")
+    origin = _nanos(events[0])
+
+    dsl_name: Optional[str] = None
+    status, end = "RUNNING", (_nanos(events[-1]) - origin) / 1e9
+    tasks: Dict[int, TaskTiming] = {}
+    workflow_tasks: List[tuple] = []  # (scheduled, started, completed)
+    wft_open: Dict[int, List[float]] = {}
+    timers: List[tuple] = []
+    timer_open: Dict[int, float] = {}
+    human_inputs: List[float] = []
+
+    for event in events:
+        t, kind = (_nanos(event) - origin) / 1e9, event.event_type
+        if kind == EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED:
+            attrs = event.workflow_execution_started_event_attributes
+            try:
+                dsl = converter.payload_converter.from_payloads(list(attrs.input.payloads))[0]
+                dsl_name = dsl.get("name") if isinstance(dsl, dict) else None
+            except Exception:
+                pass
+        elif kind == EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED:
+            attrs = event.activity_task_scheduled_event_attributes
+            tasks[event.event_id] = TaskTiming(
+                task_ref_name=_task_ref(converter, attrs.input) or attrs.activity_id,
+                activity_type=attrs.activity_type.name,
+                scheduled=t,
+            )
+        elif kind == EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED:
+            attrs = event.activity_task_started_event_attributes
+            task = tasks.get(attrs.scheduled_event_id)
+            if task:
+                task.started, task.attempt = t, max(1, attrs.attempt)
+        elif kind in _CLOSED_ACTIVITY:
+            task_status, field_name = _CLOSED_ACTIVITY[kind]
+            task = tasks.get(getattr(event, field_name).scheduled_event_id)
+            if task:
+                task.closed, task.status = t, task_status
+        elif kind == EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED:
+            wft_open[event.event_id] = [t, None]
+        elif kind == EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED:
+            opened = wft_open.get(event.workflow_task_started_event_attributes.scheduled_event_id)
+            if opened:
+                opened[1] = t
+        elif kind == EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED:
+            opened = wft_open.pop(event.workflow_task_completed_event_attributes.scheduled_event_id, None)
+            if opened:
+                workflow_tasks.append((opened[0], opened[1] if opened[1] is not None else opened[0], t))
+        elif kind == EventType.EVENT_TYPE_TIMER_STARTED:
+            timer_open[event.event_id] = t
+        elif kind == EventType.EVENT_TYPE_TIMER_FIRED:
+            started = timer_open.pop(event.timer_fired_event_attributes.started_event_id, None)
+            if started is not None:
+                timers.append((started, t))
+        elif kind in _HUMAN_INPUT:
+            human_inputs.append(t)
+        elif kind in _CLOSED_WORKFLOW:
+            status, end = _CLOSED_WORKFLOW[kind], t
+
+    ordered = sorted(tasks.values(), key=lambda task: task.scheduled)
+    path = _critical_path(ordered, end, workflow_tasks, timers, human_inputs)
+    return RunAnalysis(workflow_id, dsl_name, status, end, ordered, path)
+
+
+def _gap_segments(start: float, end: float, workflow_tasks, timers, human_inputs) -> List[Segment]:
+    """Explains the time between two points on the path that no activity covers."""
+    if end - start <= 0:
+        return []
+    wft = sum(max(0.0, min(c, end) - max(s, start)) for s, _, c in workflow_tasks)
+    timer = sum(max(0.0, min(f, end) - max(s, start)) for s, f in timers)
+    rest = max(0.0, end - start - wft - timer)
+    waited_for_human = any(start <= t <= end for t in human_inputs)
+    segments = [Segment("workflow_task", wft), Segment("timer", timer),
+                Segment("human_wait" if waited_for_human else "idle", rest)]
+    return [segment for segment in segments if segment.seconds > 0]
+
+
+def _critical_path(tasks: List[TaskTiming], end: float, workflow_tasks, timers, human_inputs) -> List[Segment]:
+    """Walks back from workflow close: the latest task closing before the cursor, then its schedule."""
+    path: List[Segment] = []
+    cursor = end
+    remaining = [task for task in tasks if task.closed is not None]
+    while True:
+        candidates = [task for task in remaining if task.closed <= cursor]
+        if not candidates:
+            path[:0] = _gap_segments(0.0, cursor, workflow_tasks, timers, human_inputs)
+            break
+        task = max(candidates, key=lambda task: task.closed)
+        remaining = [other for other in remaining if other.closed <= task.scheduled]
+        segments = _gap_segments(task.closed, cursor, workflow_tasks, timers, human_inputs)
+        own: List[Segment] = []
+        if task.started is None:
+            own.append(Segment("queue_wait", task.closed - task.scheduled, task.task_ref_name))
+        else:
+            if task.attempt > 1:
+                own.append(Segment("retry", task.retry_time, task.task_ref_name))
+            else:
+                own.append(Segment("queue_wait", task.queue_wait or 0.0, task.task_ref_name))
+            own.append(Segment("execution", task.execution or 0.0, task.task_ref_name))
+        path[:0] = own + segments
+        cursor = task.scheduled
+    return path
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def aggregate(runs: List[RunAnalysis]) -> Dict[str, Any]:
+    """Per-activity-type distributions and a bottleneck verdict across runs."""
+    by_type: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for run in runs:
+        for task in run.tasks:
+            stats = by_type[task.activity_type]
+            for name in ("queue_wait", "retry_time", "execution"):
+                value = getattr(task, name)
+                if value is not None:
+                    stats[name].append(value)
+    per_type = {
+        activity_type: {
+            name: {
+                "count": len(values),
+                "mean": statistics.fmean(values) if values else None,
+                "p50": _percentile(values, 0.5),
+                "p95": _percentile(values, 0.95),
+            }
+            for name, values in stats.items()
+        }
+        for activity_type, stats in by_type.items()
+    }
+
+    totals: Dict[str, float] = defaultdict(float)
+    for run in runs:
+        for kind, seconds in run.path_totals().items():
+            totals[kind] += seconds
+    busy = sum(totals.values()) or 1.0
+    shares = {kind: seconds / busy for kind, seconds in totals.items()}
+    capacity = shares.get("queue_wait", 0.0) + shares.get("workflow_task", 0.0)
+    downstream = shares.get("execution", 0.0) + shares.get("retry", 0.0)
+    if capacity > downstream:
+        verdict = "worker capacity: critical paths spend more time queued than executing"
+    elif downstream > 0:
+        verdict = "downstream latency: critical paths are dominated by activity execution/retries"
+    else:
+        verdict = "neither: time is spent waiting on humans, timers or idle"
+    return {"runs": len(runs), "per_activity_type": per_type, "critical_path_share": shares, "bottleneck": verdict}
+
+
+def load_runs(paths: List[str]) -> List[RunAnalysis]:
+    """Analyzes every *.json file given directly or inside given directories."""
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, f) for f in os.listdir(path) if f.endswith(".json")))
+        else:
+            files.append(path)
+    runs = []
+    for file in files:
+        with open(file) as f:
+            runs.append(analyze_history(os.path.splitext(os.path.basename(file))[0], json.load(f)))
+    return runs
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.1f}ms" if value < 1 else f"{value:.2f}s"
+
+
+def print_run(run: RunAnalysis) -> None:
+    print(f"\n{run.workflow_id} ({run.dsl_name or '?'}) {run.status} in {_fmt(run.duration)}")
+    print(f"  {'task':<24} {'type':<20} {'queue':>9} {'retry':>9} {'exec':>9} {'attempt':>7} status")
+    for task in run.tasks:
+        print(
+            f"  {task.task_ref_name:<24} {task.activity_type:<20} {_fmt(task.queue_wait):>9} "
+            f"{_fmt(task.retry_time):>9} {_fmt(task.execution):>9} {task.attempt:>7} {task.status}"
+        )
+    print("  critical path: " + " -> ".join(
+        f"{s.kind}{'(' + s.task_ref_name + ')' if s.task_ref_name else ''} {_fmt(s.seconds)}" for s in run.critical_path
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="history JSON files or directories of them")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args()
+
+    runs = load_runs(args.paths)
+    if not runs:
+        sys.exit("No histories found")
+    summary = aggregate(runs)
+    if args.json:
+        print(json.dumps({
+            "runs": [
+                {**asdict(run), "tasks": [t.as_dict() for t in run.tasks], "critical_path_totals": run.path_totals()}
+                for run in runs
+            ],
+            "summary": summary,
+        }, indent=2))
+        return
+
+    for run in runs:
+        print_run(run)
+    print(f"\nAcross {summary['runs']} run(s), critical path share:")
+    for kind, share in sorted(summary["critical_path_share"].items(), key=lambda kv: -kv[1]):
+        print(f"  {kind:<14} {share:6.1%}")
+    print(f"Bottleneck: {summary['bottleneck']}")
+
+
+if __name__ == "__main__":
+    main()
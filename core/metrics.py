@@ -0,0 +1,108 @@
+"""
+metrics.py
+
+Prometheus metrics for the DSL worker, all emitted through the Temporal SDK runtime:
+- The runtime's Prometheus exporter listens on 127.0.0.1:<metrics_port> and carries the
+  SDK's own worker metrics (poll latency, schedule-to-start latency, sticky cache hits,
+  slot usage, ...) plus the DSL histograms below.
+- The worker's health server re-serves that exporter at /metrics.
+
+Activity-side histograms are recorded on the runtime meter. Workflow-side ones go through
+``workflow.metric_meter()``, which the SDK skips during replay.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from temporalio.common import MetricCounter, MetricHistogram, MetricHistogramFloat, MetricMeter
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
+
+logger = logging.getLogger(__name__)
+
+TASK_EXECUTION_LATENCY = "dsl_task_execution_latency"
+TASK_PAYLOAD_BYTES = "dsl_task_payload_bytes"
+DECISION_EVALUATION_LATENCY = "dsl_decision_evaluation_latency"
+RESOLVER_LATENCY = "dsl_resolver_latency"
+EVENT_LOOP_LAG = "dsl_event_loop_lag"
+EVENT_LOOP_STALLS = "dsl_event_loop_stalls"
+EVENT_LOOP_STALL_DURATION = "dsl_event_loop_stall_duration"
+
+# Seconds; DSL timings are often sub-millisecond, so they are float histograms with fine buckets
+_FAST_BUCKETS = [0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5]
+BUCKETS: Dict[str, List[float]] = {
+    TASK_EXECUTION_LATENCY: [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+    TASK_PAYLOAD_BYTES: [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304],
+    DECISION_EVALUATION_LATENCY: _FAST_BUCKETS,
+    RESOLVER_LATENCY: _FAST_BUCKETS,
+    EVENT_LOOP_LAG: [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5],
+    EVENT_LOOP_STALL_DURATION: [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60],
+}
+
+
+@dataclass
+class DSLMetrics:
+    """Histograms recorded from activities and the worker's event-loop watchdog."""
+    task_execution: MetricHistogramFloat
+    payload_bytes: MetricHistogram
+    decision_evaluation: MetricHistogramFloat
+    loop_lag: MetricHistogramFloat
+    loop_stalls: MetricCounter
+    loop_stall_duration: MetricHistogramFloat
+
+    @classmethod
+    def create(cls, meter: MetricMeter) -> "DSLMetrics":
+        return cls(
+            task_execution=meter.create_histogram_float(
+                TASK_EXECUTION_LATENCY, "Handler execution time per task type and status", "s"
+            ),
+            payload_bytes=meter.create_histogram(
+                TASK_PAYLOAD_BYTES, "JSON size of task inputs and outputs", "bytes"
+            ),
+            decision_evaluation=meter.create_histogram_float(
+                DECISION_EVALUATION_LATENCY, "Time to pick a DECISION case", "s"
+            ),
+            loop_lag=meter.create_histogram_float(
+                EVENT_LOOP_LAG, "Delay of the worker event loop's periodic tick", "s"
+            ),
+            loop_stalls=meter.create_counter(
+                EVENT_LOOP_STALLS, "Event-loop stalls over the threshold, by activity type"
+            ),
+            loop_stall_duration=meter.create_histogram_float(
+                EVENT_LOOP_STALL_DURATION, "How long the event loop was blocked per stall", "s"
+            ),
+        )
+
+
+_metrics: Optional[DSLMetrics] = None
+
+
+def init_runtime(metrics_port: int) -> Runtime:
+    """Creates the Temporal runtime with a Prometheus exporter and makes it the default."""
+    global _metrics
+    runtime = Runtime(
+        telemetry=TelemetryConfig(
+            metrics=PrometheusConfig(
+                bind_address=f"127.0.0.1:{metrics_port}",
+                durations_as_seconds=True,
+                histogram_bucket_overrides=BUCKETS,
+            )
+        )
+    )
+    Runtime.set_default(runtime, error_if_already_set=False)
+    _metrics = DSLMetrics.create(runtime.metric_meter)
+    logger.info("Temporal runtime metrics exported on 127.0.0.1:%s", metrics_port)
+    return runtime
+
+
+def dsl_metrics() -> Optional[DSLMetrics]:
+    """The activity-side histograms, or None when metrics are disabled."""
+    return _metrics
+
+
+def payload_size(value: Any) -> int:
+    """Approximate serialized size of a task payload or result."""
+    if hasattr(value, "model_dump_json"):
+        return len(value.model_dump_json())
+    return len(json.dumps(value, default=str))
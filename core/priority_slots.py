@@ -0,0 +1,152 @@
+"""
+priority_slots.py
+
+Weighted slot sharing across priority lanes (see core.workflow.priority_lanes):
+- One pool of ``capacity`` slots is shared by the SDK workers of every lane's task queue
+- While nobody waits, any lane takes a free slot, so bulk work soaks up idle capacity
+- Once slots run out, each freed slot goes to the waiting lane with the fewest slots per
+  unit of weight, so under contention lanes converge on their weighted share
+
+Slots are counted from reservation, which the SDK makes before each poll, so idle pollers
+hold a few slots per lane.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional
+
+from temporalio.worker import (
+    CustomSlotSupplier,
+    FixedSizeSlotSupplier,
+    SlotMarkUsedContext,
+    SlotPermit,
+    SlotReleaseContext,
+    SlotReserveContext,
+    WorkerTuner,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LanePermit(SlotPermit):
+    def __init__(self, task_queue: str) -> None:
+        self.task_queue = task_queue
+
+
+class WeightedSlotSupplier(CustomSlotSupplier):
+    """Work-conserving weighted fair sharing of ``capacity`` slots between task queues.
+
+    ``weights`` maps task queue -> weight; queues not listed get ``default_weight``. The SDK may
+    call release/try-reserve off the event loop, so state is guarded by a thread lock.
+    """
+
+    def __init__(self, capacity: int, weights: Dict[str, int], default_weight: int = 1) -> None:
+        self.capacity = capacity
+        self.weights = dict(weights)
+        self.default_weight = default_weight
+        self._lock = threading.Lock()
+        self._issued: Dict[str, int] = defaultdict(int)
+        self._used: Dict[str, int] = defaultdict(int)
+        self._waiters: Dict[str, Deque[asyncio.Future]] = defaultdict(deque)
+
+    def _total(self) -> int:
+        return sum(self._issued.values())
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiters.values())
+
+    def _share(self, task_queue: str) -> float:
+        return self._issued[task_queue] / self.weights.get(task_queue, self.default_weight)
+
+    def _grant(self, task_queue: str) -> LanePermit:
+        self._issued[task_queue] += 1
+        return LanePermit(task_queue)
+
+    def _dispatch(self) -> None:
+        """Hands free slots to waiters, lowest weighted share first. Caller holds the lock."""
+        while self._total() < self.capacity:
+            lanes = [q for q, waiters in self._waiters.items() if waiters]
+            if not lanes:
+                return
+            task_queue = min(lanes, key=self._share)
+            future = self._waiters[task_queue].popleft()
+            if future.done():
+                continue
+            future.get_loop().call_soon_threadsafe(self._resolve, future, self._grant(task_queue))
+
+    def _resolve(self, future: asyncio.Future, permit: LanePermit) -> None:
+        if future.done():
+            # Cancelled between dispatch and resolution; give the slot back
+            self._release(permit.task_queue)
+        else:
+            future.set_result(permit)
+
+    def _release(self, task_queue: str) -> None:
+        with self._lock:
+            self._issued[task_queue] -= 1
+            self._dispatch()
+
+    async def reserve_slot(self, ctx: SlotReserveContext) -> SlotPermit:
+        with self._lock:
+            if self._total() < self.capacity and not self._has_waiters():
+                return self._grant(ctx.task_queue)
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[ctx.task_queue].append(future)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters[ctx.task_queue]:
+                    self._waiters[ctx.task_queue].remove(future)
+            raise
+
+    def try_reserve_slot(self, ctx: SlotReserveContext) -> Optional[SlotPermit]:
+        with self._lock:
+            if self._total() < self.capacity and not self._has_waiters():
+                return self._grant(ctx.task_queue)
+        return None
+
+    def mark_slot_used(self, ctx: SlotMarkUsedContext) -> None:
+        if isinstance(ctx.permit, LanePermit):
+            with self._lock:
+                self._used[ctx.permit.task_queue] += 1
+
+    def release_slot(self, ctx: SlotReleaseContext) -> None:
+        if not isinstance(ctx.permit, LanePermit):
+            return
+        if ctx.slot_info is not None:
+            with self._lock:
+                self._used[ctx.permit.task_queue] -= 1
+        self._release(ctx.permit.task_queue)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Slots reserved and in use per task queue, and reservations waiting."""
+        with self._lock:
+            queues = set(self._issued) | set(self._waiters)
+            return {
+                "capacity": self.capacity,
+                "queues": {
+                    q: {
+                        "weight": self.weights.get(q, self.default_weight),
+                        "reserved": self._issued[q],
+                        "used": self._used[q],
+                        "waiting": len(self._waiters[q]),
+                    }
+                    for q in sorted(queues)
+                },
+            }
+
+
+def lane_tuner(
+    workflow_slots: WeightedSlotSupplier,
+    activity_slots: WeightedSlotSupplier,
+    local_activity_slots: int = 100,
+) -> WorkerTuner:
+    """A tuner to share between every lane's SDK worker."""
+    return WorkerTuner.create_composite(
+        workflow_supplier=workflow_slots,
+        activity_supplier=activity_slots,
+        local_activity_supplier=FixedSizeSlotSupplier(local_activity_slots),
+    )
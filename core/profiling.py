@@ -0,0 +1,190 @@
+"""
+profiling.py
+
+On-demand profiling for a running worker:
+- SamplingProfiler: samples every thread's stack at a fixed interval for a time-boxed
+  window and returns collapsed ("folded") stacks, the input format of flamegraph.pl,
+  speedscope and inferno
+- MemoryProfiler: tracemalloc snapshot over a time-boxed window, folded by allocation
+  traceback with bytes as the weight
+- SlowActivityRecorder: keeps the slowest activity executions with their task refs
+"""
+
+import heapq
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+class _TimeBoxed(ABC):
+    """Start/stop bookkeeping shared by the profilers; a window stops itself at its deadline."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._result: Optional[str] = None
+        self.running = False
+        self.started_at: Optional[float] = None
+
+    def start(self, seconds: float) -> None:
+        with self._lock:
+            if self.running:
+                raise RuntimeError(f"{type(self).__name__} is already running")
+            self.running, self.started_at, self._result = True, time.time(), None
+            self._begin()
+            self._timer = threading.Timer(seconds, self.stop)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def stop(self) -> str:
+        """Ends the window (if still open) and returns the folded output."""
+        with self._lock:
+            if self.running:
+                if self._timer:
+                    self._timer.cancel()
+                self._result = self._end()
+                self.running = False
+            if self._result is None:
+                raise RuntimeError(f"{type(self).__name__} has not been started")
+            return self._result
+
+    @abstractmethod
+    def _begin(self) -> None:
+        """Starts collecting; called with the lock held."""
+        ...
+
+    @abstractmethod
+    def _end(self) -> str:
+        """Stops collecting and returns the folded output; called with the lock held."""
+        ...
+
+
+class SamplingProfiler(_TimeBoxed):
+    """Wall-clock stack sampler over all threads (``sys._current_frames``)."""
+
+    def __init__(self, interval_sec: float = 0.01) -> None:
+        super().__init__()
+        self.interval_sec = interval_sec
+        self._stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval_sec):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def _begin(self) -> None:
+        self._stacks.clear()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def _end(self) -> str:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+
+class MemoryProfiler(_TimeBoxed):
+    """Allocations made during the window that are still alive at its end (tracemalloc)."""
+
+    def __init__(self, frames: int = 25) -> None:
+        super().__init__()
+        self.frames = frames
+        self._was_tracing = False
+
+    def _begin(self) -> None:
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start(self.frames)
+
+    def _end(self) -> str:
+        snapshot = tracemalloc.take_snapshot()
+        if not self._was_tracing:
+            tracemalloc.stop()
+        lines = []
+        for stat in snapshot.statistics("traceback"):
+            stack = ";".join(f"{f.filename}:{f.lineno}" for f in reversed(stat.traceback))
+            lines.append(f"{stack} {stat.size}\n")
+        return "".join(lines)
+
+
+@dataclass(order=True)
+class SlowActivity:
+    duration_ms: float
+    task_type: str = field(compare=False)
+    task_ref_name: Optional[str] = field(compare=False)
+    workflow_id: Optional[str] = field(compare=False)
+    status: str = field(compare=False)
+    finished_at: float = field(compare=False)
+
+
+class SlowActivityRecorder:
+    """Keeps the ``top_n`` slowest activity executions at or above ``threshold_ms``."""
+
+    def __init__(self, threshold_ms: float = 0.0, top_n: int = 20) -> None:
+        self.threshold_ms = threshold_ms
+        self.top_n = top_n
+        self._heap: List[SlowActivity] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        task_type: str,
+        duration_sec: float,
+        task_ref_name: Optional[str],
+        workflow_id: Optional[str],
+        status: str,
+    ) -> None:
+        duration_ms = duration_sec * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        entry = SlowActivity(duration_ms, task_type, task_ref_name, workflow_id, status, time.time())
+        if self.threshold_ms:
+            logger.warning(
+                "Slow %s activity %s (workflow %s): %.1f ms", task_type, task_ref_name, workflow_id, duration_ms
+            )
+        with self._lock:
+            if len(self._heap) < self.top_n:
+                heapq.heappush(self._heap, entry)
+            elif entry > self._heap[0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Slowest first."""
+        with self._lock:
+            entries = sorted(self._heap, reverse=True)
+        return [
+            {
+                "task_type": e.task_type,
+                "task_ref_name": e.task_ref_name,
+                "workflow_id": e.workflow_id,
+                "status": e.status,
+                "duration_ms": round(e.duration_ms, 3),
+                "finished_at": e.finished_at,
+            }
+            for e in entries
+        ]
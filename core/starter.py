@@ -0,0 +1,76 @@
+"""
+starter.py
+
+Starts DSLWorkflow runs; shared by client.py and the API.
+
+With ``eager=True`` the start request asks the server to hand the first workflow task
+straight back in the start response (eager workflow start). That only happens when a worker
+for ``task_queue`` runs in this process on the *same* Client instance and has a free
+workflow slot; otherwise the server silently falls back to a normal start.
+
+``priority`` (or the DSL's ``priority``) picks a lane: it always sets Temporal task priority,
+and with ``TEMPORAL_PRIORITY_LANES`` configured it also routes the run to the lane's task queue
+(see core.workflow.priority_lanes).
+
+``DSL_INDEX_APPROVALS=false`` starts runs with ``indexApprovals`` off, so APPROVAL tasks do not
+upsert search attributes that the namespace has not registered; a DSL's own value wins.
+"""
+
+import logging
+import os
+import uuid
+from typing import Any, Dict, Optional
+
+from temporalio.client import Client, WorkflowHandle
+from temporalio.common import Priority
+
+from core.workflow.priority_lanes import LANES, PRIORITY_LANES, lane_task_queue, temporal_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TASK_QUEUE = os.getenv("TEMPORAL_TASK_QUEUE", "dsl-task-queue")
+# Off for namespaces without the DSLPendingApprovals/... search attributes registered
+INDEX_APPROVALS = os.getenv("DSL_INDEX_APPROVALS", "true").strip().lower() in ("1", "true", "yes", "on")
+
+
+async def start_dsl_workflow(
+    client: Client,
+    dsl: Dict[str, Any],
+    workflow_id: Optional[str] = None,
+    task_queue: Optional[str] = None,
+    eager: bool = False,
+    priority: Optional[str] = None,
+) -> WorkflowHandle:
+    """Starts one DSLWorkflow run and returns its handle."""
+    workflow_id = workflow_id or f"workflow-{uuid.uuid4().hex[:12]}"
+    lane = priority or dsl.get("priority")
+    if lane not in (None, *LANES):
+        raise ValueError(f"priority must be one of {LANES}, got {lane!r}")
+    if priority:
+        # The workflow reads the lane from the DSL to pin its activities' priority
+        dsl = {**dsl, "priority": priority}
+    if "indexApprovals" not in dsl:
+        # Fixed in the workflow input, so replays upsert exactly what the original run did
+        dsl = {**dsl, "indexApprovals": INDEX_APPROVALS}
+    task_queue = task_queue or DEFAULT_TASK_QUEUE
+    if lane in PRIORITY_LANES:
+        task_queue = lane_task_queue(task_queue, lane)
+    handle = await client.start_workflow(
+        "DSLWorkflow",
+        dsl,
+        id=workflow_id,
+        task_queue=task_queue,
+        request_eager_start=eager,
+        priority=temporal_priority(lane) or Priority.default,
+    )
+    logger.info(
+        "Started %s on %s (dsl=%s, priority=%s, eager requested=%s, eagerly started=%s)",
+        workflow_id, task_queue, dsl.get("name"), lane, eager, eagerly_started(handle),
+    )
+    return handle
+
+
+def eagerly_started(handle: WorkflowHandle) -> bool:
+    """Whether the server handed the first workflow task to an in-process worker."""
+    # Set by the SDK on handles returned from start_workflow
+    return bool(getattr(handle, "__temporal_eagerly_started", False))
@@ -0,0 +1,209 @@
+"""
+supervisor.py
+
+Multi-process supervisor for the DSL worker:
+- Spawns N worker processes sharing one WorkerConfig (same YAML/env/overrides)
+- Gives each child its own health and metrics ports (base port + 1 + index);
+  scrape each child's /metrics on its health port
+- Aggregates the children's probes behind the supervisor's /health and /ready
+- Restarts crashed children with exponential backoff
+- Forwards SIGTERM/SIGINT so children drain gracefully, then kills stragglers
+"""
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Response
+
+from core.worker import WorkerConfig
+
+logger = logging.getLogger("worker_supervisor")
+
+RESTART_BACKOFF_SEC = 1.0
+MAX_RESTART_BACKOFF_SEC = 60.0
+# A child that stays up this long is considered healthy again and its backoff resets
+STABLE_AFTER_SEC = 60.0
+MONITOR_INTERVAL_SEC = 1.0
+PROBE_TIMEOUT_SEC = 2.0
+
+
+@dataclass
+class _Child:
+    """Book-keeping for one worker process slot."""
+    index: int
+    health_port: int
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    started_at: float = 0.0
+    restarts: int = 0
+    failures: int = 0
+    restart_at: Optional[float] = None
+
+
+class WorkerSupervisor:
+    """Runs ``config.processes`` copies of ``target(config_path, overrides)`` in child processes.
+
+    ``target`` must be a module-level function: children are started with the
+    ``spawn`` method so none of them inherit the parent's event loop or Temporal
+    runtime threads.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[Optional[str], Dict[str, Any]], None],
+        config: WorkerConfig,
+        config_path: Optional[str] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+    ):
+        self.target = target
+        self.config = config
+        self.config_path = config_path
+        self.overrides = overrides or {}
+        self._ctx = multiprocessing.get_context("spawn")
+        self._children = [
+            _Child(index=i, health_port=config.health_port + 1 + i) for i in range(config.processes)
+        ]
+        self._stopping = False
+        self._server: Optional[uvicorn.Server] = None
+
+    def _spawn(self, child: _Child) -> None:
+        overrides = {
+            **self.overrides,
+            "processes": 1,
+            "health_port": child.health_port,
+            "metrics_port": self.config.metrics_port + 1 + child.index,
+        }
+        process = self._ctx.Process(
+            target=self.target,
+            args=(self.config_path, overrides),
+            name=f"dsl-worker-{child.index}",
+            daemon=False,
+        )
+        process.start()
+        child.process, child.started_at, child.restart_at = process, time.monotonic(), None
+        logger.info("Started worker %s (pid=%s, health_port=%s)", child.index, process.pid, child.health_port)
+
+    def _check_children(self) -> None:
+        """Schedules restarts for exited children and starts those whose backoff elapsed."""
+        now = time.monotonic()
+        for child in self._children:
+            process = child.process
+            if process is not None and process.is_alive():
+                if child.failures and now - child.started_at > STABLE_AFTER_SEC:
+                    child.failures = 0
+                continue
+            if child.restart_at is None:
+                child.failures += 1
+                delay = min(RESTART_BACKOFF_SEC * 2 ** (child.failures - 1), MAX_RESTART_BACKOFF_SEC)
+                child.restart_at = now + delay
+                logger.warning(
+                    "Worker %s (pid=%s) exited with code %s; restarting in %.1fs",
+                    child.index, process.pid if process else None, process.exitcode if process else None, delay,
+                )
+            elif now >= child.restart_at:
+                child.restarts += 1
+                self._spawn(child)
+
+    async def _probe(self, client: httpx.AsyncClient, child: _Child, path: str) -> Dict[str, Any]:
+        alive = child.process is not None and child.process.is_alive()
+        status: Dict[str, Any] = {
+            "index": child.index,
+            "pid": child.process.pid if child.process else None,
+            "alive": alive,
+            "restarts": child.restarts,
+            "health_port": child.health_port,
+        }
+        if not alive:
+            return {**status, "status": "down"}
+        try:
+            response = await client.get(f"http://127.0.0.1:{child.health_port}{path}")
+            return {**status, **response.json()}
+        except (httpx.HTTPError, ValueError) as e:
+            return {**status, "status": "unreachable", "error": str(e)}
+
+    def _init_health_server(self) -> FastAPI:
+        """Supervisor probes: healthy while any child is, ready when all children are."""
+        app = FastAPI()
+
+        async def probe_all(path: str) -> List[Dict[str, Any]]:
+            async with httpx.AsyncClient(timeout=PROBE_TIMEOUT_SEC) as client:
+                return await asyncio.gather(*(self._probe(client, c, path) for c in self._children))
+
+        @app.get("/health")
+        async def health(response: Response):
+            children = await probe_all("/health")
+            ok = any(child.get("status") == "ok" for child in children)
+            if not ok:
+                response.status_code = 503
+            return {"status": "ok" if ok else "down", "hostname": socket.gethostname(), "workers": children}
+
+        @app.get("/ready")
+        async def ready(response: Response):
+            children = await probe_all("/ready")
+            ok = all(child.get("status") == "ready" for child in children)
+            if not ok:
+                response.status_code = 503
+            return {"status": "ready" if ok else "not_ready", "workers": children}
+
+        return app
+
+    def _forward_shutdown(self) -> None:
+        if self._stopping:
+            return
+        self._stopping = True
+        logger.info("Forwarding SIGTERM to %s worker processes...", len(self._children))
+        for child in self._children:
+            if child.process is not None and child.process.is_alive():
+                os.kill(child.process.pid, signal.SIGTERM)
+        if self._server:
+            self._server.should_exit = True
+
+    async def _drain(self) -> None:
+        """Waits for children to exit after SIGTERM; kills those past the grace period."""
+        deadline = time.monotonic() + self.config.graceful_shutdown_timeout_sec + 10
+        while time.monotonic() < deadline:
+            if not any(c.process is not None and c.process.is_alive() for c in self._children):
+                break
+            await asyncio.sleep(0.2)
+        for child in self._children:
+            if child.process is not None and child.process.is_alive():
+                logger.warning("Worker %s (pid=%s) did not drain in time; killing", child.index, child.process.pid)
+                child.process.kill()
+            if child.process is not None:
+                child.process.join(timeout=5)
+
+    async def run(self) -> None:
+        """Starts all children, serves aggregated probes and supervises until SIGTERM/SIGINT."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._forward_shutdown)
+
+        for child in self._children:
+            self._spawn(child)
+
+        self._server = uvicorn.Server(
+            config=uvicorn.Config(
+                self._init_health_server(), host="0.0.0.0", port=self.config.health_port, log_level="warning"
+            )
+        )
+        # The supervisor owns SIGTERM/SIGINT; keep uvicorn from swapping in its own handlers
+        self._server.capture_signals = contextlib.nullcontext
+        server_task = asyncio.create_task(self._server.serve())
+
+        logger.info("Supervising %s worker processes", len(self._children))
+        while not self._stopping:
+            self._check_children()
+            await asyncio.sleep(MONITOR_INTERVAL_SEC)
+
+        await self._drain()
+        await server_task
+        logger.info("Supervisor shutdown complete.")
@@ -6,38 +6,290 @@ Enterprise-grade Temporal Worker implementation:
 - Client pooling & namespace isolation
 - Structured logging with correlation IDs
 - Health and readiness probes
-- Prometheus/OpenTelemetry metrics hooks
+- Prometheus metrics at /metrics (SDK runtime + DSL histograms, see core.metrics)
 - Graceful shutdown + error handling
 """
 
 import asyncio
+import contextlib
 import logging
 import os
 import signal
 import socket
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
+import httpx
 import uvicorn
-from fastapi import FastAPI
+import yaml
+from fastapi import FastAPI, HTTPException, Response
 
 from temporalio.client import Client
-from temporalio.worker import Worker
+from temporalio.runtime import Runtime
+from temporalio.worker import (
+    PollerBehaviorSimpleMaximum,
+    ResourceBasedSlotConfig,
+    Worker,
+    WorkerTuner,
+)
+
+from core.event_loop_watchdog import EventLoopWatchdog
+from core.metrics import init_runtime
+from core.profiling import MemoryProfiler, SamplingProfiler, SlowActivityRecorder
+from core.workflow.bulkhead import Bulkhead
+from core.priority_slots import WeightedSlotSupplier, lane_tuner
+from core.workflow.priority_lanes import parse_lane_weights, lane_task_queue
+from core.workflow.task_queues import ACTIVITY_TASK_QUEUES
 
 
 logger = logging.getLogger("enterprise_worker")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 
+def _env_flag(value: str) -> bool:
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _upper_list(value: Any) -> List[str]:
+    items = value.split(",") if isinstance(value, str) else value
+    return [str(item).strip().upper() for item in items if str(item).strip()]
+
+
+def _limit_map(value: Any) -> Dict[str, int]:
+    """``{"HTTP": 20}`` from YAML or ``"HTTP=20,SEND_MAIL=10"`` from env."""
+    if isinstance(value, str):
+        pairs = [item.split("=", 1) for item in value.split(",") if item.strip()]
+        if any(len(pair) != 2 for pair in pairs):
+            raise ValueError(f"Invalid activity limits {value!r}; expected TYPE=limit,...")
+        value = dict(pairs)
+    return {str(k).strip().upper(): int(v) for k, v in value.items()}
+
+
+def _lane_weights(value: Any) -> Dict[str, int]:
+    """``{"high": 6, "low": 1}`` from YAML or ``"high=6,low=1"`` from env."""
+    if not isinstance(value, str):
+        value = ",".join(f"{lane}={weight}" for lane, weight in value.items())
+    return parse_lane_weights(value)
+
+
 class WorkerConfig:
-    """Configuration loader for Temporal Worker."""
+    """Configuration loader for Temporal Worker.
+
+    Every setting can come from a YAML file (``TEMPORAL_WORKER_CONFIG`` or ``path``)
+    or an env var; precedence is defaults < YAML < env < ``overrides``. Unset
+    optional settings keep the SDK defaults.
+
+    ``tuner_mode: resource_based`` replaces the fixed slot counts with a
+    resource-based tuner that hands out workflow/activity slots while CPU and
+    memory stay under ``target_cpu``/``target_memory``.
+
+    ``role`` splits work across processes: ``all`` runs workflows and activities,
+    ``workflows`` only workflow tasks, ``activities`` only activities (limited to
+    ``activity_types`` when set).
+
+    ``priority_lanes`` (lane -> weight) makes the worker poll one task queue per lane
+    and share its workflow/activity slots across them by weight (see core.priority_slots).
+    """
+
+    #: attribute -> (env var, cast, default)
+    SETTINGS: Dict[str, Tuple[str, Callable[[Any], Any], Any]] = {
+        "namespace": ("TEMPORAL_NAMESPACE", str, "default"),
+        "task_queue": ("TEMPORAL_TASK_QUEUE", str, "dsl-task-queue"),
+        "server_url": ("TEMPORAL_HOST", str, "localhost:7233"),
+        "max_concurrent_activities": ("TEMPORAL_MAX_ACTIVITIES", int, 100),
+        "max_concurrent_workflow_tasks": ("TEMPORAL_MAX_WORKFLOW_TASKS", int, None),
+        "max_concurrent_workflow_task_polls": ("TEMPORAL_WORKFLOW_TASK_POLLERS", int, None),
+        "max_concurrent_activity_task_polls": ("TEMPORAL_ACTIVITY_TASK_POLLERS", int, None),
+        "max_cached_workflows": ("TEMPORAL_MAX_CACHED_WORKFLOWS", int, 1000),
+        "max_activities_per_second": ("TEMPORAL_MAX_ACTIVITIES_PER_SECOND", float, None),
+        "max_task_queue_activities_per_second": ("TEMPORAL_MAX_TASK_QUEUE_ACTIVITIES_PER_SECOND", float, None),
+        # Activities on the workflow's own task queue are handed back with the workflow task
+        # completion instead of waiting for an activity poll
+        "eager_activities": ("TEMPORAL_EAGER_ACTIVITIES", _env_flag, True),
+        "graceful_shutdown_timeout_sec": ("TEMPORAL_GRACEFUL_SHUTDOWN_SEC", float, 0.0),
+        # Thread pool for sync activities (SyncTaskHandler subclasses)
+        # (default: max_concurrent_activities, so every activity slot can get a thread)
+        "activity_threads": ("TEMPORAL_ACTIVITY_THREADS", int, None),
+        "tuner_mode": ("TEMPORAL_TUNER_MODE", str, "fixed"),
+        "target_cpu": ("TEMPORAL_TUNER_TARGET_CPU", float, 0.8),
+        "target_memory": ("TEMPORAL_TUNER_TARGET_MEMORY", float, 0.8),
+        "tuner_min_slots": ("TEMPORAL_TUNER_MIN_SLOTS", int, None),
+        "tuner_max_slots": ("TEMPORAL_TUNER_MAX_SLOTS", int, None),
+        "metrics_enabled": ("TEMPORAL_METRICS_ENABLED", _env_flag, True),
+        # Local port of the SDK runtime's Prometheus exporter, re-served at /metrics
+        "metrics_port": ("TEMPORAL_METRICS_PORT", int, 9464),
+        "health_port": ("TEMPORAL_HEALTH_PORT", int, 8080),
+        # >1 runs a supervisor that forks this many worker processes (see core.supervisor)
+        "processes": ("TEMPORAL_WORKER_PROCESSES", int, 1),
+        # Per-task-type bulkheads inside max_concurrent_activities (see core.workflow.bulkhead)
+        "activity_limits": ("TEMPORAL_ACTIVITY_LIMITS", _limit_map, None),
+        "bulkhead_timeout_sec": ("TEMPORAL_BULKHEAD_TIMEOUT_SEC", float, None),
+        # Admin endpoints under /debug (see core.profiling)
+        "profiling_enabled": ("TEMPORAL_PROFILING_ENABLED", _env_flag, False),
+        "profiling_max_sec": ("TEMPORAL_PROFILING_MAX_SEC", float, 120.0),
+        # Opt-in slow-activity recording in make_activity; unset disables it
+        "slow_activity_threshold_ms": ("TEMPORAL_SLOW_ACTIVITY_MS", float, None),
+        "slow_activity_top_n": ("TEMPORAL_SLOW_ACTIVITY_TOP_N", int, 20),
+        # Event-loop watchdog (see core.event_loop_watchdog); 0 disables it
+        "stall_threshold_ms": ("TEMPORAL_STALL_THRESHOLD_MS", float, 250.0),
+        "loop_monitor_interval_ms": ("TEMPORAL_LOOP_MONITOR_INTERVAL_MS", float, 50.0),
+        "role": ("TEMPORAL_WORKER_ROLE", str, "all"),
+        "activity_types": ("TEMPORAL_WORKER_ACTIVITY_TYPES", _upper_list, None),
+        # Lane -> weight; must match the starters' TEMPORAL_PRIORITY_LANES (see core.workflow.priority_lanes)
+        "priority_lanes": ("TEMPORAL_PRIORITY_LANES", _lane_weights, None),
+    }
+
+    TUNER_MODES = ("fixed", "resource_based")
+    ROLES = ("all", "workflows", "activities")
+
+    def __init__(self, path: Optional[str] = None, overrides: Optional[Dict[str, Any]] = None):
+        path = path or os.getenv("TEMPORAL_WORKER_CONFIG")
+        file_values = self._load_yaml(path) if path else {}
+        overrides = overrides or {}
 
-    def __init__(self):
-        # Load from env; replace with YAML/TOML parser if preferred
-        self.namespace = os.getenv("TEMPORAL_NAMESPACE", "default")
-        self.task_queue = os.getenv("TEMPORAL_TASK_QUEUE", "dsl-task-queue")
-        self.server_url = os.getenv("TEMPORAL_HOST", "localhost:7233")
-        self.max_concurrent_activities = int(os.getenv("TEMPORAL_MAX_ACTIVITIES", "100"))
-        self.metrics_enabled = os.getenv("TEMPORAL_METRICS_ENABLED", "true").lower() == "true"
+        unknown = (set(file_values) | set(overrides)) - set(self.SETTINGS)
+        if unknown:
+            raise ValueError(f"Unknown worker settings: {sorted(unknown)}")
+
+        for name, (env_var, cast, default) in self.SETTINGS.items():
+            value = default
+            if name in file_values:
+                value = file_values[name]
+            if os.getenv(env_var) not in (None, ""):
+                value = os.environ[env_var]
+            if name in overrides:
+                value = overrides[name]
+            setattr(self, name, cast(value) if value is not None else None)
+
+        if self.tuner_mode not in self.TUNER_MODES:
+            raise ValueError(f"tuner_mode must be one of {self.TUNER_MODES}, got {self.tuner_mode!r}")
+        if self.processes < 1:
+            raise ValueError(f"processes must be >= 1, got {self.processes}")
+        if self.role not in self.ROLES:
+            raise ValueError(f"role must be one of {self.ROLES}, got {self.role!r}")
+        for name in ("target_cpu", "target_memory"):
+            if not 0 < getattr(self, name) <= 1:
+                raise ValueError(f"{name} must be in (0, 1], got {getattr(self, name)}")
+        if self.priority_lanes and self.tuner_mode == "resource_based":
+            raise ValueError("priority_lanes need tuner_mode: fixed; lanes share the fixed slot counts")
+        if self.priority_lanes:
+            # Starts without a priority still land on the main queue
+            self.priority_lanes.setdefault("normal", 1)
+        self._lane_tuner: Optional[WorkerTuner] = None
+        self.lane_slots: Dict[str, WeightedSlotSupplier] = {}
+        if self.eager_activities and self.max_task_queue_activities_per_second is not None:
+            logger.warning("max_task_queue_activities_per_second is set; the SDK disables eager activities")
+
+    @staticmethod
+    def _load_yaml(path: str) -> Dict[str, Any]:
+        """Reads the ``worker`` section of a YAML file (or the whole file if there is none)."""
+        with open(path, "r") as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Worker config {path} must be a mapping")
+        return data.get("worker", data)
+
+    @property
+    def runs_workflows(self) -> bool:
+        """Whether this process polls workflow tasks."""
+        return self.role in ("all", "workflows")
+
+    def runs_activity(self, task_type: str) -> bool:
+        """Whether this process registers the activity for ``task_type``."""
+        if self.role == "workflows":
+            return False
+        return not self.activity_types or task_type.upper() in self.activity_types
+
+    def bulkhead(self, task_type: str) -> Optional[Bulkhead]:
+        """A bulkhead for ``task_type`` if ``activity_limits`` caps it, else None."""
+        limit = (self.activity_limits or {}).get(task_type.upper())
+        if limit is None:
+            return None
+        return Bulkhead(task_type.upper(), limit, self.bulkhead_timeout_sec)
+
+    def runtime(self) -> Optional[Runtime]:
+        """The metrics-exporting runtime, or None for the SDK default when metrics are disabled.
+
+        A client shared with the worker must be connected on this runtime, or the
+        worker's ``/metrics`` has no exporter to proxy.
+        """
+        return init_runtime(self.metrics_port) if self.metrics_enabled else None
+
+    def slow_activity_recorder(self) -> Optional[SlowActivityRecorder]:
+        """A recorder for the slowest activities if ``slow_activity_threshold_ms`` is set."""
+        if self.slow_activity_threshold_ms is None:
+            return None
+        return SlowActivityRecorder(self.slow_activity_threshold_ms, self.slow_activity_top_n)
+
+    def activity_task_queue(self, task_type: str) -> str:
+        """Task queue the activity for ``task_type`` is routed to (see core.workflow.task_queues)."""
+        return ACTIVITY_TASK_QUEUES.get(task_type.upper(), self.task_queue)
+
+    def lane_task_queues(self) -> Dict[str, str]:
+        """Lane -> task queue this worker polls for workflows (just the main queue without lanes)."""
+        if not self.priority_lanes:
+            return {"normal": self.task_queue}
+        return {lane: lane_task_queue(self.task_queue, lane) for lane in self.priority_lanes}
+
+    def _lanes_tuner(self) -> WorkerTuner:
+        """One tuner shared by every lane's SDK worker, so lanes draw from the same slots."""
+        if self._lane_tuner is None:
+            weights = {queue: self.priority_lanes[lane] for lane, queue in self.lane_task_queues().items()}
+            # Routed activity queues and sticky queues share at the "normal" weight
+            default_weight = self.priority_lanes.get("normal", 1)
+            self.lane_slots = {
+                "workflow": WeightedSlotSupplier(self.max_concurrent_workflow_tasks or 100, weights, default_weight),
+                "activity": WeightedSlotSupplier(self.max_concurrent_activities, weights, default_weight),
+            }
+            self._lane_tuner = lane_tuner(self.lane_slots["workflow"], self.lane_slots["activity"])
+        return self._lane_tuner
+
+    def _tuner(self) -> WorkerTuner:
+        slot_config = ResourceBasedSlotConfig(
+            minimum_slots=self.tuner_min_slots,
+            maximum_slots=self.tuner_max_slots,
+        )
+        return WorkerTuner.create_resource_based(
+            target_memory_usage=self.target_memory,
+            target_cpu_usage=self.target_cpu,
+            workflow_config=slot_config,
+            activity_config=slot_config,
+        )
+
+    def worker_options(self) -> Dict[str, Any]:
+        """Keyword arguments for ``temporalio.worker.Worker`` derived from this config."""
+        options: Dict[str, Any] = {
+            "max_cached_workflows": self.max_cached_workflows,
+            "graceful_shutdown_timeout": timedelta(seconds=self.graceful_shutdown_timeout_sec),
+            "disable_eager_activity_execution": not self.eager_activities,
+        }
+        if self.tuner_mode == "resource_based":
+            # The SDK rejects fixed slot counts alongside a tuner
+            options["tuner"] = self._tuner()
+        elif self.priority_lanes:
+            options["tuner"] = self._lanes_tuner()
+        else:
+            options["max_concurrent_activities"] = self.max_concurrent_activities
+            options["max_concurrent_workflow_tasks"] = self.max_concurrent_workflow_tasks
+        if self.max_concurrent_workflow_task_polls:
+            options["workflow_task_poller_behavior"] = PollerBehaviorSimpleMaximum(
+                self.max_concurrent_workflow_task_polls
+            )
+        if self.max_concurrent_activity_task_polls:
+            options["activity_task_poller_behavior"] = PollerBehaviorSimpleMaximum(
+                self.max_concurrent_activity_task_polls
+            )
+        if self.max_activities_per_second is not None:
+            options["max_activities_per_second"] = self.max_activities_per_second
+        if self.max_task_queue_activities_per_second is not None:
+            options["max_task_queue_activities_per_second"] = self.max_task_queue_activities_per_second
+        return options
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Effective settings, e.g. for logging or writing back as YAML."""
+        return {name: getattr(self, name) for name in self.SETTINGS}
 
 
 class TemporalWorker:
@@ -48,23 +300,71 @@ class TemporalWorker:
         workflows: Optional[List] = None,
         activities: Optional[List] = None,
         config: Optional[WorkerConfig] = None,
+        handlers: Optional[List] = None,
+        activity_queues: Optional[Dict[str, List]] = None,
+        bulkheads: Optional[Dict[str, Bulkhead]] = None,
+        slow_activities: Optional[SlowActivityRecorder] = None,
+        started_at: Optional[float] = None,
+        client: Optional[Client] = None,
+        handle_signals: bool = True,
     ):
         self.config = config or WorkerConfig()
         self.workflows = workflows or []
         self.activities = activities or []
-        self._worker: Optional[Worker] = None
-        self._client: Optional[Client] = None
+        # task queue -> activities; ``activities`` run on the main task queue
+        self.activity_queues: Dict[str, List] = {q: list(a) for q, a in (activity_queues or {}).items()}
+        if self.activities:
+            self.activity_queues.setdefault(self.config.task_queue, []).extend(self.activities)
+        # Long-lived task handler instances whose startup/shutdown hooks this worker drives
+        self.handlers = handlers or []
+        self.bulkheads = bulkheads or {}
+        self.slow_activities = slow_activities
+        # time.perf_counter() at process start, for the startup time in the logs
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self._cpu_profiler = SamplingProfiler()
+        self._memory_profiler = MemoryProfiler()
+        self._watchdog: Optional[EventLoopWatchdog] = None
+        if self.config.stall_threshold_ms:
+            self._watchdog = EventLoopWatchdog(
+                threshold_sec=self.config.stall_threshold_ms / 1000,
+                interval_sec=self.config.loop_monitor_interval_ms / 1000,
+            )
+        self._activity_executor: Optional[ThreadPoolExecutor] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._workers: List[Worker] = []
+        # A client shared with the caller (e.g. the API) lets its starts be eagerly dispatched here
+        self._client: Optional[Client] = client
+        self._handle_signals = handle_signals
         self._app: Optional[FastAPI] = None
         self._server = None
+        self._server_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the SDK workers exist (and are registered with the client)."""
+        return bool(self._workers)
+
+    async def wait_until_ready(self, running: "asyncio.Future") -> None:
+        """Waits until :attr:`ready`, re-raising if ``running`` (the task driving :meth:`start`) fails first."""
+        while not self.ready:
+            if running.done():
+                await running
+                raise RuntimeError("Worker stopped before it was ready")
+            await asyncio.sleep(0.01)
 
     async def _init_client(self):
-        """Initialize Temporal client with retry/backoff."""
+        """Initialize Temporal client with retry/backoff, unless one was passed in."""
+        if self._client is not None:
+            logger.info("Using shared Temporal client for namespace %s", self._client.namespace)
+            return
+        runtime = self.config.runtime()
         retries = 3
         for attempt in range(1, retries + 1):
             try:
                 self._client = await Client.connect(
                     target_host=self.config.server_url,
                     namespace=self.config.namespace,
+                    runtime=runtime,
                 )
                 logger.info("Connected to Temporal: %s", self.config.server_url)
                 return
@@ -85,52 +385,198 @@ class TemporalWorker:
         @app.get("/ready")
         async def ready():
             return {
-                "status": "ready" if self._worker else "not_ready",
-                "task_queue": self.config.task_queue,
+                "status": "ready" if self.ready else "not_ready",
+                "role": self.config.role,
+                "task_queues": [worker.task_queue for worker in self._workers],
                 "namespace": self.config.namespace,
             }
 
+        @app.get("/metrics")
+        async def metrics():
+            if not self.config.metrics_enabled:
+                return Response("metrics disabled\n", status_code=404, media_type="text/plain")
+            try:
+                async with httpx.AsyncClient(timeout=5) as client:
+                    exported = await client.get(f"http://127.0.0.1:{self.config.metrics_port}/metrics")
+            except httpx.HTTPError as e:
+                return Response(f"metrics exporter unavailable: {e}\n", status_code=503, media_type="text/plain")
+            return Response(exported.content, media_type=exported.headers.get("content-type", "text/plain"))
+
+        @app.get("/bulkheads")
+        async def bulkheads():
+            return {name: bulkhead.snapshot() for name, bulkhead in self.bulkheads.items()}
+
+        @app.get("/lanes")
+        async def lanes():
+            return {
+                "lanes": self.config.priority_lanes or {},
+                **{kind: slots.snapshot() for kind, slots in self.config.lane_slots.items()},
+            }
+
+        @app.get("/debug/event-loop")
+        async def event_loop():
+            if self._watchdog is None:
+                raise HTTPException(404, "event-loop watchdog is disabled (TEMPORAL_STALL_THRESHOLD_MS=0)")
+            return self._watchdog.snapshot()
+
+        @app.get("/debug/slow-activities")
+        async def slow_activities():
+            if self.slow_activities is None:
+                raise HTTPException(404, "slow-activity recording is disabled (TEMPORAL_SLOW_ACTIVITY_MS)")
+            return {"threshold_ms": self.slow_activities.threshold_ms, "slowest": self.slow_activities.snapshot()}
+
+        if self.config.profiling_enabled:
+            self._init_profiling_routes(app)
+
         self._app = app
 
+    def _init_profiling_routes(self, app: FastAPI):
+        """Time-boxed CPU/memory profiling; responses are folded stacks for flamegraph tools."""
+        profilers = {"cpu": self._cpu_profiler, "memory": self._memory_profiler}
+
+        def window(seconds: float) -> float:
+            if not 0 < seconds <= self.config.profiling_max_sec:
+                raise HTTPException(400, f"seconds must be in (0, {self.config.profiling_max_sec}]")
+            return seconds
+
+        def start(kind: str, seconds: float, interval_ms: float, frames: int):
+            profiler = profilers[kind]
+            self._cpu_profiler.interval_sec = interval_ms / 1000
+            self._memory_profiler.frames = frames
+            try:
+                profiler.start(window(seconds))
+            except RuntimeError as e:
+                raise HTTPException(409, str(e))
+            logger.info("Started %s profile for %ss", kind, seconds)
+
+        async def stop(kind: str) -> Response:
+            # stop() joins the sampler thread / snapshots tracemalloc; keep that off the event loop
+            try:
+                return Response(await asyncio.to_thread(profilers[kind].stop), media_type="text/plain")
+            except RuntimeError as e:
+                raise HTTPException(409, str(e))
+
+        @app.post("/debug/profile/{kind}/start")
+        async def start_profile(kind: Literal["cpu", "memory"], seconds: float = 30, interval_ms: float = 10, frames: int = 25):
+            start(kind, seconds, interval_ms, frames)
+            return {"status": "running", "kind": kind, "stops_after_sec": seconds}
+
+        @app.post("/debug/profile/{kind}/stop")
+        async def stop_profile(kind: Literal["cpu", "memory"]):
+            return await stop(kind)
+
+        @app.get("/debug/profile/{kind}")
+        async def profile(kind: Literal["cpu", "memory"], seconds: float = 10, interval_ms: float = 10, frames: int = 25):
+            start(kind, seconds, interval_ms, frames)
+            await asyncio.sleep(seconds)
+            return await stop(kind)
+
+    async def _startup_handlers(self):
+        """Run every handler's startup hook (connection pools, caches, templates)."""
+        await asyncio.gather(*(handler.startup() for handler in self.handlers))
+        logger.info("Started %s task handlers", len(self.handlers))
+
+    async def _shutdown_handlers(self):
+        """Run every handler's shutdown hook; failures are logged, not raised."""
+        results = await asyncio.gather(
+            *(handler.shutdown() for handler in self.handlers), return_exceptions=True
+        )
+        for handler, result in zip(self.handlers, results):
+            if isinstance(result, Exception):
+                logger.error("Handler %s failed to shut down: %s", type(handler).__name__, result)
+
+    def _build_workers(self) -> List[Worker]:
+        """One SDK worker per task queue: workflows on the main queue, activities where routed."""
+        queues = dict(self.activity_queues)
+        plan = []
+        main_activities = queues.pop(self.config.task_queue, [])
+        if self.workflows or main_activities:
+            # With priority lanes, workflows and their default-queue activities run on every lane's queue
+            plan.extend(
+                (queue, self.workflows, main_activities) for queue in self.config.lane_task_queues().values()
+            )
+        plan.extend((queue, [], activities) for queue, activities in queues.items() if activities)
+        if not plan:
+            raise ValueError(f"Worker role {self.config.role!r} has no workflows or activities to run")
+        return [
+            Worker(
+                client=self._client,
+                task_queue=queue,
+                workflows=workflows,
+                activities=activities,
+                activity_executor=self._activity_executor,
+                **self.config.worker_options(),
+            )
+            for queue, workflows, activities in plan
+        ]
+
     async def start(self):
         """Start the Temporal worker with observability and health checks."""
         await self._init_client()
+        # Anything started from here on (watchdog, handler pools, threads, health server) is torn
+        # down by shutdown(), including when a later step such as _build_workers() raises
+        try:
+            if self._watchdog:
+                self._watchdog.start()
+            await self._startup_handlers()
 
-        self._worker = Worker(
-            client=self._client,
-            task_queue=self.config.task_queue,
-            workflows=self.workflows,
-            activities=self.activities,
-            max_concurrent_activities=self.config.max_concurrent_activities,
-        )
+            self._activity_executor = ThreadPoolExecutor(
+                max_workers=self.config.activity_threads or self.config.max_concurrent_activities,
+                thread_name_prefix="activity",
+            )
+            self._workers = self._build_workers()
 
-        # Start health probe server
-        self._init_health_server()
-        self._server = uvicorn.Server(
-            config=uvicorn.Config(self._app, host="0.0.0.0", port=8080, log_level="info")
-        )
-        asyncio.create_task(self._server.serve())
+            # Start health probe server
+            self._init_health_server()
+            self._server = uvicorn.Server(
+                config=uvicorn.Config(self._app, host="0.0.0.0", port=self.config.health_port, log_level="info")
+            )
+            # Shutdown signals belong to the worker (handlers below), not to uvicorn
+            self._server.capture_signals = contextlib.nullcontext
+            self._server_task = asyncio.create_task(self._server.serve())
 
-        logger.info(
-            "Starting worker in namespace=%s, task_queue=%s",
-            self.config.namespace,
-            self.config.task_queue,
-        )
+            logger.info(
+                "Starting worker in namespace=%s, role=%s, task_queues=%s, tuner_mode=%s (startup took %.2fs)",
+                self.config.namespace,
+                self.config.role,
+                [worker.task_queue for worker in self._workers],
+                self.config.tuner_mode,
+                time.perf_counter() - self.started_at,
+            )
+
+            # Handle signals for graceful shutdown; an embedding process (the API) handles its own
+            if self._handle_signals:
+                loop = asyncio.get_running_loop()
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.add_signal_handler(sig, self._begin_shutdown)
 
-        # Handle signals for graceful shutdown
-        loop = asyncio.get_running_loop()
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: asyncio.create_task(self.shutdown()))
+            await asyncio.gather(*(worker.run() for worker in self._workers))
+        finally:
+            # The SDK workers return as soon as they have drained; wait for the rest of the
+            # cleanup (handler hooks, thread pool, health server) before returning
+            await self.shutdown()
 
-        await self._worker.run()
+    def _begin_shutdown(self) -> asyncio.Task:
+        """Starts the shutdown once; later calls return the same task."""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._shutdown())
+        return self._shutdown_task
 
     async def shutdown(self):
-        """Gracefully shut down the worker."""
+        """Gracefully shut down the worker; safe to call repeatedly and from several tasks."""
+        await asyncio.shield(self._begin_shutdown())
+
+    async def _shutdown(self):
         logger.info("Shutting down Temporal Worker...")
-        if self._worker:
-            await self._worker.shutdown()
+        # Worker.shutdown() waits for run() to finish, so skip workers a failed start never ran
+        await asyncio.gather(*(worker.shutdown() for worker in self._workers if worker.is_running))
+        await self._shutdown_handlers()
+        if self._watchdog:
+            self._watchdog.stop()
+        if self._activity_executor:
+            self._activity_executor.shutdown(wait=False)
         if self._server:
-            await self._server.shutdown()
-        if self._client:
-            await self._client.close()
+            self._server.should_exit = True
+        if self._server_task:
+            await self._server_task
         logger.info("Worker shutdown complete.")
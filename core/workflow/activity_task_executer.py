@@ -1,22 +1,33 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from temporalio import workflow
+from temporalio.common import Priority
 
 from ..dsl.schema import TaskModel, DSLModel
 from .payload_builder import PayloadBuilder
+from .priority_lanes import temporal_priority
+from .task_queues import TaskQueueRouter
 
 ACTIVITY_TIMEOUT_SEC = 30
 
 
 class ActivityTaskExecutor:
-    """Default executor that invokes an activity named '<TYPE>_TASK'."""
+    """Default executor that invokes an activity named '<TYPE>_TASK'.
 
-    def __init__(self, timeout_sec: int = ACTIVITY_TIMEOUT_SEC) -> None:
-        """Initializes with activity timeout."""
+    A task's ``timeoutSec`` and ``heartbeatTimeoutSec`` override the executor defaults.
+    """
+
+    def __init__(
+        self,
+        timeout_sec: int = ACTIVITY_TIMEOUT_SEC,
+        task_queues: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Initializes with activity timeout and an optional TYPE -> task queue mapping."""
         self._timeout_sec = timeout_sec
+        self._router = TaskQueueRouter(task_queues)
 
     @staticmethod
     def _activity_name(task_type_upper: str) -> str:
@@ -28,9 +39,15 @@ class ActivityTaskExecutor:
         task_type = (task.type or "").upper()
         activity_name = self._activity_name(task_type)
         payload = PayloadBuilder.build(task)
-        workflow.logger.info("Executing %s", activity_name)
+        task_queue = self._router.resolve(task, dsl)
+        workflow.logger.debug("Executing %s on %s", activity_name, task_queue or "workflow task queue")
+        heartbeat_timeout = task.heartbeatTimeoutSec
         return await workflow.execute_activity(
             activity_name,
             payload,
-            start_to_close_timeout=timedelta(seconds=self._timeout_sec),
+            task_queue=task_queue,
+            # The DSL's lane pins the priority; otherwise the activity inherits the workflow's
+            priority=temporal_priority(dsl.priority) or Priority.default,
+            start_to_close_timeout=timedelta(seconds=task.timeoutSec or self._timeout_sec),
+            heartbeat_timeout=timedelta(seconds=heartbeat_timeout) if heartbeat_timeout else None,
         )
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from temporalio.common import SearchAttributeKey
+
+# Custom search attributes indexing pending approvals. They must be registered on
+# the namespace before workflows run (see docker-compose.yml `temporal-init`), or
+# starters must set DSL_INDEX_APPROVALS=false (see core.starter).
+PENDING_APPROVALS = SearchAttributeKey.for_keyword_list("DSLPendingApprovals")
+APPROVER_GROUPS = SearchAttributeKey.for_keyword_list("DSLApproverGroups")
+APPROVAL_DEADLINE = SearchAttributeKey.for_datetime("DSLApprovalDeadline")
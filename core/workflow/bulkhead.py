@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from temporalio.exceptions import ApplicationError
+
+logger = logging.getLogger(__name__)
+
+
+class Bulkhead:
+    """Caps concurrent executions of one task type inside a worker.
+
+    Async activities wait on an ``asyncio.Semaphore``; sync activities (which run on
+    the activity thread pool) wait on a ``threading.BoundedSemaphore``. A task type is
+    always one or the other, so only one primitive is ever used per bulkhead.
+
+    With ``timeout_sec`` set, a task that cannot get a slot in time fails with a
+    retryable ``BulkheadFull`` ApplicationError, handing its worker slot back and
+    letting Temporal retry it later; without it, tasks queue until a slot frees up.
+    """
+
+    def __init__(self, name: str, limit: int, timeout_sec: Optional[float] = None) -> None:
+        """Initializes with the task type name, max concurrent executions and wait timeout."""
+        if limit < 1:
+            raise ValueError(f"Bulkhead limit for {name} must be >= 1, got {limit}")
+        self.name = name
+        self.limit = limit
+        self.timeout_sec = timeout_sec
+        self._async_slots: Optional[asyncio.Semaphore] = None
+        self._sync_slots = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _waiting(self) -> float:
+        with self._lock:
+            self.waiting += 1
+        return time.perf_counter()
+
+    def _admitted(self, started: float) -> None:
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.waiting -= 1
+            self.active += 1
+            self.admitted += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def _rejected(self) -> ApplicationError:
+        with self._lock:
+            self.waiting -= 1
+            self.rejected += 1
+        logger.warning("Bulkhead %s full (%s active); rejecting task", self.name, self.limit)
+        return ApplicationError(
+            f"Bulkhead for {self.name} is full ({self.limit} concurrent); retry later",
+            type="BulkheadFull",
+        )
+
+    def _released(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Holds one slot for the duration of an async activity."""
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.limit)
+        started = self._waiting()
+        try:
+            await asyncio.wait_for(self._async_slots.acquire(), self.timeout_sec)
+        except asyncio.TimeoutError:
+            raise self._rejected() from None
+        except BaseException:
+            # Cancelled while waiting
+            with self._lock:
+                self.waiting -= 1
+            raise
+        self._admitted(started)
+        try:
+            yield
+        finally:
+            self._released()
+            self._async_slots.release()
+
+    @contextmanager
+    def sync_slot(self) -> Iterator[None]:
+        """Holds one slot for the duration of a sync activity (called from a worker thread)."""
+        started = self._waiting()
+        if not self._sync_slots.acquire(timeout=self.timeout_sec):
+            raise self._rejected()
+        self._admitted(started)
+        try:
+            yield
+        finally:
+            self._released()
+            self._sync_slots.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current usage and counters, e.g. for the worker's /bulkheads endpoint."""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "active": self.active,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(1000 * self.wait_time_total / self.admitted, 3) if self.admitted else 0.0,
+                "max_wait_ms": round(1000 * self.wait_time_max, 3),
+            }
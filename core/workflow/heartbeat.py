@@ -0,0 +1,113 @@
+"""
+heartbeat.py
+
+Automatic heartbeats and progress checkpoints for task activities:
+- When a task sets ``heartbeatTimeoutSec``, the activity wrapper heartbeats every third of it
+  while the handler runs, so a dead worker is noticed after the heartbeat timeout instead of
+  the full ``timeoutSec``
+- ``checkpoint(state)`` records handler progress as the heartbeat details; every later
+  heartbeat resends it, so the last checkpoint survives a crash
+- ``last_checkpoint()`` returns that state on the next attempt, so a retry can resume
+
+Outside an activity (embedded engine, tests) both are no-ops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from temporalio import activity
+
+# The SDK throttles heartbeats to 80% of the heartbeat timeout; beating at a third of it
+# leaves room for a slow event loop or a busy thread pool
+HEARTBEATS_PER_TIMEOUT = 3
+
+_NO_CHECKPOINT = object()
+
+
+class Heartbeater:
+    """Heartbeats one activity execution, resending its latest checkpoint each time."""
+
+    def __init__(self, interval_sec: float) -> None:
+        self.interval_sec = interval_sec
+        self._details: Any = _NO_CHECKPOINT
+        self._stopped = threading.Event()
+
+    @classmethod
+    def for_current_activity(cls) -> Optional["Heartbeater"]:
+        """A heartbeater for the running activity if its task set a heartbeat timeout."""
+        timeout = activity.info().heartbeat_timeout
+        if not timeout:
+            return None
+        return cls(timeout.total_seconds() / HEARTBEATS_PER_TIMEOUT)
+
+    def checkpoint(self, state: Any) -> None:
+        self._details = state
+        self.beat()
+
+    def beat(self) -> None:
+        if self._details is _NO_CHECKPOINT:
+            activity.heartbeat()
+        else:
+            activity.heartbeat(self._details)
+
+    async def run(self) -> None:
+        """Heartbeats until cancelled; run next to an async handler."""
+        while True:
+            await asyncio.sleep(self.interval_sec)
+            self.beat()
+
+    def start_thread(self) -> threading.Thread:
+        """Heartbeats from a daemon thread until :meth:`stop`; for sync handlers.
+
+        The thread runs in a copy of the activity thread's context, which is where the
+        SDK keeps the activity (and its thread-safe heartbeat function).
+        """
+        context = contextvars.copy_context()
+
+        def _loop() -> None:
+            while not self._stopped.wait(self.interval_sec):
+                context.run(self.beat)
+
+        thread = threading.Thread(target=_loop, name="activity-heartbeat", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+_current: ContextVar[Optional[Heartbeater]] = ContextVar("dsl_heartbeater", default=None)
+
+
+def bind(heartbeater: Optional[Heartbeater]) -> contextvars.Token:
+    """Makes ``heartbeater`` the target of :func:`checkpoint` in this context."""
+    return _current.set(heartbeater)
+
+
+def unbind(token: contextvars.Token) -> None:
+    _current.reset(token)
+
+
+def checkpoint(state: Any) -> None:
+    """Records ``state`` as the activity's progress and heartbeats it right away.
+
+    ``state`` must be serializable by the data converter (plain JSON types are safest).
+    """
+    heartbeater = _current.get()
+    if heartbeater is not None:
+        heartbeater.checkpoint(state)
+    elif activity.in_activity():
+        activity.heartbeat(state)
+
+
+def last_checkpoint(default: Any = None) -> Any:
+    """The state checkpointed by a previous attempt of this activity, else ``default``."""
+    if not activity.in_activity():
+        return default
+    details = activity.info().heartbeat_details
+    return details[0] if details else default
@@ -1,16 +1,71 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from temporalio import workflow
 
+ALLOWED_DECISIONS = ("APPROVED", "REJECTED")
+
 
 @dataclass
 class HumanInLoopSignalState:
-    """Holds a HumanInLoop result and provides an awaitable wait helper."""
-    result: Optional[str] = None
+    """Holds HumanInLoop results keyed by taskReferenceName and provides awaitable wait helpers.
+
+    Several approval tasks may be pending at once; each one only completes when a
+    decision addressed to its own task reference arrives. Decisions sent without a
+    task reference go to the oldest pending task, or are buffered for the next
+    task that starts waiting.
+    """
+    results: Dict[str, str] = field(default_factory=dict)
+    pending: List[str] = field(default_factory=list)
+    unassigned: List[str] = field(default_factory=list)
+
+    def _target(self, task_ref_name: Optional[str]) -> Optional[str]:
+        """Returns the task ref a decision applies to, or None if it must be buffered."""
+        if task_ref_name:
+            return task_ref_name
+        return next((ref for ref in self.pending if ref not in self.results), None)
+
+    def validate(self, result: str, task_ref_name: Optional[str] = None, allow_unassigned: bool = False) -> None:
+        """Raises ValueError unless the decision can be applied to a pending task.
+
+        With ``allow_unassigned``, a decision without a task reference may also be
+        buffered while no task is pending (the signal path keeps that behaviour).
+        """
+        if result not in ALLOWED_DECISIONS:
+            raise ValueError(f"Invalid decision '{result}', expected one of {ALLOWED_DECISIONS}")
+        target = self._target(task_ref_name)
+        if target is None:
+            if allow_unassigned:
+                return
+            raise ValueError("No approval task is pending.")
+        if target not in self.pending:
+            raise ValueError(f"Approval task '{target}' is not pending.")
+        if target in self.results:
+            raise ValueError(f"Approval task '{target}' has already been decided.")
+
+    def set(self, result: str, task_ref_name: Optional[str] = None) -> Optional[str]:
+        """Records a decision and returns the task ref it was applied to (None if buffered).
+
+        Does not check the decision: call ``validate`` first. Storing a decision for
+        an explicit task ref that is not pending yet is not supported, since it would
+        linger until (and unless) that task runs; only ref-less decisions are buffered.
+        """
+        target = self._target(task_ref_name)
+        if target is None:
+            self.unassigned.append(result)
+        else:
+            self.results[target] = result
+        return target
 
-    async def wait(self) -> None:
-        """Waits until an approval result is set."""
-        await workflow.wait_condition(lambda: self.result is not None)
+    async def wait(self, task_ref_name: str) -> str:
+        """Waits until a result is set for the given task and returns it."""
+        if task_ref_name not in self.results and self.unassigned:
+            self.results[task_ref_name] = self.unassigned.pop(0)
+        self.pending.append(task_ref_name)
+        try:
+            await workflow.wait_condition(lambda: task_ref_name in self.results)
+        finally:
+            self.pending.remove(task_ref_name)
+        return self.results.pop(task_ref_name)
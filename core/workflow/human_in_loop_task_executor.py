@@ -1,24 +1,71 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
 
 from temporalio import workflow
 
 from ..dsl.schema import TaskModel, DSLModel
+from .approval_search_attributes import PENDING_APPROVALS, APPROVER_GROUPS, APPROVAL_DEADLINE
 from .human_in_loop_signal_state import HumanInLoopSignalState
 
+DEFAULT_APPROVAL_TIMEOUT_SEC = 3600
+# Patch marker for the search attribute upserts; runs started before them replay without
+APPROVAL_SEARCH_ATTRIBUTES_PATCH = "approval-search-attributes"
+
 
 class HumanInLoopTaskExecutor:
-    """Executor for APPROVAL tasks that blocks on a signal."""
+    """Executor for APPROVAL tasks that blocks on a signal or update for its own task ref.
+
+    While waiting, the pending task refs, approver groups and earliest deadline are
+    upserted as search attributes so approval inboxes can use indexed visibility
+    queries instead of scanning workflows. Runs whose DSL sets ``indexApprovals``
+    to false skip the upserts. The upserts are also behind a ``workflow.patched``
+    marker, so runs that were already waiting when they were added keep replaying
+    without them.
+    """
     def __init__(self, state: HumanInLoopSignalState) -> None:
         self._state = state
+        self._waiting: Dict[str, Tuple[Optional[str], datetime]] = {}
+
+    def _upsert_search_attributes(self) -> None:
+        """Publishes the current set of pending approvals to visibility."""
+        if not self._waiting:
+            workflow.upsert_search_attributes([
+                PENDING_APPROVALS.value_unset(),
+                APPROVER_GROUPS.value_unset(),
+                APPROVAL_DEADLINE.value_unset(),
+            ])
+            return
+        groups = sorted({group for group, _ in self._waiting.values() if group})
+        workflow.upsert_search_attributes([
+            PENDING_APPROVALS.value_set(list(self._waiting)),
+            APPROVER_GROUPS.value_set(groups) if groups else APPROVER_GROUPS.value_unset(),
+            APPROVAL_DEADLINE.value_set(min(deadline for _, deadline in self._waiting.values())),
+        ])
 
     async def execute(self, task: TaskModel, dsl: DSLModel) -> Dict[str, Any]:
-        """Waits for an approval signal to proceed."""
-        workflow.logger.info("[APPROVAL] Waiting for approval on '%s'", task.taskReferenceName)
-        await self._state.wait()
+        """Waits for an approval decision addressed to this task to proceed."""
+        ref = task.taskReferenceName
+        task_input = task.input or {}
+        timeout = task_input.get("timeout") or DEFAULT_APPROVAL_TIMEOUT_SEC
+        self._waiting[ref] = (
+            task_input.get("approver_group"),
+            workflow.now() + timedelta(seconds=int(timeout)),
+        )
+        index = dsl.indexApprovals and workflow.patched(APPROVAL_SEARCH_ATTRIBUTES_PATCH)
+        if index:
+            self._upsert_search_attributes()
+
+        workflow.logger.info("[APPROVAL] Waiting for approval on '%s'", ref)
+        try:
+            result = await self._state.wait(ref)
+        finally:
+            self._waiting.pop(ref, None)
+            if index:
+                self._upsert_search_attributes()
         return {
-            "task_ref_name": task.taskReferenceName,
+            "task_ref_name": ref,
             "status": "COMPLETED",
-            "output": {"approval_result": self._state.result},
+            "output": {"approval_result": result},
         }
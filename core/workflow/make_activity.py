@@ -1,12 +1,119 @@
+import asyncio
+import time
+from typing import Any, Optional, Type, Union
+
 from temporalio import activity
 
+from ..dsl.tasks.base_task_handler import BaseTaskHandler
+from ..metrics import DSLMetrics, dsl_metrics, payload_size
+from ..profiling import SlowActivityRecorder
+from .bulkhead import Bulkhead
+from .heartbeat import Heartbeater, bind, unbind
+
+
+def _observe(
+    metrics: Optional[DSLMetrics],
+    slow_activities: Optional[SlowActivityRecorder],
+    task_type: str,
+    payload: dict,
+    result: Any,
+    started: float,
+) -> None:
+    """Records execution time by status, payload sizes and slow executions for one activity run."""
+    elapsed = time.perf_counter() - started
+    status = getattr(result, "status", None) or "ERROR"
+    if metrics is not None:
+        metrics.task_execution.record(elapsed, {"task_type": task_type, "status": status})
+        metrics.payload_bytes.record(payload_size(payload), {"task_type": task_type, "direction": "input"})
+        if result is not None:
+            metrics.payload_bytes.record(payload_size(result), {"task_type": task_type, "direction": "output"})
+    if slow_activities is not None:
+        workflow_id = activity.info().workflow_id if activity.in_activity() else None
+        slow_activities.record(task_type, elapsed, payload.get("task_ref_name"), workflow_id, status)
+
+
+def make_activity(
+    task_type: str,
+    handler: Union[BaseTaskHandler, Type[BaseTaskHandler]],
+    bulkhead: Optional[Bulkhead] = None,
+    slow_activities: Optional[SlowActivityRecorder] = None,
+):
+    """Dynamically creates a Temporal activity for a given task type and handler.
+
+    ``handler`` should be the worker's long-lived instance; a class is instantiated
+    once here for backwards compatibility. Sync handlers produce a sync activity,
+    which Temporal runs on the worker's ``activity_executor`` thread pool.
+    With a ``bulkhead``, execution (not validation) holds one of its slots.
+    If the task set a heartbeat timeout, the wrapper heartbeats while the handler runs
+    (from a helper thread for sync handlers) and resends the handler's latest checkpoint.
+    When metrics are enabled, execution time and payload sizes are recorded per type;
+    with ``slow_activities``, the slowest executions are kept with their task refs.
+    """
+    if isinstance(handler, type):
+        handler = handler()
+    metric_type = task_type.upper()
+
+    if handler.is_sync:
+        def _run_sync(validated):
+            if bulkhead is None:
+                return handler.execute_sync(validated)
+            with bulkhead.sync_slot():
+                return handler.execute_sync(validated)
+
+        def _execute_sync(validated):
+            heartbeater = Heartbeater.for_current_activity()
+            if heartbeater is None:
+                return _run_sync(validated)
+            token = bind(heartbeater)
+            heartbeater.start_thread()
+            try:
+                return _run_sync(validated)
+            finally:
+                heartbeater.stop()
+                unbind(token)
+
+        @activity.defn(name=f"{task_type.upper()}_TASK")
+        def _sync_activity(payload: dict):
+            validated = handler.validate(payload)
+            metrics = dsl_metrics()
+            if metrics is None and slow_activities is None:
+                return _execute_sync(validated)
+            started, result = time.perf_counter(), None
+            try:
+                result = _execute_sync(validated)
+                return result
+            finally:
+                _observe(metrics, slow_activities, metric_type, payload, result, started)
+        return _sync_activity
+
+    async def _run(validated):
+        if bulkhead is None:
+            return await handler.execute(validated)
+        async with bulkhead.async_slot():
+            return await handler.execute(validated)
+
+    async def _execute(validated):
+        heartbeater = Heartbeater.for_current_activity()
+        if heartbeater is None:
+            return await _run(validated)
+        token = bind(heartbeater)
+        beating = asyncio.create_task(heartbeater.run())
+        try:
+            return await _run(validated)
+        finally:
+            beating.cancel()
+            unbind(token)
 
-def make_activity(task_type: str, handler_cls):
-    """Dynamically creates a Temporal activity for a given task type and handler class."""
     @activity.defn(name=f"{task_type.upper()}_TASK")
     async def _activity(payload: dict):
-        handler = handler_cls()
         validated = handler.validate(payload)
-        result = await handler.execute(validated)
-        return result
+        metrics = dsl_metrics()
+        if metrics is None and slow_activities is None:
+            return await _execute(validated)
+        started, result = time.perf_counter(), None
+        try:
+            result = await _execute(validated)
+            return result
+        finally:
+            _observe(metrics, slow_activities, metric_type, payload, result, started)
     return _activity
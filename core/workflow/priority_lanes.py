@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional
+
+from temporalio.common import Priority
+
+PRIORITY_LANES_ENV = "TEMPORAL_PRIORITY_LANES"
+
+LANES = ("high", "normal", "low")
+# Temporal task priority: lower keys are dispatched first from a backlog; 3 is the server default
+PRIORITY_KEYS = {"high": 1, "normal": 3, "low": 5}
+
+
+def parse_lane_weights(raw: Optional[str]) -> Dict[str, int]:
+    """Parses ``"high=6,normal=3,low=1"`` into ``{"high": 6, "normal": 3, "low": 1}``."""
+    weights: Dict[str, int] = {}
+    for item in (raw or "").split(","):
+        if not item.strip():
+            continue
+        lane, sep, weight = item.partition("=")
+        lane = lane.strip().lower()
+        if not sep or lane not in LANES or not weight.strip().isdigit() or int(weight) < 1:
+            raise ValueError(f"Invalid {PRIORITY_LANES_ENV} entry {item!r}; expected LANE=weight with LANE in {LANES}")
+        weights[lane] = int(weight)
+    return weights
+
+
+# Read once at import. Starters and workers must agree: with lanes configured, starts go to
+# per-lane task queues that only lane-aware workers poll.
+PRIORITY_LANES: Dict[str, int] = parse_lane_weights(os.getenv(PRIORITY_LANES_ENV))
+
+
+def lane_task_queue(task_queue: str, lane: Optional[str]) -> str:
+    """The task queue of ``lane``: the base queue for "normal" (or no lane), ``<queue>-<lane>`` otherwise."""
+    if not lane or lane == "normal":
+        return task_queue
+    return f"{task_queue}-{lane}"
+
+
+def temporal_priority(lane: Optional[str]) -> Optional[Priority]:
+    """Temporal task priority for ``lane``; servers without priority support ignore it."""
+    if not lane:
+        return None
+    return Priority(priority_key=PRIORITY_KEYS[lane])
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Optional
+
+from temporalio import workflow
+
+from ..dsl.schema import TaskModel
+
+MAX_OUTPUT_BYTES = 2048
+# Bounds the query payload (~MAX_COMPLETED_TASKS * MAX_OUTPUT_BYTES) for long or looping DSLs
+MAX_COMPLETED_TASKS = 100
+
+
+def _now() -> datetime:
+    """Deterministic workflow time in a workflow, wall-clock UTC in embedded runs."""
+    return workflow.now() if workflow.in_workflow() else datetime.now(timezone.utc)
+
+
+class ProgressTracker:
+    """Incrementally records run progress so it can be served by a query without history fetches.
+
+    Outputs are kept per task ref; any output whose JSON encoding exceeds
+    ``max_output_bytes`` is replaced by a small truncation marker. Only the last
+    ``max_completed`` completed entries and outputs of the most recently completed
+    task refs are kept; ``completed_count`` counts every completion.
+    """
+    def __init__(self, max_output_bytes: int = MAX_OUTPUT_BYTES, max_completed: int = MAX_COMPLETED_TASKS) -> None:
+        self._max_output_bytes = max_output_bytes
+        self._max_completed = max_completed
+        self.status = "PENDING"
+        self.current_task_ref: Optional[str] = None
+        self.current_task_type: Optional[str] = None
+        self._current_started_at: Optional[datetime] = None
+        self.completed: Deque[Dict[str, Any]] = deque(maxlen=max_completed)
+        self.completed_count = 0
+        self.outputs: Dict[str, Any] = {}
+
+    def _capped(self, output: Any) -> Any:
+        """Returns the output, or a marker if its JSON form is too large."""
+        size = len(json.dumps(output, default=str))
+        if size <= self._max_output_bytes:
+            return output
+        return {"truncated": True, "size_bytes": size}
+
+    def task_started(self, task: TaskModel) -> None:
+        """Marks a task as the current one."""
+        self.status = "RUNNING"
+        self.current_task_ref = task.taskReferenceName
+        self.current_task_type = task.type
+        self._current_started_at = _now()
+
+    def task_completed(self, task: TaskModel, result: Dict[str, Any]) -> None:
+        """Records a finished task with its timing, status and capped output."""
+        completed_at = _now()
+        started_at = self._current_started_at or completed_at
+        self.completed.append({
+            "task_ref_name": task.taskReferenceName,
+            "type": task.type,
+            "status": result.get("status"),
+            "started_at": started_at.isoformat(),
+            "completed_at": completed_at.isoformat(),
+            "duration_ms": int((completed_at - started_at).total_seconds() * 1000),
+        })
+        self.completed_count += 1
+        # Re-insert so the dict stays ordered by last completion, then drop the oldest refs
+        self.outputs.pop(task.taskReferenceName, None)
+        self.outputs[task.taskReferenceName] = self._capped(result.get("output"))
+        while len(self.outputs) > self._max_completed:
+            del self.outputs[next(iter(self.outputs))]
+        self.current_task_ref = None
+        self.current_task_type = None
+        self._current_started_at = None
+
+    def finished(self) -> None:
+        """Marks the run as complete."""
+        self.status = "COMPLETED"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable view of the progress so far."""
+        return {
+            "status": self.status,
+            "current_task_ref": self.current_task_ref,
+            "current_task_type": self.current_task_type,
+            "current_task_started_at": (
+                self._current_started_at.isoformat() if self._current_started_at else None
+            ),
+            "completed": list(self.completed),
+            "completed_count": self.completed_count,
+            "outputs": dict(self.outputs),
+        }
@@ -0,0 +1,123 @@
+"""
+task_log.py
+
+Compact, structured task events for workflow, activity and embedded code:
+- One event per task with ref, type, status, duration and payload sizes, never full payloads
+- Workflow events are dropped during replay before anything is measured
+- Payload previews only at DEBUG, with secrets redacted and size capped at ``DSL_LOG_PAYLOAD_BYTES``
+- ``DSL_LOG_SAMPLE_RATE`` samples runs: the choice hashes the workflow ID, so a run is logged
+  all-or-nothing and replays decide the same way. Failures are always logged.
+
+Every event is also attached to the record as ``extra["dsl_event"]`` for JSON log formatters.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import zlib
+from typing import Any, Dict, Optional
+
+from temporalio import activity, workflow
+
+from ..dsl.schema import TaskModel
+from ..metrics import payload_size
+
+PAYLOAD_PREVIEW_BYTES = int(os.getenv("DSL_LOG_PAYLOAD_BYTES", "256"))
+SAMPLE_RATE = float(os.getenv("DSL_LOG_SAMPLE_RATE", "1.0"))
+REDACT_KEYS = tuple(
+    k.strip().lower()
+    for k in os.getenv("DSL_LOG_REDACT_KEYS", "password,secret,token,authorization,api_key,apikey").split(",")
+    if k.strip()
+)
+
+_logger = logging.getLogger("dsl.tasks")
+
+
+def redact(value: Any) -> Any:
+    """Copy of ``value`` with the values of secret-looking keys masked."""
+    if isinstance(value, dict):
+        return {
+            k: "***" if any(s in str(k).lower() for s in REDACT_KEYS) else redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(v) for v in value]
+    return value
+
+
+def preview(value: Any, max_bytes: int = PAYLOAD_PREVIEW_BYTES) -> str:
+    """Redacted JSON of ``value``, cut at ``max_bytes``."""
+    text = json.dumps(redact(value), default=str)
+    if len(text) <= max_bytes:
+        return text
+    return f"{text[:max_bytes]}...(+{len(text) - max_bytes} bytes)"
+
+
+class TaskEventLog:
+    """Emits task events on the workflow/activity logger (module logger elsewhere)."""
+
+    def __init__(self, sample_rate: float = SAMPLE_RATE) -> None:
+        self._sample_rate = sample_rate
+        self._sampled: Optional[bool] = None
+
+    @staticmethod
+    def _target() -> Optional[logging.Logger | logging.LoggerAdapter]:
+        if workflow.in_workflow():
+            return None if workflow.unsafe.is_replaying() else workflow.logger
+        if activity.in_activity():
+            return activity.logger
+        return _logger
+
+    def _is_sampled(self) -> bool:
+        if self._sampled is None:
+            if self._sample_rate >= 1:
+                self._sampled = True
+            elif workflow.in_workflow():
+                key = workflow.info().workflow_id.encode()
+                self._sampled = zlib.crc32(key) / 2**32 < self._sample_rate
+            else:
+                self._sampled = random.random() < self._sample_rate
+        return self._sampled
+
+    def _enabled(self, level: int, always: bool = False) -> Optional[logging.Logger | logging.LoggerAdapter]:
+        """The logger to use if an event at ``level`` would be emitted, else None."""
+        log = self._target()
+        if log is None or not log.isEnabledFor(level) or not (always or self._is_sampled()):
+            return None
+        return log
+
+    def event(self, name: str, level: int = logging.INFO, always: bool = False, **fields: Any) -> None:
+        """Logs ``name k=v ...`` if enabled (and sampled, unless ``always``)."""
+        log = self._enabled(level, always)
+        if log is None:
+            return
+        text = " ".join(f"{k}={v}" for k, v in fields.items() if v is not None)
+        log.log(level, "%s %s", name, text, extra={"dsl_event": {"event": name, **fields}})
+
+    def task_started(self, task: TaskModel) -> None:
+        self.event("task_started", logging.DEBUG, ref=task.taskReferenceName, type=task.type)
+
+    def task_completed(self, task: TaskModel, result: Dict[str, Any], duration_ms: Optional[int] = None) -> None:
+        """One line per task; failures at WARNING and never sampled away."""
+        status = result.get("status")
+        failed = status != "COMPLETED"
+        level = logging.WARNING if failed else logging.INFO
+        if self._enabled(level, always=failed) is None:
+            return
+        self.event(
+            "task_completed",
+            level,
+            always=failed,
+            ref=task.taskReferenceName,
+            type=task.type,
+            status=status,
+            duration_ms=duration_ms,
+            input_bytes=payload_size(task.input),
+            output_bytes=payload_size(result.get("output")),
+            reason=result.get("reason"),
+        )
+        if self._enabled(logging.DEBUG) is not None:
+            self.event("task_output", logging.DEBUG, ref=task.taskReferenceName, output=preview(result.get("output")))
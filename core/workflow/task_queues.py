@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional
+
+from ..dsl.schema import TaskModel, DSLModel
+
+TASK_QUEUES_ENV = "TEMPORAL_ACTIVITY_TASK_QUEUES"
+
+
+def parse_task_queue_map(raw: Optional[str]) -> Dict[str, str]:
+    """Parses ``"HTTP=dsl-http,SEND_MAIL=dsl-mail"`` into ``{"HTTP": "dsl-http", ...}``."""
+    mapping: Dict[str, str] = {}
+    for item in (raw or "").split(","):
+        if not item.strip():
+            continue
+        task_type, sep, queue = item.partition("=")
+        if not sep or not task_type.strip() or not queue.strip():
+            raise ValueError(f"Invalid {TASK_QUEUES_ENV} entry {item!r}; expected TYPE=queue")
+        mapping[task_type.strip().upper()] = queue.strip()
+    return mapping
+
+
+# Read once at import. Workers that run workflows and workers that run the routed
+# activities must be started with the same mapping.
+ACTIVITY_TASK_QUEUES: Dict[str, str] = parse_task_queue_map(os.getenv(TASK_QUEUES_ENV))
+
+
+class TaskQueueRouter:
+    """Picks the task queue an activity is scheduled on.
+
+    Precedence: the task's ``taskQueue`` > the DSL's ``taskQueues[TYPE]`` >
+    the worker-wide mapping > ``None`` (the workflow's own task queue).
+    """
+    def __init__(self, task_queues: Optional[Dict[str, str]] = None) -> None:
+        """Initializes with a TYPE -> queue mapping (defaults to ACTIVITY_TASK_QUEUES)."""
+        source = ACTIVITY_TASK_QUEUES if task_queues is None else task_queues
+        self._task_queues = {k.upper(): v for k, v in source.items()}
+
+    def resolve(self, task: TaskModel, dsl: DSLModel) -> Optional[str]:
+        """Returns the task queue for the task, or None for the workflow's queue."""
+        if task.taskQueue:
+            return task.taskQueue
+        task_type = (task.type or "").upper()
+        dsl_queues = {k.upper(): v for k, v in (dsl.taskQueues or {}).items()}
+        return dsl_queues.get(task_type) or self._task_queues.get(task_type)
@@ -1,26 +1,57 @@
 from __future__ import annotations
 
+import logging
+import time
 from typing import List, Dict, Optional
 
 from temporalio import workflow
+from temporalio.common import MetricHistogramFloat
 
 from ..dsl.schema import TaskModel, DSLModel
 from .context_updater import ContextUpdater
 from .executor_registry import ExecutorRegistry
 from .next_task_resolver import NextTaskResolver
 from .dsl_resolver import DSLResolver
+from .progress_tracker import ProgressTracker
+from .task_log import TaskEventLog
+from ..metrics import RESOLVER_LATENCY
+
+
+def _perf_counter() -> float:
+    """Wall-clock reading for metrics only; it never feeds workflow decisions."""
+    with workflow.unsafe.sandbox_unrestricted():
+        return time.perf_counter()
+
 
 class WorkflowOrchestrator:
     """Core engine that runs tasks per the DSL, using injected strategies."""
-    def __init__(self, registry: ExecutorRegistry) -> None:
-        """Initializes with an executor registry."""
+    def __init__(self, registry: ExecutorRegistry, progress: Optional[ProgressTracker] = None) -> None:
+        """Initializes with an executor registry and an optional progress tracker."""
         self._registry = registry
+        self._progress = progress or ProgressTracker()
+        self._resolver_latency: Optional[MetricHistogramFloat] = None
+        self._events = TaskEventLog()
+
+    def _record_resolver_time(self, task: TaskModel, started: float) -> None:
+        """Records resolver time on the workflow meter (skipped during replay and outside workflows)."""
+        if not workflow.in_workflow() or workflow.unsafe.is_replaying():
+            return
+        if self._resolver_latency is None:
+            self._resolver_latency = workflow.metric_meter().create_histogram_float(
+                RESOLVER_LATENCY, "Time to resolve a task's input expressions", "s"
+            )
+        self._resolver_latency.record(_perf_counter() - started, {"task_type": (task.type or "").upper()})
 
 
     async def run(self, tasks: List[TaskModel], dsl: DSLModel) -> None:
-        """Runs the workflow tasks in sequence, applying results and resolving next tasks."""
+        """Runs the workflow tasks in sequence, applying results and resolving next tasks.
+
+        Also runs outside Temporal (see core.embedded_engine) when the registry's executors do.
+        """
+        events = self._events
         if not tasks:
-            workflow.logger.info("No tasks in DSL.")
+            events.event("run_empty", dsl=dsl.name)
+            self._progress.finished()
             return
 
         task_map: Dict[str, TaskModel] = {t.taskReferenceName: t for t in tasks}
@@ -28,28 +59,33 @@ class WorkflowOrchestrator:
 
         while current:
             resolver = DSLResolver(dsl.model_dump())
-            workflow.logger.info("Resolving Task Input task '%s' and task_map '%s'", current.taskReferenceName, task_map)
-
+            started = _perf_counter()
             current.input = resolver.resolve(current,task_map)
+            self._record_resolver_time(current, started)
             executor = self._registry.get(current.type)
             if not executor:
-                workflow.logger.error("No executor for task type '%s'. Ending.", current.type)
+                events.event("no_executor", logging.ERROR, always=True, ref=current.taskReferenceName, type=current.type)
                 break
-            workflow.logger.info("Executing task '%s' of type '%s'", current.taskReferenceName, current.type)
+            events.task_started(current)
 
+            self._progress.task_started(current)
             result = await executor.execute(current, dsl)
-            workflow.logger.info("RESULT: %s", result)
 
             # Apply result
             ContextUpdater.apply(current, result)
+            self._progress.task_completed(current, result)
+            events.task_completed(current, result, self._progress.completed[-1]["duration_ms"])
 
             # Decide next
             next_ref = NextTaskResolver.resolve(current, result)
             if next_ref:
                 current = task_map.get(next_ref)
                 if not current:
-                    workflow.logger.info("Next task '%s' not found. Ending.", next_ref)
+                    events.event("next_task_missing", logging.WARNING, always=True, next_ref=next_ref)
                     break
             else:
                 idx = tasks.index(current)
                 current = tasks[idx + 1] if idx + 1 < len(tasks) else None
+
+        self._progress.finished()
+        events.event("run_finished", dsl=dsl.name, tasks=self._progress.completed_count)
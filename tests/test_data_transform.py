@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from core.dsl.tasks.data_transform.data_transform_task import DataTransformTaskInput, run_pipeline
+from core.dsl.tasks.decision.expression import compile_expression
+
+
+def pipeline(*steps):
+    return DataTransformTaskInput(task_ref_name="t", records=[], pipeline=list(steps)).pipeline
+
+
+def make_records(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "order_id": i,
+            "sku": f"SKU-{rng.randint(0, 20):02d}",
+            "qty": rng.randint(1, 50),
+            "price": round(rng.uniform(1, 500), 2),
+            "status": rng.choice(["NEW", "PAID", "CANCELLED"]),
+        }
+        for i in range(n)
+    ]
+
+
+def test_pipeline_matches_row_by_row():
+    records = make_records(2000)
+    steps = pipeline(
+        {"op": "filter", "field": "qty", "condition": "> 2 AND <= 40"},
+        {"op": "filter", "field": "status", "condition": "NOT 'CANCELLED'"},
+        {"op": "group_by", "keys": ["sku"], "aggregations": {
+            "total_qty": {"func": "sum", "field": "qty"},
+            "lines": {"func": "count"},
+            "min_price": {"func": "min", "field": "price"},
+            "max_price": {"func": "max", "field": "price"},
+        }},
+        {"op": "sort", "by": ["total_qty"], "descending": True},
+    )
+    qty_ok, status_ok = compile_expression("> 2 AND <= 40"), compile_expression("NOT 'CANCELLED'")
+    groups = {}
+    for r in records:
+        if qty_ok(r["qty"]) and status_ok(r["status"]):
+            g = groups.setdefault(r["sku"], {"sku": r["sku"], "total_qty": 0, "lines": 0,
+                                             "min_price": r["price"], "max_price": r["price"]})
+            g["total_qty"] += r["qty"]
+            g["lines"] += 1
+            g["min_price"] = min(g["min_price"], r["price"])
+            g["max_price"] = max(g["max_price"], r["price"])
+    expected = sorted(groups.values(), key=lambda g: g["total_qty"], reverse=True)
+    assert run_pipeline(records, steps) == expected
+
+
+AGGREGATE = pipeline({"op": "group_by", "keys": ["k"], "aggregations": {
+    "total": {"func": "sum", "field": "v"},
+    "low": {"func": "min", "field": "v"},
+    "high": {"func": "max", "field": "v"},
+    "n": {"func": "count", "field": "v"},
+}})
+
+
+@pytest.mark.parametrize("records, expected", [
+    (
+        [{"k": "a", "v": 2**53 + 1}, {"k": "a", "v": None}],
+        [{"k": "a", "total": 2**53 + 1, "low": 2**53 + 1, "high": 2**53 + 1, "n": 1}],
+    ),
+    (
+        [{"k": "a", "v": 2**62}, {"k": "a", "v": 2**62}, {"k": "b", "v": -5}],
+        [{"k": "a", "total": 2**63, "low": 2**62, "high": 2**62, "n": 2},
+         {"k": "b", "total": -5, "low": -5, "high": -5, "n": 1}],
+    ),
+    (
+        [{"k": "a", "v": None}, {"k": "b", "v": 2}, {"k": "b", "v": None}],
+        [{"k": "a", "total": None, "low": None, "high": None, "n": 0},
+         {"k": "b", "total": 2, "low": 2, "high": 2, "n": 1}],
+    ),
+    (
+        [{"k": "a", "v": 1.5}, {"k": "b", "v": None}],
+        [{"k": "a", "total": 1.5, "low": 1.5, "high": 1.5, "n": 1},
+         {"k": "b", "total": None, "low": None, "high": None, "n": 0}],
+    ),
+])
+def test_group_by_keeps_exact_integers_and_null_groups(records, expected):
+    result = run_pipeline(records, AGGREGATE)
+    assert result == expected
+    assert [[type(v) for v in r.values()] for r in result] == [[type(v) for v in r.values()] for r in expected]
+
+
+def test_sort_keeps_nulls_last_in_both_directions():
+    records = [{"v": 2}, {"v": None}, {"v": 1}, {"v": 3}]
+    for descending, expected in ((False, [1, 2, 3, None]), (True, [3, 2, 1, None])):
+        steps = pipeline({"op": "sort", "by": ["v"], "descending": descending})
+        assert [r["v"] for r in run_pipeline(records, steps)] == expected
+
+
+def test_project_renames_and_drops_fields():
+    steps = pipeline({"op": "project", "fields": ["a", "b"], "rename": {"b": "beta"}})
+    assert run_pipeline([{"a": 1, "b": "x", "c": True}], steps) == [{"a": 1, "beta": "x"}]
+
+
+def test_aggregating_a_text_field_fails():
+    steps = pipeline({"op": "group_by", "aggregations": {"s": {"func": "sum", "field": "name"}}})
+    with pytest.raises(ValueError, match="numeric field"):
+        run_pipeline([{"name": "x"}], steps)
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from core.dsl.tasks.decision.decision_table import DecisionTable
+from core.dsl.tasks.decision.decision_task_handler import DecisionTaskHandler
+from core.dsl.tasks.decision.expression import coerce_value, compile_expression, parse_expression
+
+CASES = [
+    "EXPRESS",
+    "'STANDARD'",
+    "== 42",
+    "05",
+    "> 1000",
+    ">= 500 AND < 1000",
+    "> 100 AND <= 500",
+    "> 50 AND < 100 OR == 7",
+    "NOT (> 3 AND < 7)",
+    "!= 'N/A'",
+    "< 0",
+]
+
+VALUES = [
+    "EXPRESS", "STANDARD", "N/A", "other", 42, "05", 5, 7, 3, 4.5, 6, 50, 50.5, 99, 100,
+    100.0, 101, 500, 999.99, 1000, 1001, -1, 0, "1e3", "", None,
+]
+
+
+def first_match(cases, value):
+    return next((i for i, case in enumerate(cases) if compile_expression(case)(value)), None)
+
+
+@pytest.mark.parametrize("expr", ["> 5 AND", "(> 1", "AND < 3", ""])
+def test_invalid_expressions_raise(expr):
+    with pytest.raises(ValueError):
+        parse_expression(expr)
+
+
+@pytest.mark.parametrize("expr, value, expected", [
+    ("EXPRESS", "EXPRESS", True),
+    ("EXPRESS", "STANDARD", False),
+    ("> 50 AND < 100", 75, True),
+    ("> 50 AND < 100", 100, False),
+    (">= 100 OR == 200", 200, True),
+    ("NOT (> 3 AND < 7)", 5, False),
+    ("NOT (> 3 AND < 7)", 7, True),
+    ("!= 'N/A'", "N/A", False),
+    ("!= 'N/A'", "OK", True),
+])
+def test_compiled_expressions(expr, value, expected):
+    assert compile_expression(expr)(value) is expected
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_table_lookup_matches_linear_first_match(value):
+    value = coerce_value(value)
+    assert DecisionTable(tuple(CASES)).lookup(value) == first_match(CASES, value)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_table_lookup_keeps_case_order(value):
+    # The linear-only case now comes first and must win over later indexed hits
+    cases = ["NOT (> 3 AND < 7)"] + [c for c in CASES if c != "NOT (> 3 AND < 7)"]
+    value = coerce_value(value)
+    assert DecisionTable(tuple(cases)).lookup(value) == first_match(cases, value)
+
+
+def test_indexable_cases_skip_the_linear_path():
+    table = DecisionTable(tuple(CASES))
+    assert table.indexed_count == len(CASES) - 2
+
+
+@pytest.mark.parametrize("value", [7, 75, 250, 750, 5000, -3, "EXPRESS", "nothing"])
+def test_handler_modes_agree(value):
+    handler = DecisionTaskHandler()
+    cases = {case: [f"task_{i}"] for i, case in enumerate(CASES[:-2])}
+    outputs = []
+    for mode in ("linear", "table"):
+        data = handler.validate({
+            "task_ref_name": "route",
+            "param_value": value,
+            "decision_cases": cases,
+            "default_case": ["fallback"],
+            "mode": mode,
+        })
+        outputs.append(asyncio.run(handler.execute(data)).output)
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,105 @@
+import pytest
+
+from core.dsl.schema import DSLModel, TaskModel
+from core.worker import WorkerConfig
+from core.workflow import task_queues
+from core.workflow.task_queues import TaskQueueRouter, parse_task_queue_map
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv("TEMPORAL_WORKER_CONFIG", raising=False)
+    for env_var, _, _ in WorkerConfig.SETTINGS.values():
+        monkeypatch.delenv(env_var, raising=False)
+
+
+@pytest.fixture
+def yaml_config(tmp_path):
+    path = tmp_path / "worker.yaml"
+    path.write_text("worker:\n  task_queue: from-yaml\n  max_concurrent_activities: 20\n  role: workflows\n")
+    return str(path)
+
+
+def test_defaults():
+    config = WorkerConfig()
+    assert config.task_queue == "dsl-task-queue"
+    assert config.max_concurrent_activities == 100
+    assert config.role == "all"
+    assert config.activity_types is None
+
+
+def test_yaml_overrides_defaults(yaml_config):
+    config = WorkerConfig(yaml_config)
+    assert (config.task_queue, config.max_concurrent_activities, config.role) == ("from-yaml", 20, "workflows")
+
+
+def test_env_overrides_yaml_and_is_cast(yaml_config, monkeypatch):
+    monkeypatch.setenv("TEMPORAL_MAX_ACTIVITIES", "7")
+    monkeypatch.setenv("TEMPORAL_WORKER_ACTIVITY_TYPES", "http, send_mail")
+    config = WorkerConfig(yaml_config)
+    assert config.task_queue == "from-yaml"
+    assert config.max_concurrent_activities == 7
+    assert config.activity_types == ["HTTP", "SEND_MAIL"]
+
+
+def test_empty_env_value_is_ignored(yaml_config, monkeypatch):
+    monkeypatch.setenv("TEMPORAL_TASK_QUEUE", "")
+    assert WorkerConfig(yaml_config).task_queue == "from-yaml"
+
+
+def test_overrides_win_over_env(yaml_config, monkeypatch):
+    monkeypatch.setenv("TEMPORAL_WORKER_ROLE", "activities")
+    monkeypatch.setenv("TEMPORAL_WORKER_CONFIG", yaml_config)
+    config = WorkerConfig(overrides={"role": "all"})
+    assert config.task_queue == "from-yaml"
+    assert config.role == "all"
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"nope": 1}, "Unknown worker settings"),
+    ({"role": "everything"}, "role must be one of"),
+    ({"tuner_mode": "magic"}, "tuner_mode must be one of"),
+    ({"processes": 0}, "processes must be >= 1"),
+    ({"target_cpu": 1.5}, "target_cpu must be in"),
+])
+def test_invalid_settings(overrides, message):
+    with pytest.raises(ValueError, match=message):
+        WorkerConfig(overrides=overrides)
+
+
+def test_roles_pick_workflows_and_activities():
+    workflows = WorkerConfig(overrides={"role": "workflows"})
+    assert workflows.runs_workflows and not workflows.runs_activity("HTTP")
+
+    http_only = WorkerConfig(overrides={"role": "activities", "activity_types": "http"})
+    assert not http_only.runs_workflows
+    assert http_only.runs_activity("HTTP") and http_only.runs_activity("http")
+    assert not http_only.runs_activity("SEND_MAIL")
+
+    everything = WorkerConfig()
+    assert everything.runs_workflows and everything.runs_activity("SEND_MAIL")
+
+
+def test_activity_task_queue_uses_worker_mapping(monkeypatch):
+    monkeypatch.setattr(task_queues, "ACTIVITY_TASK_QUEUES", {"HTTP": "dsl-http"})
+    monkeypatch.setattr("core.worker.ACTIVITY_TASK_QUEUES", {"HTTP": "dsl-http"})
+    config = WorkerConfig()
+    assert config.activity_task_queue("http") == "dsl-http"
+    assert config.activity_task_queue("SEND_MAIL") == "dsl-task-queue"
+
+
+def test_parse_task_queue_map():
+    assert parse_task_queue_map(" http=dsl-http, SEND_MAIL = dsl-mail ,") == {"HTTP": "dsl-http", "SEND_MAIL": "dsl-mail"}
+    with pytest.raises(ValueError, match="expected TYPE=queue"):
+        parse_task_queue_map("HTTP")
+
+
+def test_router_precedence():
+    router = TaskQueueRouter({"HTTP": "worker-http"})
+    dsl = DSLModel(name="d", tasks=[], taskQueues={"http": "dsl-http"})
+    task = TaskModel(name="t", taskReferenceName="t", type="HTTP")
+    assert router.resolve(task, DSLModel(name="d", tasks=[])) == "worker-http"
+    assert router.resolve(task, dsl) == "dsl-http"
+    pinned = TaskModel(name="t", taskReferenceName="t", type="HTTP", taskQueue="task-http")
+    assert router.resolve(pinned, dsl) == "task-http"
+    assert router.resolve(TaskModel(name="t", taskReferenceName="t", type="DECISION"), dsl) is None
@@ -1,37 +1,126 @@
-import asyncio
-import logging
-from workflow import DSLWorkflow
-from core.dsl import task_registry
-from core.workflow.make_activity import make_activity
+import time
 
-from core.worker import TemporalWorker
+# Taken before the heavier imports below so the logged startup time covers them
+_PROCESS_STARTED = time.perf_counter()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import logging  # noqa: E402
+from collections import defaultdict  # noqa: E402
+from typing import Any, Dict, List, Optional  # noqa: E402
+
+from temporalio.client import Client  # noqa: E402
+
+from workflow import DSLWorkflow  # noqa: E402
+from core.dsl import task_registry  # noqa: E402
+from core.workflow.make_activity import make_activity  # noqa: E402
+
+from core.supervisor import WorkerSupervisor  # noqa: E402
+from core.worker import TemporalWorker, WorkerConfig  # noqa: E402
 
 
 logger = logging.getLogger("dsl_worker")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-activities = [
-    make_activity(task_type, handler_cls)
-    for task_type, handler_cls in task_registry.task_registry.items()
-]
 
 
-async def main():
-    """
-    Entrypoint for running the DSL Temporal Worker
-    with enterprise-grade features (health, observability, config).
+def build_worker(config: WorkerConfig, client: Optional[Client] = None, handle_signals: bool = True) -> TemporalWorker:
+    """Builds the worker for ``config.role``: handlers and activities only for the selected task types.
+
+    Handler modules are imported here, and only for those types (see core.dsl.task_registry).
+    Pass the caller's ``client`` to co-locate the worker with a starter (eager workflow start).
     """
-    worker = TemporalWorker(
-        workflows=[DSLWorkflow],
-        activities=activities,
+    loading = time.perf_counter()
+    # One long-lived handler instance per task type, shared by all activity executions
+    handlers = {
+        task_type: task_registry.task_registry[task_type]()
+        for task_type in task_registry.task_registry
+        if config.runs_activity(task_type)
+    }
+    logger.info(
+        "Loaded %s task handlers in %.2fs (%.2fs after process start): %s",
+        len(handlers),
+        time.perf_counter() - loading,
+        loading - _PROCESS_STARTED,
+        ", ".join(handlers) or "none",
+    )
+    bulkheads = {}
+    slow_activities = config.slow_activity_recorder()
+    activity_queues: Dict[str, List] = defaultdict(list)
+    for task_type, handler in handlers.items():
+        bulkhead = config.bulkhead(task_type)
+        if bulkhead:
+            bulkheads[bulkhead.name] = bulkhead
+        activity_queues[config.activity_task_queue(task_type)].append(make_activity(task_type, handler, bulkhead, slow_activities))
+
+    return TemporalWorker(
+        workflows=[DSLWorkflow] if config.runs_workflows else [],
+        activity_queues=activity_queues,
+        config=config,
+        handlers=list(handlers.values()),
+        bulkheads=bulkheads,
+        slow_activities=slow_activities,
+        started_at=_PROCESS_STARTED,
+        client=client,
+        handle_signals=handle_signals,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the DSL Temporal worker.")
+    parser.add_argument("--config", help="worker YAML (defaults to TEMPORAL_WORKER_CONFIG)")
+    parser.add_argument("--role", choices=WorkerConfig.ROLES, help="overrides TEMPORAL_WORKER_ROLE")
+    parser.add_argument(
+        "--activity-types",
+        help="comma-separated task types for the activities role (overrides TEMPORAL_WORKER_ACTIVITY_TYPES)",
     )
+    parser.add_argument(
+        "--processes", type=int, help="run a supervisor with this many worker processes (overrides TEMPORAL_WORKER_PROCESSES)"
+    )
+    return parser.parse_args()
+
 
-    logger.info("🚀 DSL Worker starting with %s activities", len(activities))
+async def run_worker(config: WorkerConfig):
+    """Runs one DSL worker process until it is shut down."""
+    worker = build_worker(config)
+
+    logger.info(
+        "🚀 DSL Worker starting with %s activities",
+        sum(len(activities) for activities in worker.activity_queues.values()),
+    )
 
     try:
         await worker.start()
     except Exception as e:
         logger.exception("Worker crashed: %s", e)
         await worker.shutdown()
+        # Non-zero exit so the supervisor (or the container runtime) restarts us
+        raise
+
+
+def run_worker_process(config_path: Optional[str], overrides: Dict[str, Any]):
+    """Child-process entrypoint used by the supervisor."""
+    asyncio.run(run_worker(WorkerConfig(path=config_path, overrides=overrides)))
+
+
+async def main():
+    """
+    Entrypoint for running the DSL Temporal Worker
+    with enterprise-grade features (health, observability, config).
+    """
+    args = parse_args()
+    overrides: Dict[str, Any] = {}
+    if args.role:
+        overrides["role"] = args.role
+    if args.activity_types:
+        overrides["activity_types"] = args.activity_types
+    if args.processes:
+        overrides["processes"] = args.processes
+    config = WorkerConfig(path=args.config, overrides=overrides)
+
+    if config.processes > 1:
+        await WorkerSupervisor(run_worker_process, config, args.config, overrides).run()
+    else:
+        await run_worker(config)
 
 
 if __name__ == "__main__":
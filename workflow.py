@@ -4,16 +4,17 @@ DSL-driven Temporal Workflow, decomposed into small SOLID classes.
 - WorkflowOrchestrator: controls the run loop
 - TaskExecutor Protocol + ExecutorRegistry: open/closed for task types
 - ActivityTaskExecutor: default activity-backed executor
-- ApprovalTaskExecutor: signal-based executor (APPROVAL)
+- ApprovalTaskExecutor: signal/update-based executor (APPROVAL), keyed by task ref
 - NextTaskResolver: isolates next-task selection
 - PayloadBuilder: isolates payload normalization
 - ContextUpdater: isolates context/status/output updates
-- ApprovalSignalState: DI carrier for approval results & wait
+- ProgressTracker: incremental run progress served by the `progress` query
+- ApprovalSignalState: DI carrier for per-task approval results & wait
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from temporalio import workflow
 from core.dsl.dsl_parser import DSLParser
@@ -22,6 +23,7 @@ from core.workflow.activity_task_executer import ActivityTaskExecutor
 from core.workflow.human_in_loop_signal_state import HumanInLoopSignalState
 from core.workflow.human_in_loop_task_executor import HumanInLoopTaskExecutor
 from core.workflow.executor_registry import ExecutorRegistry
+from core.workflow.progress_tracker import ProgressTracker
 from core.workflow.workflow_orchestrator import WorkflowOrchestrator
 
 @workflow.defn
@@ -33,12 +35,38 @@ class DSLWorkflow:
         default_exec = ActivityTaskExecutor()
         self._registry = ExecutorRegistry(default_executor=default_exec)
         self._registry.register("APPROVAL", HumanInLoopTaskExecutor(self._human_in_loop_signal))
-        self._orchestrator = WorkflowOrchestrator(registry=self._registry)
+        self._progress = ProgressTracker()
+        self._orchestrator = WorkflowOrchestrator(registry=self._registry, progress=self._progress)
 
     @workflow.signal
-    async def human_in_loop_signal(self, result: str) -> None:
-        """Signal: set an approval decision for a pending APPROVAL task."""
-        self._human_in_loop_signal.result = result
+    async def human_in_loop_signal(self, result: str, task_ref_name: Optional[str] = None) -> None:
+        """Signal: set an approval decision for a pending APPROVAL task.
+
+        Without ``task_ref_name`` the decision goes to the oldest pending approval.
+        Signals cannot be rejected, so invalid decisions are logged and dropped.
+        """
+        try:
+            self._human_in_loop_signal.validate(result, task_ref_name, allow_unassigned=True)
+        except ValueError as e:
+            workflow.logger.warning("[APPROVAL] Ignoring decision signal: %s", e)
+            return
+        self._human_in_loop_signal.set(result, task_ref_name)
+
+    @workflow.update
+    async def human_in_loop_update(self, result: str, task_ref_name: Optional[str] = None) -> Dict[str, Any]:
+        """Update: apply an approval decision and confirm which task received it."""
+        applied_to = self._human_in_loop_signal.set(result, task_ref_name)
+        return {"task_ref_name": applied_to, "decision": result}
+
+    @human_in_loop_update.validator
+    def validate_human_in_loop_update(self, result: str, task_ref_name: Optional[str] = None) -> None:
+        """Rejects unknown decisions and decisions for tasks that are not pending."""
+        self._human_in_loop_signal.validate(result, task_ref_name)
+
+    @workflow.query
+    def progress(self) -> Dict[str, Any]:
+        """Query: current task, completed tasks with timing, size-capped outputs and pending approvals."""
+        return {**self._progress.snapshot(), "pending_approvals": list(self._human_in_loop_signal.pending)}
 
     @workflow.run
     async def run(self, data: Dict[str, Any]) -> str: